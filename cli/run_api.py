@@ -3,6 +3,7 @@
 Script to run the FastAPI application.
 """
 
+import os
 import sys
 import logging
 from pathlib import Path
@@ -45,13 +46,17 @@ from src.api.main import app
 if __name__ == "__main__":
     import uvicorn
     
-    logger.info(f"Starting API server on {config.api.host}:{config.api.port}")
+    # WEB_CONCURRENCY is the conventional override used by process managers
+    # and PaaS platforms; it takes precedence over API_WORKERS
+    workers = 1 if config.api.reload else int(os.environ.get("WEB_CONCURRENCY", config.api.workers))
+    
+    logger.info(f"Starting API server on {config.api.host}:{config.api.port} with {workers} worker(s)")
     
     uvicorn.run(
         "src.api.main:app",
         host=config.api.host,
         port=config.api.port,
         reload=config.api.reload,
-        workers=1 if config.api.reload else config.api.workers,
+        workers=workers,
         log_level=config.monitoring.log_level.lower()
     )
@@ -0,0 +1,7 @@
+-- Migration: Keyset pagination index for scan_profiles
+-- Description: Support cursor-based listing ordered by (created_at, profile_id)
+
+-- Lets list queries seek straight to the cursor instead of scanning
+-- and discarding OFFSET rows
+CREATE INDEX IF NOT EXISTS idx_scan_profiles_created_at_profile_id
+ON scan_profiles(created_at DESC, profile_id DESC);
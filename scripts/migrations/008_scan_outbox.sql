@@ -0,0 +1,14 @@
+-- Migration: Scan outbox
+-- Description: Transactional outbox for queueing scans on the Celery workers
+
+-- A scan and its outbox row are inserted in one transaction; the API's
+-- outbox dispatcher publishes pending rows to Celery and deletes them, so
+-- a broker outage never leaves a scan row without a queued task
+CREATE TABLE IF NOT EXISTS scan_outbox (
+    outbox_id BIGSERIAL PRIMARY KEY,
+    scan_id UUID NOT NULL REFERENCES scan_results(scan_id) ON DELETE CASCADE,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_scan_outbox_scan_id ON scan_outbox(scan_id);
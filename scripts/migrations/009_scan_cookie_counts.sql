@@ -0,0 +1,21 @@
+-- Migration: Materialized cookie counts on scan_results
+-- Description: Store first/third-party cookie counts with the scan instead
+-- of aggregating the cookies table on every read
+
+ALTER TABLE scan_results
+    ADD COLUMN IF NOT EXISTS first_party_cookies INT NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS third_party_cookies INT NOT NULL DEFAULT 0;
+
+-- Backfill existing scans; new scans are written by the scan worker
+UPDATE scan_results sr
+SET first_party_cookies = c.first_party,
+    third_party_cookies = c.third_party
+FROM (
+    SELECT
+        scan_id,
+        COUNT(*) FILTER (WHERE cookie_type = 'First Party') AS first_party,
+        COUNT(*) FILTER (WHERE cookie_type = 'Third Party') AS third_party
+    FROM cookies
+    GROUP BY scan_id
+) c
+WHERE sr.scan_id = c.scan_id;
@@ -0,0 +1,7 @@
+-- Migration: Keyset pagination index for scan_results
+-- Description: Support cursor-based scan listing ordered by (created_at, scan_id)
+
+-- Lets list queries seek straight to the cursor instead of scanning
+-- and discarding OFFSET rows
+CREATE INDEX IF NOT EXISTS idx_scan_results_created_at_scan_id
+ON scan_results(created_at DESC, scan_id DESC);
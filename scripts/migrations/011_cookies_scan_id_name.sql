@@ -0,0 +1,6 @@
+-- Migration: Cookies by scan and name
+-- Description: Index for aggregating a scan's cookies in name order
+
+-- Lets the scan-with-cookies query read a scan's cookies already sorted
+-- by name instead of sorting them per request
+CREATE INDEX IF NOT EXISTS idx_cookies_scan_id_name ON cookies(scan_id, name);
@@ -0,0 +1,18 @@
+-- Migration: Covering index for scan listings
+-- Description: Serve recent-scan listings with index-only scans
+
+-- Carries every column the listing selects (and the status/domain filter
+-- columns), so a page is read from the index without heap fetches once
+-- the visibility map is current. scan_id breaks timestamp ties for
+-- keyset pagination
+CREATE INDEX IF NOT EXISTS idx_scan_results_listing
+ON scan_results(timestamp_utc DESC, scan_id DESC)
+INCLUDE (domain_config_id, domain, scan_mode, status,
+         duration_seconds, total_cookies, page_count, created_at);
+
+-- Listings of successful scans, the common dashboard filter
+CREATE INDEX IF NOT EXISTS idx_scan_results_listing_success
+ON scan_results(timestamp_utc DESC, scan_id DESC)
+INCLUDE (domain_config_id, domain, scan_mode,
+         duration_seconds, total_cookies, page_count, created_at)
+WHERE status = 'success';
@@ -0,0 +1,46 @@
+-- Migration: Per-scan cookie statistics
+-- Description: Summary table of cookie statistics written at scan completion
+
+-- A finished scan's cookies never change, so their statistics are
+-- aggregated once by ScanService when the cookies are stored and read
+-- back with a primary-key lookup
+CREATE TABLE IF NOT EXISTS scan_cookie_stats (
+    scan_id UUID PRIMARY KEY REFERENCES scan_results(scan_id) ON DELETE CASCADE,
+    total_cookies INTEGER NOT NULL DEFAULT 0,
+    unique_cookies INTEGER NOT NULL DEFAULT 0,
+    first_party INTEGER NOT NULL DEFAULT 0,
+    third_party INTEGER NOT NULL DEFAULT 0,
+    necessary INTEGER NOT NULL DEFAULT 0,
+    functional INTEGER NOT NULL DEFAULT 0,
+    analytics INTEGER NOT NULL DEFAULT 0,
+    advertising INTEGER NOT NULL DEFAULT 0,
+    http_only_count INTEGER NOT NULL DEFAULT 0,
+    secure_count INTEGER NOT NULL DEFAULT 0,
+    unique_vendors INTEGER NOT NULL DEFAULT 0,
+    avg_size NUMERIC,
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+-- Backfill existing scans
+INSERT INTO scan_cookie_stats (
+    scan_id, total_cookies, unique_cookies, first_party, third_party,
+    necessary, functional, analytics, advertising,
+    http_only_count, secure_count, unique_vendors, avg_size
+)
+SELECT
+    scan_id,
+    COUNT(*),
+    COUNT(DISTINCT name),
+    COUNT(*) FILTER (WHERE cookie_type = 'First Party'),
+    COUNT(*) FILTER (WHERE cookie_type = 'Third Party'),
+    COUNT(*) FILTER (WHERE category = 'Necessary'),
+    COUNT(*) FILTER (WHERE category = 'Functional'),
+    COUNT(*) FILTER (WHERE category = 'Analytics'),
+    COUNT(*) FILTER (WHERE category = 'Advertising'),
+    COUNT(*) FILTER (WHERE http_only = TRUE),
+    COUNT(*) FILTER (WHERE secure = TRUE),
+    COUNT(DISTINCT vendor),
+    AVG(size)
+FROM cookies
+GROUP BY scan_id
+ON CONFLICT (scan_id) DO NOTHING;
@@ -0,0 +1,19 @@
+-- Migration: Partial indexes for dashboard listings
+-- Description: Order-matching partial indexes for active scans and failed jobs
+
+-- idx_scan_results_active (003) leads with scan_id, so listing active
+-- scans by timestamp still sorts; this one returns them in order and
+-- carries the selected columns for an index-only scan
+CREATE INDEX IF NOT EXISTS idx_scan_results_active_recent
+    ON scan_results(timestamp_utc DESC)
+    INCLUDE (scan_id, domain, scan_mode, status)
+    WHERE status IN ('pending', 'running');
+
+-- idx_job_executions_failed (003) leads with domain; failed-job listings
+-- filter and sort on started_at across all domains
+CREATE INDEX IF NOT EXISTS idx_job_executions_failed_recent
+    ON job_executions(started_at DESC)
+    WHERE status = 'failed';
+
+-- Pending notifications and due schedules are already served by
+-- idx_notifications_pending and idx_schedules_next_run_enabled (003)
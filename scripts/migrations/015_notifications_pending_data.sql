@@ -0,0 +1,9 @@
+-- Migration: JSONB containment index for pending notifications
+-- Description: Partial jsonb_path_ops GIN index on pending notification data
+
+-- Serves `data @> ...` filters on the pending queue; jsonb_path_ops only
+-- supports containment but is smaller and faster than the default
+-- opclass used by idx_notifications_data_gin (003)
+CREATE INDEX IF NOT EXISTS idx_notifications_pending_data
+    ON notifications USING GIN (data jsonb_path_ops)
+    WHERE status = 'pending';
@@ -15,6 +15,7 @@ import argparse
 import asyncio
 import json
 import sys
+import time
 from datetime import datetime, timedelta
 from uuid import uuid4
 import requests
@@ -56,15 +57,16 @@ class ThreeTierTester:
             # Test quick scan endpoint
             payload = {
                 "domain": self.test_domain,
+                "scan_type": "quick",
                 "custom_pages": ["/about", "/contact", "/privacy"],
-                "max_concurrent": 5
+                "concurrency": 5
             }
 
             print(f"Testing quick scan for {self.test_domain}...")
             print(f"Request: POST {self.api_url}/api/v1/parallel-scan/scan")
             print(f"Payload: {json.dumps(payload, indent=2)}\n")
 
-            # Note: This will actually try to scan, so we'll just validate the request
+            # The scan runs in the background; poll its status_url for the result
             response = requests.post(
                 f"{self.api_url}/api/v1/parallel-scan/scan",
                 headers=self.headers,
@@ -72,14 +74,28 @@ class ThreeTierTester:
                 timeout=60
             )
 
+            if response.status_code != 202:
+                self.print_result(False, f"HTTP {response.status_code}: {response.text[:200]}")
+                return False
+
+            status_url = response.json()["status_url"]
+            self.print_result(True, f"Quick scan accepted, polling {status_url}")
+
+            deadline = time.monotonic() + 300
+            while True:
+                response = requests.get(f"{self.api_url}{status_url}", headers=self.headers, timeout=30)
+                if response.status_code != 409 or time.monotonic() > deadline:
+                    break
+                time.sleep(2)
+
             if response.status_code == 200:
                 result = response.json()
                 print(f"Response: {json.dumps(result, indent=2)[:500]}...\n")
 
                 self.print_result(True, f"Quick scan completed")
-                self.print_result(True, f"Pages scanned: {result.get('pages_scanned', 'N/A')}")
-                self.print_result(True, f"Cookies found: {result.get('cookies_found', 'N/A')}")
-                self.print_result(True, f"Duration: {result.get('scan_duration', 'N/A')}s")
+                self.print_result(True, f"Pages scanned: {result.get('total_pages_scanned', 'N/A')}")
+                self.print_result(True, f"Cookies found: {result.get('unique_cookies', 'N/A')}")
+                self.print_result(True, f"Duration: {result.get('duration', 'N/A')}s")
                 return True
             else:
                 self.print_result(False, f"HTTP {response.status_code}: {response.text[:200]}")
@@ -9,6 +9,7 @@ from typing import Dict, Any, Optional
 
 import asyncpg
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
@@ -52,6 +53,7 @@ struct_logger = get_struct_logger(__name__)
 # Global references for dependency injection
 _db_pool: Optional[asyncpg.Pool] = None
 _redis_client: Optional[Redis] = None
+_async_redis_client: Optional[AsyncRedis] = None
 
 
 def get_db_pool() -> asyncpg.Pool:
@@ -71,7 +73,7 @@ async def lifespan(app: FastAPI):
     """
     Application lifespan manager for startup and shutdown events.
     """
-    global _db_pool, _redis_client
+    global _db_pool, _redis_client, _async_redis_client
     
     # Startup
     logger.info("Starting Dynamic Cookie Scanning Service API Gateway")
@@ -84,15 +86,29 @@ async def lifespan(app: FastAPI):
         logger.info("Initializing database connection pool...")
         _db_pool = await asyncpg.create_pool(
             dsn=config.database.url,
-            min_size=5,
+            min_size=config.database.pool_min_size,
             max_size=config.database.pool_size + config.database.max_overflow,
+            statement_cache_size=config.database.statement_cache_size,
             command_timeout=60
         )
         app.state.db_pool = _db_pool
         
+        # Stateless services only hold the pool, so share one per app
+        from src.services.profile_service import ProfileService
+        app.state.profile_service = ProfileService(_db_pool)
+        
         # Initialize global database connection for database module
         from src.database.connection import init_db_connection
-        init_db_connection(config.database.url)
+        init_db_connection(
+            config.database.url,
+            min_connections=config.database.sync_pool_min_size,
+            max_connections=config.database.pool_size
+        )
+        
+        # Prepares the optimizer's statements on the sync pool (QO_PREWARM=0 skips)
+        from src.database.connection import get_db_connection
+        from src.database.query_optimizer import init_query_optimizer
+        init_query_optimizer(get_db_connection())
         
         logger.info("Database pool initialized successfully")
     except Exception as e:
@@ -113,28 +129,60 @@ async def lifespan(app: FastAPI):
             _redis_client.ping()
             app.state.redis_client = _redis_client
             
-            # Initialize global Redis client for cache module
-            from src.cache.redis_client import init_redis_client
-            init_redis_client(
-                host=config.redis.url.split('//')[1].split(':')[0],
-                port=int(config.redis.url.split(':')[-1].split('/')[0]),
-                db=0
-            )
+            # Async client for pub/sub listeners (SSE progress streams)
+            _async_redis_client = AsyncRedis.from_url(config.redis.url, decode_responses=True)
+            app.state.async_redis_client = _async_redis_client
             
             logger.info("Redis client initialized successfully")
         else:
             logger.info("Redis not configured, caching disabled")
             app.state.redis_client = None
+            app.state.async_redis_client = None
     except Exception as e:
         logger.warning(f"Failed to initialize Redis client: {e} (continuing without cache)")
         _redis_client = None
         app.state.redis_client = None
+        if _async_redis_client:
+            await _async_redis_client.aclose()
+        _async_redis_client = None
+        app.state.async_redis_client = None
+    
+    # One scan service and parallel manager per app, so the manager's
+    # semaphore caps concurrency across requests rather than per request
+    from src.services.scan_service import ScanService
+    from src.services.parallel_scan_manager import ParallelScanManager
+    app.state.scan_service = ScanService(
+        _db_pool,
+        app.state.redis_client,
+        async_redis_client=app.state.async_redis_client
+    )
+    app.state.parallel_scan_manager = ParallelScanManager(
+        app.state.scan_service,
+        min(config.scan.max_concurrent_scans, 10)
+    )
+    
+    # Publishes scans queued through the outbox table to the workers
+    from src.services.scan_outbox import get_scan_outbox_dispatcher
+    app.state.scan_outbox = get_scan_outbox_dispatcher(_db_pool)
+    app.state.scan_outbox.start()
+    
+    # Scanner pool keeps parallel scanner browsers warm across requests
+    from src.services.scanner_pool import get_scanner_pool
+    app.state.scanner_pool = get_scanner_pool()
     
     yield
     
     # Shutdown
     logger.info("Shutting down Dynamic Cookie Scanning Service API Gateway")
     
+    # Stop publishing queued scans
+    from src.services.scan_outbox import close_scan_outbox_dispatcher
+    await close_scan_outbox_dispatcher()
+    
+    # Stop pooled scanner browsers
+    from src.services.scanner_pool import close_scanner_pool
+    await close_scanner_pool()
+    
     # Close database pool
     if _db_pool:
         logger.info("Closing database pool...")
@@ -146,6 +194,9 @@ async def lifespan(app: FastAPI):
         logger.info("Closing Redis client...")
         _redis_client.close()
         logger.info("Redis client closed")
+    
+    if _async_redis_client:
+        await _async_redis_client.aclose()
 
 
 def create_app() -> FastAPI:
@@ -26,6 +26,11 @@ def get_ml_admin_service(request: Request) -> MLAdminService:
     return MLAdminService(request.app.state.db_pool, request.app.state.redis_client)
 
 
+_CATEGORY_NAMES = ("Necessary", "Functional", "Analytics", "Advertising")
+_ALLOWED_CATEGORIES = frozenset(_CATEGORY_NAMES)
+_CATEGORY_ERROR = f"Category must be one of: {', '.join(_CATEGORY_NAMES)}"
+
+
 # Request/Response models
 class MLMetricsResponse(BaseModel):
     """ML model metrics response."""
@@ -84,9 +89,8 @@ class FeedbackRequest(BaseModel):
     @validator('correct_category')
     def validate_category(cls, v):
         """Validate category is one of the allowed values."""
-        allowed = ["Necessary", "Functional", "Analytics", "Advertising"]
-        if v not in allowed:
-            raise ValueError(f"Category must be one of: {', '.join(allowed)}")
+        if v not in _ALLOWED_CATEGORIES:
+            raise ValueError(_CATEGORY_ERROR)
         return v
 
 
@@ -3,7 +3,7 @@ Notification endpoints for managing user preferences and notification history.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, status, Query
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from pydantic import BaseModel, Field
 from src.models.notification import (
@@ -215,7 +215,7 @@ async def get_notification_history(
     offset: int = Query(default=0, ge=0, description="Offset for pagination"),
     event: Optional[NotificationEvent] = Query(default=None, description="Filter by event type"),
     status: Optional[str] = Query(default=None, description="Filter by status")
-) -> List[NotificationHistoryResponse]:
+) -> List[Dict[str, Any]]:
     """
     Get notification history for the authenticated user.
     
@@ -263,21 +263,22 @@ async def get_notification_history(
         async with db_pool.acquire() as conn:
             rows = await conn.fetch(query, *params)
             
-            notifications = []
-            for row in rows:
-                notifications.append(NotificationHistoryResponse(
-                    notification_id=row['notification_id'],
-                    event=NotificationEvent(row['event']),
-                    channel=NotificationChannel(row['channel']),
-                    status=row['status'],
-                    created_at=row['created_at'].isoformat(),
-                    sent_at=row['sent_at'].isoformat() if row['sent_at'] else None,
-                    retry_count=row['retry_count'],
-                    data=row['data'] or {},
-                    error=row['error']
-                ))
-            
-            return notifications
+            # Plain dicts: the response_model validates each row once on the
+            # way out, so building response models here would validate twice
+            return [
+                {
+                    'notification_id': row['notification_id'],
+                    'event': row['event'],
+                    'channel': row['channel'],
+                    'status': row['status'],
+                    'created_at': row['created_at'].isoformat(),
+                    'sent_at': row['sent_at'].isoformat() if row['sent_at'] else None,
+                    'retry_count': row['retry_count'],
+                    'data': row['data'] or {},
+                    'error': row['error']
+                }
+                for row in rows
+            ]
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -13,24 +13,262 @@ Features:
 """
 
 import asyncio
-import json
+import hashlib
 import logging
-from typing import Optional, List
-from datetime import datetime
-
-from fastapi import APIRouter, HTTPException, status, Depends, BackgroundTasks
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field, validator
+import secrets
+from collections import deque
+from contextlib import suppress
+from typing import Any, Dict, Literal, Optional, List, TypedDict
+from urllib.parse import urlparse
+
+import orjson
+from fastapi import APIRouter, HTTPException, status, Depends, BackgroundTasks, Header, Request, Response
+from pydantic import BaseModel, Field, field_validator, model_validator
+from redis.exceptions import RedisError
+from sse_starlette.sse import EventSourceResponse
 
 from src.api.auth.dependencies import get_current_user, require_scope
 from src.models.user import TokenData
-from src.scanners.parallel_scanner import ParallelCookieScanner, ScanProgress
+from src.scanners.parallel_scanner import ScanProgress
 from src.scanners.enterprise_scanner import EnterpriseCookieScanner, EnterpriseMetrics, enterprise_deep_scan
+from src.services.scanner_pool import get_scanner_pool
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/parallel-scan", tags=["parallel-scan"])
 
+# Seconds between SSE keep-alive pings; keeps proxies from dropping idle
+# streams during long enterprise scans.
+SSE_PING_INTERVAL = 15
+
+
+# Cookies per `cookie_batch` SSE event when streaming final scan results
+COOKIE_BATCH_SIZE = 500
+
+# Seconds between SSE comments sent while a scanner is still starting up
+SCANNER_SETUP_KEEPALIVE = 5
+
+# Progress events buffered per stream; progress and metrics are cumulative,
+# so older frames can be dropped when a slow client falls behind
+PROGRESS_BUFFER_SIZE = 32
+
+
+def _sse_event(payload: Dict[str, Any]) -> Dict[str, str]:
+    """Wrap a payload as an SSE message for EventSourceResponse."""
+    return {"data": orjson.dumps(payload).decode()}
+
+
+class _ProgressEventBuffer:
+    """
+    Bounded buffer of pending progress events for one SSE stream.
+
+    Keeps only the newest PROGRESS_BUFFER_SIZE events so memory stays flat
+    no matter how slowly the client reads. Consumers wait on the buffer
+    instead of polling it.
+    """
+
+    def __init__(self, maxlen: int = PROGRESS_BUFFER_SIZE):
+        self._events: deque = deque(maxlen=maxlen)
+        self._ready = asyncio.Event()
+
+    def put(self, event: Dict[str, str]) -> None:
+        """Add an event, dropping the oldest one when full."""
+        self._events.append(event)
+        self._ready.set()
+
+    def wake(self) -> None:
+        """Wake a waiting consumer without adding an event."""
+        self._ready.set()
+
+    async def wait(self) -> None:
+        """Wait until an event is added or wake() is called."""
+        await self._ready.wait()
+
+    def drain(self) -> List[Dict[str, str]]:
+        """Remove and return all pending events, oldest first."""
+        events = list(self._events)
+        self._events.clear()
+        self._ready.clear()
+        return events
+
+
+async def _keepalive_until_done(task: asyncio.Task):
+    """
+    Yield SSE comments until a setup task finishes.
+
+    Launching browsers can take several seconds; the comments keep the
+    stream active so proxies and clients don't treat it as stalled.
+    """
+    while True:
+        done, _ = await asyncio.wait({task}, timeout=SCANNER_SETUP_KEEPALIVE)
+        if done:
+            return
+        yield {"comment": "warming"}
+
+
+async def _cookie_batch_events(scan_id: str, cookies: List[dict]):
+    """
+    Yield scan cookies as `cookie_batch` SSE events.
+
+    Splitting the cookie list keeps each frame small and yields to the event
+    loop between batches. Clients reassemble the list by `offset`.
+    """
+    for offset in range(0, len(cookies), COOKIE_BATCH_SIZE):
+        yield _sse_event({
+            'type': 'cookie_batch',
+            'scan_id': scan_id,
+            'offset': offset,
+            'items': cookies[offset:offset + COOKIE_BATCH_SIZE]
+        })
+        await asyncio.sleep(0)
+
+
+# Maximum number of custom pages accepted per scan request
+MAX_CUSTOM_PAGES = 5000
+
+# URL schemes accepted for scan domains
+_HTTP_PREFIXES = ('http://', 'https://')
+
+
+def _check_page_url(page: str):
+    """Reject an absolute custom page without a usable host, e.g. 'http://' or 'https:// bad'."""
+    parts = urlparse(page)
+    if parts.scheme.lower() in ('http', 'https') and (
+        not parts.netloc or any(ch.isspace() for ch in page)
+    ):
+        raise ValueError(f"Invalid custom page URL: {page!r}")
+
+
+def _dedupe_pages(pages: Optional[List[str]]) -> Optional[List[str]]:
+    """
+    Strip custom pages and drop blanks and duplicates, preserving order.
+
+    Relative pages are joined to the domain by the scanner; absolute
+    http(s) pages must have a host.
+    """
+    if not pages:
+        return pages
+
+    seen = set()
+    deduped = []
+    for page in pages:
+        page = page.strip()
+        if page and page not in seen:
+            _check_page_url(page)
+            seen.add(page)
+            deduped.append(page)
+    return deduped
+
+
+# Static info payloads, serialized once at import time
+_PARALLEL_INFO = {
+    "version": "1.0",
+    "technology": "Python asyncio + Playwright",
+    "default_concurrency": 5,
+    "max_concurrency": 20,
+    "default_timeout": 30000,
+    "performance": {
+        "sequential_baseline": "3s per page",
+        "parallel_5x": "5x faster (0.6s per page effective)",
+        "parallel_10x": "10x faster (0.3s per page effective)"
+    },
+    "recommended_settings": {
+        "small_sites": {"concurrency": 3, "description": "10-20 pages"},
+        "medium_sites": {"concurrency": 5, "description": "20-100 pages"},
+        "large_sites": {"concurrency": 8, "description": "100-500 pages"},
+        "cdn_backed": {"concurrency": 10, "description": "500+ pages with CDN"}
+    },
+    "scan_types": {
+        "quick": "Scan main page + custom pages only",
+        "deep": "Crawl site and scan up to max_pages",
+        "enterprise": "Enterprise scan with up to 20,000 pages"
+    },
+    "documentation": "See PARALLEL_PROCESSING.md for details"
+}
+
+_ENTERPRISE_INFO = {
+    "version": "1.0-enterprise",
+    "technology": "Browser Pool + Python asyncio",
+    "capabilities": {
+        "max_pages": 20000,
+        "max_browser_pool": 10,
+        "max_pages_per_browser": 50,
+        "max_total_concurrency": 500,
+        "chunk_processing": True,
+        "checkpoint_persistence": True,
+        "resume_capability": True,
+        "adaptive_concurrency": True
+    },
+    "performance": {
+        "sequential_baseline": "3s per page (20,000 pages = 16.7 hours)",
+        "parallel_100x": "100x faster (20,000 pages = 10 minutes)",
+        "parallel_200x": "200x faster (20,000 pages = 5 minutes)",
+        "parallel_500x": "500x faster (20,000 pages = 2 minutes)"
+    },
+    "recommended_configurations": {
+        "small_scale": {
+            "pages": "1-1000",
+            "browser_pool_size": 3,
+            "pages_per_browser": 20,
+            "total_concurrency": 60,
+            "estimated_duration": "0.5-15 minutes"
+        },
+        "medium_scale": {
+            "pages": "1000-5000",
+            "browser_pool_size": 5,
+            "pages_per_browser": 20,
+            "total_concurrency": 100,
+            "estimated_duration": "15-50 minutes"
+        },
+        "large_scale": {
+            "pages": "5000-10000",
+            "browser_pool_size": 8,
+            "pages_per_browser": 30,
+            "total_concurrency": 240,
+            "estimated_duration": "20-40 minutes"
+        },
+        "enterprise_scale": {
+            "pages": "10000-20000",
+            "browser_pool_size": 10,
+            "pages_per_browser": 50,
+            "total_concurrency": 500,
+            "estimated_duration": "5-20 minutes"
+        }
+    },
+    "resource_requirements": {
+        "small_scale": "2-4 GB RAM, 2 CPU cores",
+        "medium_scale": "4-8 GB RAM, 4 CPU cores",
+        "large_scale": "8-16 GB RAM, 8 CPU cores",
+        "enterprise_scale": "16-32 GB RAM, 16 CPU cores"
+    },
+    "features": [
+        "Browser pool management (multiple browser instances)",
+        "Chunked processing (memory efficient)",
+        "Checkpoint persistence (resume from failures)",
+        "Adaptive concurrency (auto-adjusts performance)",
+        "Rate limiting protection",
+        "Real-time progress streaming",
+        "Resource monitoring",
+        "Error resilience and retry logic"
+    ],
+    "documentation": "See ENTERPRISE_SCANNING.md for details"
+}
+
+_PARALLEL_INFO_BYTES = orjson.dumps(_PARALLEL_INFO)
+_PARALLEL_INFO_ETAG = f'"{hashlib.md5(_PARALLEL_INFO_BYTES).hexdigest()}"'
+_ENTERPRISE_INFO_BYTES = orjson.dumps(_ENTERPRISE_INFO)
+_ENTERPRISE_INFO_ETAG = f'"{hashlib.md5(_ENTERPRISE_INFO_BYTES).hexdigest()}"'
+
+INFO_CACHE_CONTROL = "public, max-age=3600"
+
+
+def _cached_json_response(body: bytes, etag: str, if_none_match: Optional[str]) -> Response:
+    """Return a pre-serialized JSON body, or 304 if the client's ETag matches."""
+    headers = {"Cache-Control": INFO_CACHE_CONTROL, "ETag": etag}
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 # Request/Response Models
 
@@ -38,23 +276,23 @@ class ParallelScanRequest(BaseModel):
     """Request model for parallel page scanning."""
 
     domain: str = Field(..., description="Domain to scan (must include https://)")
-    scan_type: str = Field("quick", description="Scan type: 'quick' or 'deep'")
+    scan_type: Literal["quick", "deep"] = Field("quick", description="Scan type: 'quick' or 'deep'")
     max_pages: Optional[int] = Field(50, description="Maximum pages for deep scan (1-2000)", ge=1, le=2000)
     concurrency: Optional[int] = Field(5, description="Concurrent page scans (1-20)", ge=1, le=20)
-    custom_pages: Optional[List[str]] = Field(None, description="Custom pages to scan (relative URLs)")
+    custom_pages: Optional[List[str]] = Field(None, description="Custom pages to scan (relative URLs)", max_length=MAX_CUSTOM_PAGES)
     timeout: Optional[int] = Field(30000, description="Page timeout in milliseconds", ge=5000, le=120000)
 
-    @validator('domain')
-    def validate_domain(cls, v):
-        if not v.startswith(('http://', 'https://')):
+    @field_validator('domain')
+    @classmethod
+    def validate_domain(cls, v: str) -> str:
+        if not v.startswith(_HTTP_PREFIXES):
             raise ValueError('Domain must include protocol (http:// or https://)')
         return v
 
-    @validator('scan_type')
-    def validate_scan_type(cls, v):
-        if v not in ['quick', 'deep']:
-            raise ValueError('scan_type must be "quick" or "deep"')
-        return v
+    @field_validator('custom_pages')
+    @classmethod
+    def dedupe_custom_pages(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        return _dedupe_pages(v)
 
     class Config:
         schema_extra = {
@@ -100,9 +338,18 @@ class ParallelScanResponse(BaseModel):
         }
 
 
-class ProgressUpdate(BaseModel):
-    """Progress update model for streaming."""
+class ParallelScanAcceptedResponse(BaseModel):
+    """Response model for an accepted background parallel scan."""
+
+    scan_id: str
+    status: str
+    status_url: str
 
+
+class ProgressUpdate(TypedDict):
+    """Shape of `progress` SSE events (built as plain dicts, not validated)."""
+
+    type: str
     total_pages: int
     scanned_pages: int
     current_batch: int
@@ -113,43 +360,45 @@ class ProgressUpdate(BaseModel):
     percentage: float
 
 
-# Endpoints
+def _progress_payload(progress: ScanProgress) -> ProgressUpdate:
+    """Build a `progress` SSE payload from scanner progress."""
+    percentage = (progress.scanned_pages / progress.total_pages * 100) if progress.total_pages > 0 else 0
+    return {
+        'type': 'progress',
+        'total_pages': progress.total_pages,
+        'scanned_pages': progress.scanned_pages,
+        'current_batch': progress.current_batch,
+        'total_batches': progress.total_batches,
+        'cookies_found': progress.cookies_found,
+        'elapsed_time': progress.elapsed_time,
+        'estimated_remaining': progress.estimated_remaining,
+        'percentage': round(percentage, 1)
+    }
 
-@router.post(
-    "/scan",
-    response_model=ParallelScanResponse,
-    status_code=status.HTTP_200_OK,
-    summary="Start parallel page scan",
-    description="Scan a domain with parallel page execution for 5-10x performance improvement"
-)
-async def create_parallel_scan(
-    request: ParallelScanRequest,
-    current_user: TokenData = Depends(get_current_user)
-):
-    """
-    Start a parallel page scan.
 
-    - **domain**: Full URL with protocol
-    - **scan_type**: "quick" (specific pages) or "deep" (crawl site)
-    - **max_pages**: Maximum pages to scan (deep scan only)
-    - **concurrency**: Parallel execution level (1-20)
-    - **custom_pages**: Specific pages for quick scan
-    - **timeout**: Page load timeout in ms
+# Background scan entries live in Redis so any API worker can answer the
+# result poll. Entries hold a "status" of running/completed/failed plus the
+# result or error message. A running entry outlives any scan; if its worker
+# dies mid-scan the entry still expires.
+PARALLEL_SCAN_RUNNING_TTL = 6 * 3600  # seconds
+PARALLEL_SCAN_RESULT_TTL = 3600  # seconds
 
-    **Performance**:
-    - Sequential: 50 pages = 150s
-    - Parallel (5x): 50 pages = 30s (5x faster)
-    - Parallel (10x): 50 pages = 15s (10x faster)
-    """
-    scan_id = f"scan_{int(datetime.now().timestamp())}"
 
-    logger.info(
-        f"[PARALLEL_SCAN] Starting {request.scan_type} scan for {request.domain} "
-        f"(concurrency={request.concurrency}, user={current_user.username})"
-    )
+def _scan_result_key(scan_id: str) -> str:
+    """Redis key for a background parallel scan entry."""
+    return f"parallel_scan:result:{scan_id}"
+
 
+async def _store_scan_result(redis_client, scan_id: str, entry: Dict[str, Any]) -> None:
+    """Store a background scan entry with a TTL based on its status."""
+    ttl = PARALLEL_SCAN_RUNNING_TTL if entry["status"] == "running" else PARALLEL_SCAN_RESULT_TTL
+    await redis_client.set(_scan_result_key(scan_id), orjson.dumps(entry), ex=ttl)
+
+
+async def _run_parallel_scan(redis_client, scan_id: str, request: ParallelScanRequest) -> None:
+    """Run a parallel scan in the background and store its result."""
     try:
-        async with ParallelCookieScanner(
+        async with get_scanner_pool().scanner(
             max_concurrent=request.concurrency,
             timeout=request.timeout
         ) as scanner:
@@ -181,21 +430,142 @@ async def create_parallel_scan(
             storages=results["storages"]
         )
 
+        entry = {"status": "completed", "result": response.model_dump()}
+
         logger.info(
-            f"[PARALLEL_SCAN] Completed {scan_id}: "
-            f"{response.total_pages_scanned} pages, {response.unique_cookies} cookies "
-            f"in {response.duration:.1f}s"
+            "[PARALLEL_SCAN] Completed %s: %d pages, %d cookies in %.1fs",
+            scan_id, response.total_pages_scanned, response.unique_cookies, response.duration
         )
 
-        return response
-
     except Exception as e:
-        logger.error(f"[PARALLEL_SCAN] Error in {scan_id}: {e}", exc_info=True)
+        logger.error("[PARALLEL_SCAN] Error in %s: %s", scan_id, e, exc_info=True)
+        entry = {"status": "failed", "error": str(e)}
+
+    try:
+        await _store_scan_result(redis_client, scan_id, entry)
+    except RedisError as e:
+        logger.error("[PARALLEL_SCAN] Could not store result of %s: %s", scan_id, e)
+
+
+def _result_store_unavailable() -> HTTPException:
+    """503 for when background scan results cannot be stored or read."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Scan result storage is unavailable"
+    )
+
+
+def _result_store(http_request: Request):
+    """Async Redis client holding background scan results, or raise 503."""
+    redis_client = getattr(http_request.app.state, "async_redis_client", None)
+    if redis_client is None:
+        raise _result_store_unavailable()
+    return redis_client
+
+
+# Endpoints
+
+@router.post(
+    "/scan",
+    response_model=ParallelScanAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start parallel page scan",
+    description="Scan a domain with parallel page execution for 5-10x performance improvement"
+)
+async def create_parallel_scan(
+    request: ParallelScanRequest,
+    background_tasks: BackgroundTasks,
+    http_request: Request,
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Start a parallel page scan.
+
+    - **domain**: Full URL with protocol
+    - **scan_type**: "quick" (specific pages) or "deep" (crawl site)
+    - **max_pages**: Maximum pages to scan (deep scan only)
+    - **concurrency**: Parallel execution level (1-20)
+    - **custom_pages**: Specific pages for quick scan
+    - **timeout**: Page load timeout in ms
+
+    The scan runs in the background; the response returns immediately with
+    the `scan_id` and a `status_url` to poll for the result. Results are
+    kept in Redis for an hour, so the API returns 503 when Redis is not
+    configured.
+
+    **Performance**:
+    - Sequential: 50 pages = 150s
+    - Parallel (5x): 50 pages = 30s (5x faster)
+    - Parallel (10x): 50 pages = 15s (10x faster)
+    """
+    redis_client = _result_store(http_request)
+    scan_id = f"scan_{secrets.token_hex(6)}"
+
+    try:
+        await _store_scan_result(redis_client, scan_id, {"status": "running"})
+    except RedisError as e:
+        logger.error("[PARALLEL_SCAN] Could not register %s: %s", scan_id, e)
+        raise _result_store_unavailable()
+
+    logger.info(
+        "[PARALLEL_SCAN] Starting %s scan for %s (concurrency=%d, user=%s)",
+        request.scan_type, request.domain, request.concurrency, current_user.username
+    )
+
+    background_tasks.add_task(_run_parallel_scan, redis_client, scan_id, request)
+
+    return ParallelScanAcceptedResponse(
+        scan_id=scan_id,
+        status="running",
+        status_url=f"{router.prefix}/result/{scan_id}"
+    )
+
+
+@router.get(
+    "/result/{scan_id}",
+    response_model=ParallelScanResponse,
+    summary="Get parallel scan result",
+    description="Fetch the result of a scan started with POST /scan"
+)
+async def get_parallel_scan_result(
+    scan_id: str,
+    http_request: Request,
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Get the result of a background parallel scan.
+
+    Returns 404 for unknown or expired scan IDs and 409 while the scan is
+    still running.
+    """
+    redis_client = _result_store(http_request)
+    try:
+        raw = await redis_client.get(_scan_result_key(scan_id))
+    except RedisError as e:
+        logger.error("[PARALLEL_SCAN] Could not read result of %s: %s", scan_id, e)
+        raise _result_store_unavailable()
+
+    entry = orjson.loads(raw) if raw is not None else None
+    if entry is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Scan {scan_id} not found"
+        )
+
+    if entry["status"] == "running":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Scan {scan_id} is still running"
+        )
+
+    if entry["status"] == "failed":
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Scan failed: {str(e)}"
+            detail=f"Scan failed: {entry['error']}"
         )
 
+    return entry["result"]
+
 
 @router.post(
     "/scan-stream",
@@ -211,109 +581,141 @@ async def create_parallel_scan_stream(
 
     Returns Server-Sent Events (SSE) stream with progress updates:
     - Progress updates during scanning
-    - Final results when complete
+    - `complete_meta` summary when the scan finishes
+    - `cookie_batch` events carrying the cookies in chunks
+    - `complete` once all cookies have been sent
 
     **Client Example**:
     ```javascript
     const eventSource = new EventSource('/api/v1/parallel-scan/scan-stream');
+    const cookies = [];
 
     eventSource.onmessage = (event) => {
         const data = JSON.parse(event.data);
         if (data.type === 'progress') {
             console.log(`Progress: ${data.percentage}%`);
+        } else if (data.type === 'cookie_batch') {
+            cookies.splice(data.offset, data.items.length, ...data.items);
         } else if (data.type === 'complete') {
-            console.log('Scan complete:', data.results);
+            console.log('Scan complete:', cookies);
             eventSource.close();
         }
     };
     ```
     """
-    scan_id = f"scan_{int(datetime.now().timestamp())}"
+    scan_id = f"scan_{secrets.token_hex(6)}"
 
     logger.info(
-        f"[PARALLEL_SCAN_STREAM] Starting {request.scan_type} scan for {request.domain} "
-        f"(concurrency={request.concurrency}, user={current_user.username})"
+        "[PARALLEL_SCAN_STREAM] Starting %s scan for %s (concurrency=%d, user=%s)",
+        request.scan_type, request.domain, request.concurrency, current_user.username
     )
 
     async def generate_progress():
         """Generate SSE progress updates."""
         try:
             # Send start event
-            yield f"data: {json.dumps({'type': 'start', 'scan_id': scan_id, 'domain': request.domain})}\n\n"
-
-            # Progress callback for updates
-            async def send_progress(progress: ScanProgress):
-                percentage = (progress.scanned_pages / progress.total_pages * 100) if progress.total_pages > 0 else 0
-
-                update = ProgressUpdate(
-                    total_pages=progress.total_pages,
-                    scanned_pages=progress.scanned_pages,
-                    current_batch=progress.current_batch,
-                    total_batches=progress.total_batches,
-                    cookies_found=progress.cookies_found,
-                    elapsed_time=progress.elapsed_time,
-                    estimated_remaining=progress.estimated_remaining,
-                    percentage=round(percentage, 1)
-                )
+            yield _sse_event({'type': 'start', 'scan_id': scan_id, 'domain': request.domain})
 
-                yield f"data: {json.dumps({'type': 'progress', **update.dict()})}\n\n"
+            # Progress updates collected from the scanner callback
+            progress_updates = _ProgressEventBuffer()
 
-            # Create scanner and run scan
-            async with ParallelCookieScanner(
-                max_concurrent=request.concurrency,
-                timeout=request.timeout
-            ) as scanner:
+            def progress_callback(progress: ScanProgress):
+                progress_updates.put(_sse_event(_progress_payload(progress)))
+
+            # Check out a scanner in the background, keeping the stream warm
+            # while the browser launches
+            pool = get_scanner_pool()
+            setup_task = asyncio.create_task(
+                pool.acquire(max_concurrent=request.concurrency, timeout=request.timeout)
+            )
+            scanner = None
+            scan_task = None
+
+            try:
+                async for event in _keepalive_until_done(setup_task):
+                    yield event
+                scanner = await setup_task
 
                 if request.scan_type == "deep":
-                    results = await scanner.deep_scan(
+                    scan_coro = scanner.deep_scan(
                         domain=request.domain,
                         max_pages=request.max_pages,
                         custom_pages=request.custom_pages,
-                        progress_callback=lambda p: asyncio.create_task(send_progress(p))
+                        progress_callback=progress_callback
                     )
                 else:
-                    results = await scanner.quick_scan(
+                    scan_coro = scanner.quick_scan(
                         domain=request.domain,
                         custom_pages=request.custom_pages
                     )
 
-            # Send completion event
-            completion_data = {
-                'type': 'complete',
+                # Run scan in background, yield progress
+                scan_task = asyncio.create_task(scan_coro)
+                scan_task.add_done_callback(lambda _: progress_updates.wake())
+
+                while not scan_task.done():
+                    await progress_updates.wait()
+                    for update in progress_updates.drain():
+                        yield update
+
+                results = await scan_task
+            finally:
+                # Client went away: stop scanning before the scanner goes
+                # back to the pool
+                if scan_task is not None and not scan_task.done():
+                    scan_task.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await scan_task
+
+                if scanner is None:
+                    # The checkout may still finish before the cancel lands;
+                    # wait for it so a launched scanner is not orphaned
+                    if not setup_task.done():
+                        setup_task.cancel()
+                        with suppress(asyncio.CancelledError, Exception):
+                            await setup_task
+                    if not setup_task.cancelled() and setup_task.exception() is None:
+                        scanner = setup_task.result()
+
+                if scanner is not None:
+                    await pool.release(scanner)
+
+            for update in progress_updates.drain():
+                yield update
+
+            # Send summary, then cookies in batches, then the completion sentinel
+            completion_meta = {
+                'type': 'complete_meta',
                 'scan_id': scan_id,
                 'domain': request.domain,
                 'total_pages_scanned': results["total_pages_scanned"],
                 'unique_cookies': results["unique_cookies"],
                 'duration': results["duration"],
-                'cookies': results["cookies"],
                 'pages_visited': results["pages_visited"]
             }
 
-            yield f"data: {json.dumps(completion_data)}\n\n"
+            yield _sse_event(completion_meta)
+
+            async for event in _cookie_batch_events(scan_id, results["cookies"]):
+                yield event
+
+            yield _sse_event({'type': 'complete', 'scan_id': scan_id})
 
             logger.info(
-                f"[PARALLEL_SCAN_STREAM] Completed {scan_id}: "
-                f"{results['total_pages_scanned']} pages, {results['unique_cookies']} cookies"
+                "[PARALLEL_SCAN_STREAM] Completed %s: %d pages, %d cookies",
+                scan_id, results['total_pages_scanned'], results['unique_cookies']
             )
 
         except Exception as e:
-            logger.error(f"[PARALLEL_SCAN_STREAM] Error in {scan_id}: {e}", exc_info=True)
+            logger.error("[PARALLEL_SCAN_STREAM] Error in %s: %s", scan_id, e, exc_info=True)
             error_data = {
                 'type': 'error',
                 'scan_id': scan_id,
                 'error': str(e)
             }
-            yield f"data: {json.dumps(error_data)}\n\n"
-
-    return StreamingResponse(
-        generate_progress(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"  # Disable nginx buffering
-        }
-    )
+            yield _sse_event(error_data)
+
+    return EventSourceResponse(generate_progress(), ping=SSE_PING_INTERVAL)
 
 
 @router.get(
@@ -345,42 +747,72 @@ async def benchmark_parallel_scanning(
     }
     ```
     """
-    logger.info(f"[BENCHMARK] Starting benchmark for {domain} with {pages} pages")
+    logger.info("[BENCHMARK] Starting benchmark for %s with %d pages", domain, pages)
 
-    results = {}
+    loop = asyncio.get_running_loop()
 
-    for concurrency in [1, 5, 10]:
-        try:
-            start_time = asyncio.get_event_loop().time()
+    async def run_level(concurrency: int):
+        start_time = loop.time()
 
-            async with ParallelCookieScanner(max_concurrent=concurrency) as scanner:
-                scan_results = await scanner.deep_scan(
-                    domain=domain,
-                    max_pages=pages
-                )
+        async with get_scanner_pool().scanner(max_concurrent=concurrency) as scanner:
+            scan_results = await scanner.deep_scan(
+                domain=domain,
+                max_pages=pages
+            )
+
+        return loop.time() - start_time, scan_results
+
+    # Run all concurrency levels at once so the benchmark takes as long as
+    # the slowest level rather than the sum of all three
+    levels = (1, 5, 10)
+    tasks = [asyncio.create_task(run_level(concurrency)) for concurrency in levels]
+    sequential_task, parallel_tasks = tasks[0], tasks[1:]
+
+    def cancel_parallel_on_failure(task: asyncio.Task):
+        # Speedup is meaningless without the sequential baseline, so stop
+        # paying for the parallel scans once it has failed
+        if not task.cancelled() and task.exception() is not None:
+            for parallel_task in parallel_tasks:
+                parallel_task.cancel()
+
+    sequential_task.add_done_callback(cancel_parallel_on_failure)
+
+    outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = {}
+    sequential_duration: Optional[float] = None
 
-            duration = asyncio.get_event_loop().time() - start_time
-            pages_per_second = scan_results["total_pages_scanned"] / duration if duration > 0 else 0
+    for concurrency, outcome in zip(levels, outcomes):
+        result_key = f"parallel_{concurrency}x" if concurrency > 1 else "sequential"
 
-            result_key = f"parallel_{concurrency}x" if concurrency > 1 else "sequential"
+        if concurrency > 1 and sequential_duration is None:
             results[result_key] = {
-                "duration": round(duration, 2),
-                "pages_per_second": round(pages_per_second, 2),
-                "pages_scanned": scan_results["total_pages_scanned"]
+                "skipped": "sequential baseline failed"
             }
+            continue
 
-            # Calculate speedup relative to sequential
-            if concurrency == 1:
-                sequential_duration = duration
-            else:
-                speedup = sequential_duration / duration
-                results[result_key]["speedup"] = f"{speedup:.1f}x"
-
-        except Exception as e:
-            logger.error(f"[BENCHMARK] Error with concurrency={concurrency}: {e}")
-            results[f"parallel_{concurrency}x" if concurrency > 1 else "sequential"] = {
-                "error": str(e)
+        if isinstance(outcome, BaseException):
+            logger.error("[BENCHMARK] Error with concurrency=%d: %s", concurrency, outcome)
+            results[result_key] = {
+                "error": str(outcome)
             }
+            continue
+
+        duration, scan_results = outcome
+        pages_per_second = scan_results["total_pages_scanned"] / duration if duration > 0 else 0
+
+        results[result_key] = {
+            "duration": round(duration, 2),
+            "pages_per_second": round(pages_per_second, 2),
+            "pages_scanned": scan_results["total_pages_scanned"]
+        }
+
+        # Calculate speedup relative to sequential
+        if concurrency == 1:
+            sequential_duration = duration
+        elif duration > 0:
+            speedup = sequential_duration / duration
+            results[result_key]["speedup"] = f"{speedup:.1f}x"
 
     return {
         "domain": domain,
@@ -394,36 +826,13 @@ async def benchmark_parallel_scanning(
     summary="Get parallel scanning information",
     description="Get information about parallel scanning capabilities"
 )
-async def get_parallel_scan_info():
+async def get_parallel_scan_info(if_none_match: Optional[str] = Header(None)):
     """
     Get information about parallel scanning.
 
     Returns configuration, performance characteristics, and usage guidelines.
     """
-    return {
-        "version": "1.0",
-        "technology": "Python asyncio + Playwright",
-        "default_concurrency": 5,
-        "max_concurrency": 20,
-        "default_timeout": 30000,
-        "performance": {
-            "sequential_baseline": "3s per page",
-            "parallel_5x": "5x faster (0.6s per page effective)",
-            "parallel_10x": "10x faster (0.3s per page effective)"
-        },
-        "recommended_settings": {
-            "small_sites": {"concurrency": 3, "description": "10-20 pages"},
-            "medium_sites": {"concurrency": 5, "description": "20-100 pages"},
-            "large_sites": {"concurrency": 8, "description": "100-500 pages"},
-            "cdn_backed": {"concurrency": 10, "description": "500+ pages with CDN"}
-        },
-        "scan_types": {
-            "quick": "Scan main page + custom pages only",
-            "deep": "Crawl site and scan up to max_pages",
-            "enterprise": "Enterprise scan with up to 20,000 pages"
-        },
-        "documentation": "See PARALLEL_PROCESSING.md for details"
-    }
+    return _cached_json_response(_PARALLEL_INFO_BYTES, _PARALLEL_INFO_ETAG, if_none_match)
 
 
 # ============================================================================
@@ -438,17 +847,29 @@ class EnterpriseScanRequest(BaseModel):
     browser_pool_size: Optional[int] = Field(5, description="Number of browser instances (1-10)", ge=1, le=10)
     pages_per_browser: Optional[int] = Field(20, description="Concurrent pages per browser (10-50)", ge=10, le=50)
     chunk_size: Optional[int] = Field(1000, description="Pages per processing chunk (100-2000)", ge=100, le=2000)
-    custom_pages: Optional[List[str]] = Field(None, description="Custom pages to include")
+    custom_pages: Optional[List[str]] = Field(None, description="Custom pages to include", max_length=MAX_CUSTOM_PAGES)
     timeout: Optional[int] = Field(30000, description="Page timeout in milliseconds", ge=5000, le=120000)
     enable_persistence: Optional[bool] = Field(True, description="Enable checkpoint persistence for resume")
     resume_scan_id: Optional[str] = Field(None, description="Scan ID to resume from checkpoint")
 
-    @validator('domain')
-    def validate_domain(cls, v):
-        if not v.startswith(('http://', 'https://')):
+    @field_validator('domain')
+    @classmethod
+    def validate_domain(cls, v: str) -> str:
+        if not v.startswith(_HTTP_PREFIXES):
             raise ValueError('Domain must include protocol (http:// or https://)')
         return v
 
+    @field_validator('custom_pages')
+    @classmethod
+    def dedupe_custom_pages(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        return _dedupe_pages(v)
+
+    @model_validator(mode='after')
+    def validate_page_budget(self) -> 'EnterpriseScanRequest':
+        if self.custom_pages and self.max_pages is not None and self.max_pages < len(self.custom_pages):
+            raise ValueError('max_pages must be at least the number of custom_pages')
+        return self
+
     class Config:
         schema_extra = {
             "example": {
@@ -519,14 +940,13 @@ async def create_enterprise_scan(
     - 5 browsers × 20 pages = 100 concurrent pages
     - 10 browsers × 50 pages = 500 concurrent pages (maximum)
     """
-    scan_id = request.resume_scan_id or f"enterprise_{int(datetime.now().timestamp())}"
+    scan_id = request.resume_scan_id or f"enterprise_{secrets.token_hex(6)}"
 
     logger.info(
-        f"[ENTERPRISE_API] Starting enterprise scan: {request.domain} "
-        f"(max_pages={request.max_pages}, "
-        f"pool={request.browser_pool_size}, "
-        f"concurrency={request.browser_pool_size * request.pages_per_browser}, "
-        f"user={current_user.username})"
+        "[ENTERPRISE_API] Starting enterprise scan: %s "
+        "(max_pages=%d, pool=%d, concurrency=%d, user=%s)",
+        request.domain, request.max_pages, request.browser_pool_size,
+        request.browser_pool_size * request.pages_per_browser, current_user.username
     )
 
     try:
@@ -546,11 +966,9 @@ async def create_enterprise_scan(
             )
 
         logger.info(
-            f"[ENTERPRISE_API] Completed {scan_id}: "
-            f"{results['total_pages_scanned']} pages, "
-            f"{results['unique_cookies']} cookies in "
-            f"{results['duration']/60:.1f} minutes "
-            f"({results['pages_per_second']:.2f} pages/sec)"
+            "[ENTERPRISE_API] Completed %s: %d pages, %d cookies in %.1f minutes (%.2f pages/sec)",
+            scan_id, results['total_pages_scanned'], results['unique_cookies'],
+            results['duration'] / 60, results['pages_per_second']
         )
 
         return {
@@ -572,7 +990,7 @@ async def create_enterprise_scan(
         }
 
     except Exception as e:
-        logger.error(f"[ENTERPRISE_API] Error in {scan_id}: {e}", exc_info=True)
+        logger.error("[ENTERPRISE_API] Error in %s: %s", scan_id, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Enterprise scan failed: {str(e)}"
@@ -599,38 +1017,45 @@ async def create_enterprise_scan_stream(
     - Browser pool status
     - Memory usage
 
+    When the scan finishes a `complete_meta` summary is sent, followed by
+    `cookie_batch` events and a final `complete` event.
+
     **Client Example**:
     ```javascript
     const eventSource = new EventSource('/api/v1/parallel-scan/enterprise/scan-stream');
+    const cookies = [];
 
     eventSource.onmessage = (event) => {
         const data = JSON.parse(event.data);
         if (data.type === 'metrics') {
             console.log(`Progress: ${data.percentage_complete}%`);
             console.log(`Speed: ${data.pages_per_second} pages/sec`);
+        } else if (data.type === 'cookie_batch') {
+            cookies.splice(data.offset, data.items.length, ...data.items);
         } else if (data.type === 'complete') {
-            console.log('Scan complete!', data);
+            console.log('Scan complete!', cookies);
             eventSource.close();
         }
     };
     ```
     """
-    scan_id = request.resume_scan_id or f"enterprise_{int(datetime.now().timestamp())}"
+    scan_id = request.resume_scan_id or f"enterprise_{secrets.token_hex(6)}"
 
     logger.info(
-        f"[ENTERPRISE_API_STREAM] Starting enterprise scan stream: {request.domain} "
-        f"(max_pages={request.max_pages}, user={current_user.username})"
+        "[ENTERPRISE_API_STREAM] Starting enterprise scan stream: %s (max_pages=%d, user=%s)",
+        request.domain, request.max_pages, current_user.username
     )
 
     async def generate_progress():
         """Generate SSE progress updates."""
         try:
             # Send start event
-            yield f"data: {json.dumps({'type': 'start', 'scan_id': scan_id, 'domain': request.domain})}\n\n"
+            yield _sse_event({'type': 'start', 'scan_id': scan_id, 'domain': request.domain})
 
             # Progress callback
             def send_metrics(metrics: EnterpriseMetrics):
                 percentage = (metrics.scanned_pages / metrics.total_pages * 100) if metrics.total_pages > 0 else 0
+                remaining = metrics.estimated_remaining_seconds
 
                 metrics_data = {
                     'type': 'metrics',
@@ -642,8 +1067,8 @@ async def create_enterprise_scan_stream(
                     'cookies_found': metrics.cookies_found,
                     'elapsed_time': metrics.elapsed_time,
                     'pages_per_second': round(metrics.pages_per_second, 2),
-                    'estimated_remaining_seconds': round(metrics.estimated_remaining_seconds),
-                    'estimated_remaining_minutes': round(metrics.estimated_remaining_seconds / 60, 1),
+                    'estimated_remaining_seconds': round(remaining),
+                    'estimated_remaining_minutes': round(remaining / 60, 1),
                     'active_browsers': metrics.active_browsers,
                     'current_concurrency': metrics.current_concurrency,
                     'percentage_complete': round(percentage, 1),
@@ -651,25 +1076,39 @@ async def create_enterprise_scan_stream(
                 }
 
                 # Note: Can't use yield in nested function, store for main loop
-                return f"data: {json.dumps(metrics_data)}\n\n"
+                return _sse_event(metrics_data)
+
+            last_scanned_pages = -1
+
+            # Store progress updates
+            progress_updates = _ProgressEventBuffer()
+
+            def progress_callback(metrics: EnterpriseMetrics):
+                nonlocal last_scanned_pages
+                # Skip frames where no new pages were scanned
+                if metrics.scanned_pages == last_scanned_pages:
+                    return
+                last_scanned_pages = metrics.scanned_pages
+                progress_updates.put(send_metrics(metrics))
 
-            # Create scanner and run scan
-            async with EnterpriseCookieScanner(
+            # Start the browser pool in the background, keeping the stream
+            # warm while browsers launch
+            scanner = EnterpriseCookieScanner(
                 browser_pool_size=request.browser_pool_size,
                 pages_per_browser=request.pages_per_browser,
                 chunk_size=request.chunk_size,
                 timeout=request.timeout,
                 enable_persistence=request.enable_persistence
-            ) as scanner:
-
-                # Store progress updates
-                progress_updates = []
+            )
+            setup_task = asyncio.create_task(scanner.__aenter__())
+            scan_task = None
 
-                def progress_callback(metrics: EnterpriseMetrics):
-                    progress_updates.append(send_metrics(metrics))
+            try:
+                async for event in _keepalive_until_done(setup_task):
+                    yield event
+                await setup_task
 
                 # Run scan in background, yield progress
-                import asyncio
                 scan_task = asyncio.create_task(
                     scanner.enterprise_deep_scan(
                         domain=request.domain,
@@ -679,21 +1118,32 @@ async def create_enterprise_scan_stream(
                         resume_scan_id=request.resume_scan_id
                     )
                 )
+                scan_task.add_done_callback(lambda _: progress_updates.wake())
 
                 # Yield progress updates while scanning
                 while not scan_task.done():
-                    if progress_updates:
-                        for update in progress_updates:
-                            yield update
-                        progress_updates.clear()
-                    await asyncio.sleep(1)
+                    await progress_updates.wait()
+                    for update in progress_updates.drain():
+                        yield update
 
                 # Get final results
                 results = await scan_task
-
-            # Send completion event
-            completion_data = {
-                'type': 'complete',
+            finally:
+                for task in (scan_task, setup_task):
+                    if task is not None and not task.done():
+                        task.cancel()
+                        with suppress(asyncio.CancelledError, Exception):
+                            await task
+
+                # Stops whichever browsers did start, even after a failed setup
+                await scanner.__aexit__(None, None, None)
+
+            for update in progress_updates.drain():
+                yield update
+
+            # Send summary, then cookies in batches, then the completion sentinel
+            completion_meta = {
+                'type': 'complete_meta',
                 'scan_id': results["scan_id"],
                 'domain': request.domain,
                 'total_pages_scanned': results["total_pages_scanned"],
@@ -702,35 +1152,31 @@ async def create_enterprise_scan_stream(
                 'duration': results["duration"],
                 'duration_minutes': round(results["duration"] / 60, 1),
                 'pages_per_second': results["pages_per_second"],
-                'cookies': results["cookies"][:100],  # Limit for streaming
                 'metrics': results["metrics"]
             }
 
-            yield f"data: {json.dumps(completion_data)}\n\n"
+            yield _sse_event(completion_meta)
+
+            async for event in _cookie_batch_events(results["scan_id"], results["cookies"]):
+                yield event
+
+            yield _sse_event({'type': 'complete', 'scan_id': results["scan_id"]})
 
             logger.info(
-                f"[ENTERPRISE_API_STREAM] Completed {scan_id}: "
-                f"{results['total_pages_scanned']} pages, {results['unique_cookies']} cookies"
+                "[ENTERPRISE_API_STREAM] Completed %s: %d pages, %d cookies",
+                scan_id, results['total_pages_scanned'], results['unique_cookies']
             )
 
         except Exception as e:
-            logger.error(f"[ENTERPRISE_API_STREAM] Error in {scan_id}: {e}", exc_info=True)
+            logger.error("[ENTERPRISE_API_STREAM] Error in %s: %s", scan_id, e, exc_info=True)
             error_data = {
                 'type': 'error',
                 'scan_id': scan_id,
                 'error': str(e)
             }
-            yield f"data: {json.dumps(error_data)}\n\n"
-
-    return StreamingResponse(
-        generate_progress(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"
-        }
-    )
+            yield _sse_event(error_data)
+
+    return EventSourceResponse(generate_progress(), ping=SSE_PING_INTERVAL)
 
 
 @router.get(
@@ -738,77 +1184,11 @@ async def create_enterprise_scan_stream(
     summary="Get enterprise scanning information",
     description="Get configuration and capabilities of enterprise scanner"
 )
-async def get_enterprise_info():
+async def get_enterprise_info(if_none_match: Optional[str] = Header(None)):
     """
     Get enterprise scanning information and capabilities.
 
     Returns configuration limits, performance characteristics,
     and recommended settings for different scales.
     """
-    return {
-        "version": "1.0-enterprise",
-        "technology": "Browser Pool + Python asyncio",
-        "capabilities": {
-            "max_pages": 20000,
-            "max_browser_pool": 10,
-            "max_pages_per_browser": 50,
-            "max_total_concurrency": 500,
-            "chunk_processing": True,
-            "checkpoint_persistence": True,
-            "resume_capability": True,
-            "adaptive_concurrency": True
-        },
-        "performance": {
-            "sequential_baseline": "3s per page (20,000 pages = 16.7 hours)",
-            "parallel_100x": "100x faster (20,000 pages = 10 minutes)",
-            "parallel_200x": "200x faster (20,000 pages = 5 minutes)",
-            "parallel_500x": "500x faster (20,000 pages = 2 minutes)"
-        },
-        "recommended_configurations": {
-            "small_scale": {
-                "pages": "1-1000",
-                "browser_pool_size": 3,
-                "pages_per_browser": 20,
-                "total_concurrency": 60,
-                "estimated_duration": "0.5-15 minutes"
-            },
-            "medium_scale": {
-                "pages": "1000-5000",
-                "browser_pool_size": 5,
-                "pages_per_browser": 20,
-                "total_concurrency": 100,
-                "estimated_duration": "15-50 minutes"
-            },
-            "large_scale": {
-                "pages": "5000-10000",
-                "browser_pool_size": 8,
-                "pages_per_browser": 30,
-                "total_concurrency": 240,
-                "estimated_duration": "20-40 minutes"
-            },
-            "enterprise_scale": {
-                "pages": "10000-20000",
-                "browser_pool_size": 10,
-                "pages_per_browser": 50,
-                "total_concurrency": 500,
-                "estimated_duration": "5-20 minutes"
-            }
-        },
-        "resource_requirements": {
-            "small_scale": "2-4 GB RAM, 2 CPU cores",
-            "medium_scale": "4-8 GB RAM, 4 CPU cores",
-            "large_scale": "8-16 GB RAM, 8 CPU cores",
-            "enterprise_scale": "16-32 GB RAM, 16 CPU cores"
-        },
-        "features": [
-            "Browser pool management (multiple browser instances)",
-            "Chunked processing (memory efficient)",
-            "Checkpoint persistence (resume from failures)",
-            "Adaptive concurrency (auto-adjusts performance)",
-            "Rate limiting protection",
-            "Real-time progress streaming",
-            "Resource monitoring",
-            "Error resilience and retry logic"
-        ],
-        "documentation": "See ENTERPRISE_SCANNING.md for details"
-    }
+    return _cached_json_response(_ENTERPRISE_INFO_BYTES, _ENTERPRISE_INFO_ETAG, if_none_match)
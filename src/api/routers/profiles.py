@@ -2,10 +2,20 @@
 Scan profile management endpoints.
 """
 
-from typing import List, Optional
+import functools
+import hashlib
+import logging
+import operator
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status, Depends, Query, Request
+import orjson
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
 from pydantic import BaseModel, UUID4
 
 from src.api.auth.dependencies import get_current_user, require_scope
@@ -13,12 +23,161 @@ from src.models.user import TokenData
 from src.models.profile import ScanProfile, ScanProfileCreate, ScanProfileUpdate
 from src.services.profile_service import ProfileService
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
-def get_profile_service(request: Request) -> ProfileService:
-    """Dependency to get profile service from app state."""
-    return ProfileService(request.app.state.db_pool)
+class ProfileRoute(APIRoute):
+    """
+    Route class for all profile endpoints.
+    
+    Whatever an endpoint returns is encoded with orjson into a Response
+    before FastAPI sees it, so the jsonable_encoder pass and response-model
+    re-validation are skipped. response_model on the decorators only
+    documents the schema. Endpoints that already build a Response (ETags,
+    streaming, 204) pass through untouched.
+    """
+    
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs):
+        status_code = kwargs.get("status_code") or status.HTTP_200_OK
+        
+        @functools.wraps(endpoint)
+        async def encoded_endpoint(*args, **endpoint_kwargs):
+            result = await endpoint(*args, **endpoint_kwargs)
+            if isinstance(result, Response):
+                return result
+            return Response(
+                content=orjson.dumps(result, default=_orjson_default),
+                status_code=status_code,
+                media_type="application/json"
+            )
+        
+        super().__init__(path, encoded_endpoint, **kwargs)
+
+
+router = APIRouter(route_class=ProfileRoute)
+
+PROFILE_CACHE_SIZE = 1024
+PROFILE_CACHE_TTL = 60  # seconds
+PROFILE_CACHE_CONTROL = "private, max-age=30"
+
+# Canonical UUID text form; checked by a regex instead of Pydantic UUID
+# validation since the ID is only used as an opaque key (asyncpg binds
+# the string to the uuid column directly)
+PROFILE_ID_PATTERN = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+
+
+class _ProfileCache:
+    """
+    In-process LRU cache of serialized profiles and their ETags with a TTL.
+
+    Profiles change rarely, so GET /{profile_id} is served from here without
+    a DB round-trip or re-serialization. Entries are dropped by the mutating
+    handlers; the TTL bounds staleness across workers, which each hold
+    their own cache. Keys are lower-cased so every spelling of an ID shares
+    one entry.
+
+    Each key has a generation that pop() bumps. A reader takes it before
+    loading the profile and passes it to set(), which skips the store if
+    the profile was invalidated meanwhile, so a slow read cannot put a
+    stale body back after an update or delete.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Tuple[str, bytes]]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+    def get(self, key: str) -> Optional[Tuple[str, bytes]]:
+        key = key.lower()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def generation(self, key: str) -> int:
+        return self._generations.get(key.lower(), 0)
+
+    def set(self, key: str, etag: str, body: bytes, generation: int):
+        key = key.lower()
+        if self._generations.get(key, 0) != generation:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, (etag, body))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: str):
+        key = key.lower()
+        self._entries.pop(key, None)
+        self._generations[key] = self._generations.get(key, 0) + 1
+
+
+_profile_cache = _ProfileCache(maxsize=PROFILE_CACHE_SIZE, ttl=PROFILE_CACHE_TTL)
+
+# Response keys in ScanProfile field order, interned once at import, and a
+# reader that fetches all their values in one C-level call
+_PROFILE_KEYS = tuple(sys.intern(key) for key in ScanProfile.model_fields)
+_read_profile_values = operator.attrgetter(*_PROFILE_KEYS)
+
+
+async def get_profile_service(request: Request) -> AsyncIterator[ProfileService]:
+    """Dependency to get profile service from app state, scoped to one DB connection per request."""
+    async with request.app.state.profile_service.request_scope() as profile_service:
+        yield profile_service
+
+
+# Scope checkers and dependency markers are built once at import; reusing
+# the same callables also lets FastAPI's per-request dependency cache
+# dedupe them
+require_profiles_read = require_scope("profiles:read")
+require_profiles_write = require_scope("profiles:write")
+
+ReadUser = Depends(require_profiles_read)
+WriteUser = Depends(require_profiles_write)
+ProfileServiceDep = Depends(get_profile_service)
+
+
+def _orjson_default(obj: Any) -> Any:
+    """
+    orjson fallback for Pydantic models.
+    
+    Profiles are read straight into a dict rather than going through
+    model_dump(); orjson handles the UUID and datetime values natively.
+    """
+    if isinstance(obj, ScanProfile):
+        return dict(zip(_PROFILE_KEYS, _read_profile_values(obj)))
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _encode_profile(profile: ScanProfile) -> bytes:
+    """Encode a profile as JSON."""
+    return orjson.dumps(profile, default=_orjson_default)
+
+
+def _profile_not_found(profile_id: str) -> HTTPException:
+    """Log a profile miss and return a 404 ready to raise."""
+    logger.info("Profile %s not found", profile_id)
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Profile not found"
+    )
+
+
+async def _stream_json_array(profiles: AsyncIterator[ScanProfile]) -> AsyncIterator[bytes]:
+    """Encode profiles one at a time as the chunks of a JSON array."""
+    separator = b"["
+    async for profile in profiles:
+        yield separator + _encode_profile(profile)
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
 
 
 @router.post(
@@ -30,8 +189,8 @@ def get_profile_service(request: Request) -> ProfileService:
 )
 async def create_profile(
     profile_data: ScanProfileCreate,
-    current_user: TokenData = Depends(require_scope("profiles:write")),
-    profile_service: ProfileService = Depends(get_profile_service)
+    current_user: TokenData = WriteUser,
+    profile_service: ProfileService = ProfileServiceDep
 ):
     """
     Create a new scan profile.
@@ -41,52 +200,62 @@ async def create_profile(
     
     **Required scope**: `profiles:write`
     """
-    try:
-        profile = await profile_service.create_profile(
-            profile_data=profile_data,
-            created_by=current_user.user_id
-        )
-        return profile
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create profile: {str(e)}"
-        )
+    profile = await profile_service.create_profile(
+        profile_data=profile_data,
+        created_by=current_user.user_id
+    )
+    return profile
 
 
 @router.get(
     "/{profile_id}",
-    response_model=ScanProfile,
+    response_class=Response,
+    responses={200: {"model": ScanProfile}},
     status_code=status.HTTP_200_OK,
     summary="Get scan profile",
     description="Retrieve a scan profile by ID"
 )
 async def get_profile(
-    profile_id: UUID4,
-    current_user: TokenData = Depends(require_scope("profiles:read")),
-    profile_service: ProfileService = Depends(get_profile_service)
+    profile_id: str = Path(..., pattern=PROFILE_ID_PATTERN, description="Profile ID"),
+    if_none_match: Optional[str] = Header(None),
+    current_user: TokenData = ReadUser,
+    profile_service: ProfileService = ProfileServiceDep
 ):
     """
     Get a scan profile by ID.
     
     Returns the complete profile configuration including all parameters.
+    Responses carry an ETag; send it back in If-None-Match to get a 304
+    when the profile is unchanged.
     
     **Required scope**: `profiles:read`
     """
-    profile = await profile_service.get_profile(profile_id)
-    
-    if not profile:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Profile with ID {profile_id} not found"
-        )
+    cached = _profile_cache.get(profile_id)
+    if cached is None:
+        generation = _profile_cache.generation(profile_id)
+        profile = await profile_service.get_profile(profile_id)
+        
+        if not profile:
+            raise _profile_not_found(profile_id)
+        
+        body = _encode_profile(profile)
+        # Hash of the encoded profile, so any update (which also bumps
+        # updated_at) yields a new tag
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        _profile_cache.set(profile_id, etag, body, generation)
+    else:
+        etag, body = cached
     
-    return profile
+    headers = {"Cache-Control": PROFILE_CACHE_CONTROL, "ETag": etag}
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get(
     "",
-    response_model=List[ScanProfile],
+    response_class=Response,
+    responses={200: {"model": List[ScanProfile]}},
     status_code=status.HTTP_200_OK,
     summary="List scan profiles",
     description="List all scan profiles with optional filtering"
@@ -95,29 +264,29 @@ async def list_profiles(
     scan_mode: Optional[str] = Query(default=None, description="Filter by scan mode"),
     limit: int = Query(default=100, ge=1, le=500, description="Maximum number of results"),
     offset: int = Query(default=0, ge=0, description="Offset for pagination"),
-    current_user: TokenData = Depends(require_scope("profiles:read")),
-    profile_service: ProfileService = Depends(get_profile_service)
+    cursor: Optional[UUID4] = Query(
+        default=None,
+        description="profile_id of the last item on the previous page; replaces offset"
+    ),
+    current_user: TokenData = ReadUser,
+    profile_service: ProfileService = ProfileServiceDep
 ):
     """
     List scan profiles.
     
     Returns a list of scan profiles with optional filtering by scan mode.
-    Supports pagination via limit and offset parameters.
+    Supports pagination via limit and offset parameters, or via cursor
+    (the last profile_id of the previous page) for deep pages.
     
     **Required scope**: `profiles:read`
     """
-    try:
-        profiles = await profile_service.list_profiles(
-            scan_mode=scan_mode,
-            limit=limit,
-            offset=offset
-        )
-        return profiles
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list profiles: {str(e)}"
-        )
+    profiles = profile_service.iter_profiles(
+        scan_mode=scan_mode,
+        limit=limit,
+        offset=offset,
+        cursor=cursor
+    )
+    return StreamingResponse(_stream_json_array(profiles), media_type="application/json")
 
 
 @router.put(
@@ -128,10 +297,10 @@ async def list_profiles(
     description="Update an existing scan profile"
 )
 async def update_profile(
-    profile_id: UUID4,
     profile_data: ScanProfileUpdate,
-    current_user: TokenData = Depends(require_scope("profiles:write")),
-    profile_service: ProfileService = Depends(get_profile_service)
+    profile_id: str = Path(..., pattern=PROFILE_ID_PATTERN, description="Profile ID"),
+    current_user: TokenData = WriteUser,
+    profile_service: ProfileService = ProfileServiceDep
 ):
     """
     Update a scan profile.
@@ -141,38 +310,29 @@ async def update_profile(
     
     **Required scope**: `profiles:write`
     """
-    try:
-        profile = await profile_service.update_profile(
-            profile_id=profile_id,
-            profile_data=profile_data
-        )
-        
-        if not profile:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Profile with ID {profile_id} not found"
-            )
-        
-        return profile
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update profile: {str(e)}"
-        )
+    profile = await profile_service.update_profile(
+        profile_id=profile_id,
+        profile_data=profile_data
+    )
+    _profile_cache.pop(profile_id)
+    
+    if not profile:
+        raise _profile_not_found(profile_id)
+    
+    return profile
 
 
 @router.delete(
     "/{profile_id}",
     status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
     summary="Delete scan profile",
     description="Delete a scan profile"
 )
 async def delete_profile(
-    profile_id: UUID4,
-    current_user: TokenData = Depends(require_scope("profiles:write")),
-    profile_service: ProfileService = Depends(get_profile_service)
+    profile_id: str = Path(..., pattern=PROFILE_ID_PATTERN, description="Profile ID"),
+    current_user: TokenData = WriteUser,
+    profile_service: ProfileService = ProfileServiceDep
 ):
     """
     Delete a scan profile.
@@ -182,18 +342,10 @@ async def delete_profile(
     
     **Required scope**: `profiles:write`
     """
-    try:
-        deleted = await profile_service.delete_profile(profile_id)
-        
-        if not deleted:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Profile with ID {profile_id} not found"
-            )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete profile: {str(e)}"
-        )
+    deleted = await profile_service.delete_profile(profile_id)
+    _profile_cache.pop(profile_id)
+    
+    if not deleted:
+        raise _profile_not_found(profile_id)
+    
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -3,37 +3,301 @@ Scan management endpoints.
 """
 
 import asyncio
-import json
 import logging
-from typing import List, Optional, Dict, Any
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from uuid import UUID, uuid4
 from datetime import datetime
+from urllib.parse import urlsplit
 
-from fastapi import APIRouter, HTTPException, status, Depends, Query, Request
+import orjson
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field, UUID4
+from pydantic import BaseModel, Field, UUID4, field_validator
+from redis.exceptions import RedisError
 
 from src.api.auth.dependencies import get_current_user, require_scope
+from src.core.config import get_config
 from src.models.user import TokenData
 from src.models.scan import ScanResult, ScanParams, ScanMode, ScanStatus, ScanProgress, Cookie
-from src.services.scan_service import ScanService
+from src.services.scan_service import ScanService, scan_progress_channel
 from src.services.parallel_scan_manager import ParallelScanManager
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# get_scan response cache: in-flight scans change every few seconds,
+# finished ones never do
+SCAN_CACHE_TTL_ACTIVE = 5  # seconds
+SCAN_CACHE_TTL_FINAL = 3600  # seconds
+_ACTIVE_SCAN_STATUSES = (ScanStatus.PENDING.value, ScanStatus.RUNNING.value)
+_FINAL_SCAN_STATUSES = (ScanStatus.SUCCESS.value, ScanStatus.FAILED.value, ScanStatus.CANCELLED.value)
+
+SSE_KEEPALIVE_INTERVAL = 15  # seconds
+
+# get_scan database loads in flight, by scan_id
+_inflight_loads: Dict[UUID, "asyncio.Future[Any]"] = {}
+
+DOMAIN_RATE_LIMIT_WINDOW = 60  # seconds
+
+# How long get_scan waits for a second connection before querying sequentially
+SECOND_CONNECTION_TIMEOUT = 0.05  # seconds
+
+# DNS hostname (labels of letters, digits and inner hyphens) or IPv4 address;
+# urlsplit lower-cases the host before it is matched
+_HOSTNAME_RE = re.compile(r"^(?=.{1,253}$)[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?(?:\.[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?)*$")
+
+# Fixed statement texts for the per-request lookups, so asyncpg's
+# per-connection statement cache (keyed on the SQL string) reuses the
+# server-side prepared statement instead of re-parsing on every call
+_SELECT_SCAN_SQL = """
+    SELECT 
+        scan_id, domain_config_id, domain, scan_mode, timestamp_utc,
+        status, error, total_cookies, first_party_cookies, third_party_cookies,
+        duration_seconds, page_count, created_at, updated_at, params
+    FROM scan_results
+    WHERE scan_id = $1
+"""
+_SELECT_SCAN_COOKIES_SQL = """
+    SELECT 
+        cookie_id, scan_id, name, domain, path, hashed_value,
+        http_only, secure, same_site, category, cookie_type,
+        created_at
+    FROM cookies
+    WHERE scan_id = $1
+    ORDER BY created_at
+"""
+_SELECT_SCAN_STATUS_SQL = "SELECT status FROM scan_results WHERE scan_id = $1"
+_SCAN_EXISTS_SQL = "SELECT EXISTS (SELECT 1 FROM scan_results WHERE scan_id = $1)"
+_CANCEL_SCAN_SQL = """
+    UPDATE scan_results
+    SET status = 'cancelled', updated_at = NOW()
+    WHERE scan_id = $1
+"""
+# Cookies and the scan row go in one statement: the CTE deletes cookies
+# whether or not the FK cascades (older databases lack ON DELETE CASCADE),
+# and the FK is only checked once the whole statement has run
+_DELETE_SCAN_SQL = """
+    WITH deleted_cookies AS (
+        DELETE FROM cookies WHERE scan_id = $1
+    )
+    DELETE FROM scan_results WHERE scan_id = $1
+"""
+_DELETE_LATEST_DOMAIN_SCAN_SQL = """
+    WITH target AS (
+        SELECT scan_id FROM scan_results
+        WHERE domain = $1
+        ORDER BY created_at DESC
+        LIMIT 1
+    ), deleted_cookies AS (
+        DELETE FROM cookies WHERE scan_id = (SELECT scan_id FROM target)
+    )
+    DELETE FROM scan_results
+    WHERE scan_id = (SELECT scan_id FROM target)
+    RETURNING scan_id
+"""
+# Columns of a list_scans row (scan_results aliased as sr)
+_LIST_SCAN_COLUMNS = """
+    sr.scan_id, sr.domain_config_id, sr.domain, sr.scan_mode, sr.timestamp_utc,
+    sr.status, sr.error, sr.total_cookies, sr.first_party_cookies,
+    sr.third_party_cookies, sr.duration_seconds, sr.page_count,
+    sr.created_at, sr.updated_at, sr.params
+"""
+
+
+def _singleflight(key: UUID, load: Callable[[], Awaitable[Any]]) -> Awaitable[Any]:
+    """
+    Run load() once for all concurrent callers with the same key.
+    
+    The load runs as its own task, and every caller awaits it through a
+    shield, so a disconnecting client doesn't cancel the fetch for the
+    others.
+    """
+    task = _inflight_loads.get(key)
+    if task is None:
+        task = asyncio.ensure_future(load())
+        _inflight_loads[key] = task
+        task.add_done_callback(lambda _: _inflight_loads.pop(key, None))
+    return asyncio.shield(task)
+
+
+async def _fetch_scan_rows(db_pool, scan_conn, scan_id: UUID):
+    """
+    Fetch the scan row and its cookies.
+    
+    Both only depend on scan_id, so when a second pooled connection is free
+    they run concurrently (one round trip of latency). The second acquire
+    is bounded: while holding scan_conn, waiting indefinitely for another
+    connection would deadlock a saturated pool, so on timeout both queries
+    run one after the other on scan_conn.
+    """
+    try:
+        cookie_conn = await db_pool.acquire(timeout=SECOND_CONNECTION_TIMEOUT)
+    except asyncio.TimeoutError:
+        row = await scan_conn.fetchrow(_SELECT_SCAN_SQL, scan_id)
+        cookie_rows = await scan_conn.fetch(_SELECT_SCAN_COOKIES_SQL, scan_id)
+        return row, cookie_rows
+    
+    try:
+        return await asyncio.gather(
+            scan_conn.fetchrow(_SELECT_SCAN_SQL, scan_id),
+            cookie_conn.fetch(_SELECT_SCAN_COOKIES_SQL, scan_id)
+        )
+    finally:
+        await db_pool.release(cookie_conn)
+
+
+async def _load_scan_body(db_pool, redis_client, scan_id: UUID) -> Optional[str]:
+    """
+    Fetch a scan with its cookies, serialize it and cache the body.
+    
+    Returns None for a missing scan; the result is shared by every waiter,
+    so each request raises its own 404.
+    """
+    async with db_pool.acquire() as scan_conn:
+        row, cookie_rows = await _fetch_scan_rows(db_pool, scan_conn, scan_id)
+        
+        if not row:
+            return None
+        
+        # Rows come from our own tables, so the models are built without
+        # re-running field validation; keyword names must match the model
+        # fields exactly since from_trusted drops anything else
+        cookies = [
+            Cookie.from_trusted(
+                cookie_id=c['cookie_id'],
+                scan_id=c['scan_id'],
+                name=c['name'],
+                hashed_value=c['hashed_value'],
+                domain=c['domain'],
+                path=c['path'] or '/',
+                http_only=c['http_only'],
+                secure=c['secure'],
+                same_site=c['same_site'],
+                category=c['category'],
+                cookie_type=c['cookie_type'],
+                created_at=c['created_at']
+            )
+            for c in cookie_rows
+        ]
+        
+        result = ScanResult.from_trusted(
+            scan_id=row['scan_id'],
+            domain_config_id=row['domain_config_id'],
+            domain=row['domain'],
+            scan_mode=row['scan_mode'],
+            timestamp_utc=row['timestamp_utc'],
+            status=row['status'],
+            error=row['error'],
+            total_cookies=row['total_cookies'] or 0,
+            first_party_cookies=row['first_party_cookies'],
+            third_party_cookies=row['third_party_cookies'],
+            duration_seconds=row['duration_seconds'],
+            page_count=row['page_count'] or 0,
+            cookies=cookies,
+            created_at=row['created_at'],
+            updated_at=row['updated_at']
+        )
+    
+    # Serve hits and misses from the same serialized body
+    body = result.model_dump_json()
+    await _cache_scan(redis_client, scan_id, body, result.status)
+    return body
+
 
 def get_scan_service(request: Request) -> ScanService:
     """Dependency to get scan service from app state."""
-    return ScanService(request.app.state.db_pool, request.app.state.redis_client)
+    return request.app.state.scan_service
 
 
 def get_parallel_scan_manager(request: Request) -> ParallelScanManager:
     """Dependency to get parallel scan manager from app state."""
-    scan_service = get_scan_service(request)
-    # Get max concurrency from config or use default
-    max_concurrency = getattr(request.app.state, 'max_scan_concurrency', 10)
-    return ParallelScanManager(scan_service, max_concurrency)
+    return request.app.state.parallel_scan_manager
+
+
+def _scan_cache_key(scan_id: UUID) -> str:
+    """Redis key for a cached get_scan response."""
+    return f"scan:{scan_id}"
+
+
+async def _get_cached_scan(redis_client, scan_id: UUID) -> Optional[str]:
+    """Return the cached get_scan body, or None on a miss or Redis error."""
+    if redis_client is None:
+        return None
+    try:
+        return await redis_client.get(_scan_cache_key(scan_id))
+    except RedisError as e:
+        logger.warning(f"Scan cache read failed for {scan_id}: {e}")
+        return None
+
+
+async def _cache_scan(redis_client, scan_id: UUID, body: str, scan_status: str):
+    """Cache a get_scan body with a TTL based on the scan status."""
+    if redis_client is None:
+        return
+    ttl = SCAN_CACHE_TTL_ACTIVE if scan_status in _ACTIVE_SCAN_STATUSES else SCAN_CACHE_TTL_FINAL
+    try:
+        await redis_client.set(_scan_cache_key(scan_id), body, ex=ttl)
+    except RedisError as e:
+        logger.warning(f"Scan cache write failed for {scan_id}: {e}")
+
+
+async def _check_domain_rate_limit(redis_client, domain: str):
+    """
+    Reject a new scan once the domain has used up its scans for this minute.
+    
+    One counter per domain per fixed window, expiring with the window.
+    Fails open when Redis is unavailable, like the API
+    rate limiter.
+    """
+    limit = get_config().scan.domain_rate_limit
+    if redis_client is None or not limit:
+        return
+    window = int(time.time()) // DOMAIN_RATE_LIMIT_WINDOW
+    key = f"rl:scan:{domain.lower()}:{window}"
+    try:
+        pipe = redis_client.pipeline()
+        pipe.incr(key)
+        pipe.expire(key, DOMAIN_RATE_LIMIT_WINDOW)
+        count = (await pipe.execute())[0]
+    except RedisError as e:
+        logger.warning(f"Domain rate limit check failed for {domain}: {e}")
+        return
+    if count > limit:
+        retry_after = DOMAIN_RATE_LIMIT_WINDOW - int(time.time()) % DOMAIN_RATE_LIMIT_WINDOW
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Rate limit: {limit} scan(s) per domain per minute",
+            headers={"Retry-After": str(retry_after)}
+        )
+
+
+async def _invalidate_scan(redis_client, scan_id: UUID):
+    """Drop a cached get_scan body after the scan was cancelled or deleted."""
+    if redis_client is None:
+        return
+    try:
+        await redis_client.delete(_scan_cache_key(scan_id))
+    except RedisError as e:
+        logger.warning(f"Scan cache invalidation failed for {scan_id}: {e}")
+
+
+def _validate_scan_domain(domain: str) -> str:
+    """
+    Reject scan targets that aren't http(s) URLs with a valid host.
+    
+    Runs during request validation, so malformed domains never reach the
+    database or the workers. The value itself is kept as sent.
+    """
+    parts = urlsplit(domain.strip())
+    if parts.scheme not in ("http", "https"):
+        raise ValueError("Domain must include protocol (http:// or https://)")
+    if not parts.hostname or not _HOSTNAME_RE.match(parts.hostname):
+        raise ValueError("Domain must include a valid host name")
+    # Raises ValueError for a non-numeric or out-of-range port
+    parts.port
+    return domain
 
 
 class CreateScanRequest(BaseModel):
@@ -43,6 +307,11 @@ class CreateScanRequest(BaseModel):
     scan_mode: ScanMode = Field(default=ScanMode.QUICK, description="Scan mode")
     params: Optional[ScanParams] = Field(default_factory=ScanParams, description="Scan parameters")
     
+    @field_validator('domain')
+    @classmethod
+    def validate_domain(cls, v: str) -> str:
+        return _validate_scan_domain(v)
+    
     class Config:
         schema_extra = {
             "example": {
@@ -68,11 +337,12 @@ class CreateScanResponse(BaseModel):
 class PaginatedScansResponse(BaseModel):
     """Paginated list of scans."""
     items: List[ScanResult]
-    total: int
+    total: Optional[int] = Field(None, description="Total matching scans (not computed for cursor pages)")
     page: int
     page_size: int
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[UUID4] = Field(None, description="Pass as cursor to fetch the next page")
 
 
 class BatchScanDomain(BaseModel):
@@ -80,6 +350,11 @@ class BatchScanDomain(BaseModel):
     domain: str = Field(..., description="Domain to scan")
     domain_config_id: UUID4 = Field(..., description="Domain configuration ID")
     params: Optional[ScanParams] = Field(default_factory=ScanParams, description="Scan parameters")
+    
+    @field_validator('domain')
+    @classmethod
+    def validate_domain(cls, v: str) -> str:
+        return _validate_scan_domain(v)
 
 
 class BatchScanRequest(BaseModel):
@@ -109,6 +384,7 @@ class BatchScanRequest(BaseModel):
 
 class BatchScanResponse(BaseModel):
     """Response model for batch scan."""
+    batch_id: Optional[str] = None
     total_domains: int
     successful: int
     failed: int
@@ -144,46 +420,25 @@ async def create_scan(
     **Response**: Returns immediately with scan ID. Use `/scans/{scan_id}` to check status
     and `/scans/{scan_id}/progress` or `/scans/{scan_id}/stream` for real-time updates.
     """
-    from src.services.scan_tasks import execute_scan_async
-    
-    # Validate domain format
-    if not req.domain.startswith(('http://', 'https://')):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Domain must include protocol (http:// or https://)"
-        )
+    # Checked before the scan row is created so rejected requests leave
+    # nothing behind
+    await _check_domain_rate_limit(getattr(request.app.state, "async_redis_client", None), req.domain)
     
     # Generate domain_config_id if not provided
     domain_config_id = req.domain_config_id or uuid4()
     
-    # Create scan record in database
+    # Create the scan record and its outbox entry in one transaction; the
+    # outbox dispatcher publishes it to the workers
     scan_id = await scan_service.create_scan(
         domain=req.domain,
         domain_config_id=domain_config_id,
         scan_mode=req.scan_mode,
         params=req.params or ScanParams(),
-        profile=None  # TODO: Load profile if needed
+        profile=None,  # TODO: Load profile if needed
+        enqueue=True
     )
-    
-    # Queue scan for async execution
-    try:
-        execute_scan_async.delay(
-            scan_id=str(scan_id),
-            domain=req.domain,
-            domain_config_id=str(domain_config_id),
-            scan_mode=req.scan_mode.value,
-            params=(req.params or ScanParams()).dict(),
-            profile_id=None
-        )
-        logger.info(f"Scan {scan_id} queued for execution")
-    except Exception as e:
-        logger.error(f"Failed to queue scan {scan_id}: {e}")
-        # Update scan status to failed
-        await scan_service._update_scan_status(scan_id, ScanStatus.FAILED, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to queue scan: {str(e)}"
-        )
+    request.app.state.scan_outbox.wake()
+    logger.info(f"Scan {scan_id} queued for execution")
     
     return CreateScanResponse(
         scan_id=scan_id,
@@ -213,91 +468,22 @@ async def get_scan(
     
     **Required scope**: `scans:read`
     """
-    db_pool = request.app.state.db_pool
-    
-    async with db_pool.acquire() as conn:
-        # Get scan result
-        row = await conn.fetchrow(
-            """
-            SELECT 
-                scan_id, domain_config_id, domain, scan_mode, timestamp_utc,
-                status, error, total_cookies, duration_seconds, page_count,
-                created_at, updated_at, params
-            FROM scan_results
-            WHERE scan_id = $1
-            """,
-            scan_id
-        )
-        
-        if not row:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Scan with ID {scan_id} not found"
-            )
-        
-        # Get cookies for this scan
-        cookie_rows = await conn.fetch(
-            """
-            SELECT 
-                cookie_id, scan_id, name, domain, path, hashed_value,
-                http_only, secure, same_site, category, cookie_type,
-                created_at
-            FROM cookies
-            WHERE scan_id = $1
-            ORDER BY created_at
-            """,
-            scan_id
-        )
-        
-        # Get cookie counts by type
-        cookie_counts = await conn.fetchrow(
-            """
-            SELECT 
-                COUNT(*) FILTER (WHERE cookie_type = 'First Party') as first_party,
-                COUNT(*) FILTER (WHERE cookie_type = 'Third Party') as third_party
-            FROM cookies
-            WHERE scan_id = $1
-            """,
-            scan_id
-        )
-        
-        cookies = [
-            Cookie(
-                cookie_id=c['cookie_id'],
-                scan_id=c['scan_id'],
-                name=c['name'],
-                value=c['hashed_value'] or '',
-                domain=c['domain'],
-                path=c['path'] or '/',
-                expires=None,
-                http_only=c['http_only'],
-                secure=c['secure'],
-                same_site=c['same_site'],
-                category=c['category'],
-                is_first_party=(c['cookie_type'] == 'First Party'),
-                created_at=c['created_at']
-            )
-            for c in cookie_rows
-        ]
-        
-        return ScanResult(
-            scan_id=row['scan_id'],
-            domain_config_id=row['domain_config_id'],
-            domain=row['domain'],
-            scan_mode=row['scan_mode'],
-            timestamp_utc=row['timestamp_utc'],
-            status=row['status'],
-            error_message=row['error'],
-            total_cookies=row['total_cookies'] or 0,
-            first_party_cookies=cookie_counts['first_party'] or 0,
-            third_party_cookies=cookie_counts['third_party'] or 0,
-            scan_duration_seconds=row['duration_seconds'] or 0,
-            pages_scanned=row['page_count'] or 0,
-            cookies=cookies,
-            storage_data={},
-            created_at=row['created_at'],
-            updated_at=row['updated_at']
+    redis_client = getattr(request.app.state, "async_redis_client", None)
+    cached = await _get_cached_scan(redis_client, scan_id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    
+    # Concurrent misses for the same scan share one database fetch
+    body = await _singleflight(
+        scan_id,
+        lambda: _load_scan_body(request.app.state.db_pool, redis_client, scan_id)
+    )
+    if body is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Scan with ID {scan_id} not found"
         )
+    return Response(content=body, media_type="application/json")
 
 
 @router.get(
@@ -314,13 +500,20 @@ async def list_scans(
     domain: Optional[str] = Query(default=None, description="Filter by domain"),
     status_filter: Optional[ScanStatus] = Query(default=None, alias="status", description="Filter by status"),
     scan_mode: Optional[ScanMode] = Query(default=None, description="Filter by scan mode"),
+    cursor: Optional[UUID4] = Query(
+        default=None,
+        description="scan_id of the last item on the previous page (next_cursor); replaces page"
+    ),
     current_user: TokenData = Depends(require_scope("scans:read"))
 ):
     """
     List scans with pagination.
     
     Returns a paginated list of scans with optional filtering by domain,
-    status, and scan mode.
+    status, and scan mode. Pages are selected either by page number or,
+    for deep pages, by cursor (the next_cursor of the previous page), which
+    seeks straight to the page instead of skipping OFFSET rows. Cursor
+    pages don't compute total.
     
     **Required scope**: `scans:read`
     """
@@ -333,83 +526,106 @@ async def list_scans(
     param_count = 1
     
     if domain:
-        where_clauses.append(f"domain ILIKE ${param_count}")
+        where_clauses.append(f"sr.domain ILIKE ${param_count}")
         params.append(f"%{domain}%")
         param_count += 1
     
     if status_filter:
-        where_clauses.append(f"status = ${param_count}")
+        where_clauses.append(f"sr.status = ${param_count}")
         params.append(status_filter)
         param_count += 1
     
     if scan_mode:
-        where_clauses.append(f"scan_mode = ${param_count}")
+        where_clauses.append(f"sr.scan_mode = ${param_count}")
         params.append(scan_mode)
         param_count += 1
     
-    where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+    filter_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
     
     async with db_pool.acquire() as conn:
-        # Get total count
-        count_query = f"SELECT COUNT(*) FROM scan_results {where_sql}"
-        total = await conn.fetchval(count_query, *params)
-        
-        # Get paginated results
-        query = f"""
-            SELECT 
-                scan_id, domain_config_id, domain, scan_mode, timestamp_utc,
-                status, error, total_cookies, duration_seconds, page_count,
-                created_at, updated_at, params
-            FROM scan_results
-            {where_sql}
-            ORDER BY created_at DESC
-            LIMIT ${param_count} OFFSET ${param_count + 1}
-        """
-        params.extend([page_size, offset])
-        
-        rows = await conn.fetch(query, *params)
-        
-        # Convert rows to ScanResult objects
-        items = []
-        for row in rows:
-            # Get cookie counts by type
-            cookie_counts = await conn.fetchrow(
-                """
-                SELECT 
-                    COUNT(*) FILTER (WHERE cookie_type = 'First Party') as first_party,
-                    COUNT(*) FILTER (WHERE cookie_type = 'Third Party') as third_party
-                FROM cookies
-                WHERE scan_id = $1
-                """,
-                row['scan_id']
+        if cursor:
+            # Keyset page: seek past the cursor row on the
+            # (created_at, scan_id) index; one extra row tells whether
+            # another page follows
+            where_clauses.append(
+                f"(sr.created_at, sr.scan_id) < "
+                f"(SELECT created_at, scan_id FROM scan_results WHERE scan_id = ${param_count})"
             )
+            params.append(cursor)
+            param_count += 1
+            query = f"""
+                SELECT {_LIST_SCAN_COLUMNS}
+                FROM scan_results sr
+                WHERE {' AND '.join(where_clauses)}
+                ORDER BY sr.created_at DESC, sr.scan_id DESC
+                LIMIT ${param_count}
+            """
+            rows = await conn.fetch(query, *params, page_size + 1)
+            # An unknown cursor (e.g. its scan was deleted between pages)
+            # makes the seek match nothing; report it instead of ending
+            # pagination with an empty page
+            if not rows and not await conn.fetchval(_SCAN_EXISTS_SQL, cursor):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unknown cursor {cursor}"
+                )
+            has_next = len(rows) > page_size
+            rows = rows[:page_size]
+            total = None
+        else:
+            # Cookie counts are stored on the scan row, and the total
+            # filtered count rides along as a window column - one
+            # round-trip for the page
+            query = f"""
+                SELECT {_LIST_SCAN_COLUMNS},
+                    COUNT(*) OVER () AS total_count
+                FROM scan_results sr
+                {filter_sql}
+                ORDER BY sr.created_at DESC, sr.scan_id DESC
+                LIMIT ${param_count} OFFSET ${param_count + 1}
+            """
+            rows = await conn.fetch(query, *params, page_size, offset)
             
-            items.append(ScanResult(
-                scan_id=row['scan_id'],
-                domain_config_id=row['domain_config_id'],
-                domain=row['domain'],
-                scan_mode=row['scan_mode'],
-                timestamp_utc=row['timestamp_utc'],
-                status=row['status'],
-                error_message=row['error'],
-                total_cookies=row['total_cookies'] or 0,
-                first_party_cookies=cookie_counts['first_party'] or 0,
-                third_party_cookies=cookie_counts['third_party'] or 0,
-                scan_duration_seconds=row['duration_seconds'] or 0,
-                pages_scanned=row['page_count'] or 0,
-                cookies=[],  # Don't load full cookie data in list view
-                storage_data={},
-                created_at=row['created_at'],
-                updated_at=row['updated_at']
-            ))
+            if rows:
+                total = rows[0]['total_count']
+            elif offset:
+                # Past the last page: no rows to carry the window count
+                count_query = f"SELECT COUNT(*) FROM scan_results sr {filter_sql}"
+                total = await conn.fetchval(count_query, *params)
+            else:
+                total = 0
+            has_next = (offset + page_size) < total
+    
+    # Convert rows to ScanResult objects (trusted rows, no re-validation)
+    items = [
+        ScanResult.from_trusted(
+            scan_id=row['scan_id'],
+            domain_config_id=row['domain_config_id'],
+            domain=row['domain'],
+            scan_mode=row['scan_mode'],
+            timestamp_utc=row['timestamp_utc'],
+            status=row['status'],
+            error=row['error'],
+            total_cookies=row['total_cookies'] or 0,
+            first_party_cookies=row['first_party_cookies'],
+            third_party_cookies=row['third_party_cookies'],
+            duration_seconds=row['duration_seconds'],
+            page_count=row['page_count'] or 0,
+            cookies=[],  # Don't load full cookie data in list view
+            created_at=row['created_at'],
+            updated_at=row['updated_at']
+        )
+        for row in rows
+    ]
     
     return PaginatedScansResponse(
         items=items,
         total=total,
         page=page,
         page_size=page_size,
-        has_next=(offset + page_size) < total,
-        has_prev=page > 1
+        has_next=has_next,
+        has_prev=bool(cursor) or page > 1,
+        next_cursor=rows[-1]['scan_id'] if has_next else None
     )
 
 
@@ -442,19 +658,14 @@ async def delete_scan(
     
     async with db_pool.acquire() as conn:
         # Check if scan exists and get status
-        row = await conn.fetchrow(
-            "SELECT scan_id, status FROM scan_results WHERE scan_id = $1",
-            scan_id
-        )
+        scan_status = await conn.fetchval(_SELECT_SCAN_STATUS_SQL, scan_id)
         
-        if not row:
+        if scan_status is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Scan with ID {scan_id} not found"
             )
         
-        scan_status = row['status']
-        
         # If scan is running or pending, cancel it
         if scan_status in [ScanStatus.PENDING, ScanStatus.RUNNING]:
             try:
@@ -463,30 +674,15 @@ async def delete_scan(
             except Exception as e:
                 logger.error(f"Failed to queue scan cancellation: {e}")
                 # Still try to update status directly
-                await conn.execute(
-                    """
-                    UPDATE scan_results
-                    SET status = 'cancelled', updated_at = NOW()
-                    WHERE scan_id = $1
-                    """,
-                    scan_id
-                )
+                await conn.execute(_CANCEL_SCAN_SQL, scan_id)
         else:
-            # For completed scans, delete from database
-            # Delete cookies first (foreign key constraint)
-            await conn.execute(
-                "DELETE FROM cookies WHERE scan_id = $1",
-                scan_id
-            )
-            
-            # Delete scan result
-            await conn.execute(
-                "DELETE FROM scan_results WHERE scan_id = $1",
-                scan_id
-            )
+            # For completed scans, delete the scan and its cookies
+            await conn.execute(_DELETE_SCAN_SQL, scan_id)
             
             logger.info(f"Scan {scan_id} deleted from database")
     
+    await _invalidate_scan(getattr(request.app.state, "async_redis_client", None), scan_id)
+    
     return None  # 204 No Content
 
 
@@ -518,39 +714,20 @@ async def delete_scan_by_domain(
     db_pool = request.app.state.db_pool
 
     async with db_pool.acquire() as conn:
-        # Get most recent scan for this domain
-        row = await conn.fetchrow(
-            """
-            SELECT scan_id FROM scan_results
-            WHERE domain = $1
-            ORDER BY created_at DESC
-            LIMIT 1
-            """,
-            domain
-        )
+        # Find and delete the most recent scan for this domain, with its
+        # cookies, in one statement
+        scan_id = await conn.fetchval(_DELETE_LATEST_DOMAIN_SCAN_SQL, domain)
 
-        if not row:
+        if scan_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No scan found for domain: {domain}"
             )
 
-        scan_id = row['scan_id']
-
-        # Delete cookies first (foreign key constraint)
-        await conn.execute(
-            "DELETE FROM cookies WHERE scan_id = $1",
-            scan_id
-        )
-
-        # Delete scan result
-        await conn.execute(
-            "DELETE FROM scan_results WHERE scan_id = $1",
-            scan_id
-        )
-
         logger.info(f"Deleted most recent scan for domain {domain} (scan_id: {scan_id})")
 
+    await _invalidate_scan(getattr(request.app.state, "async_redis_client", None), scan_id)
+
     return None  # 204 No Content
 
 
@@ -592,8 +769,8 @@ async def get_scan_progress(
 )
 async def stream_scan_progress(
     scan_id: UUID4,
-    current_user: TokenData = Depends(require_scope("scans:read")),
-    scan_service: ScanService = Depends(get_scan_service)
+    request: Request,
+    current_user: TokenData = Depends(require_scope("scans:read"))
 ):
     """
     Stream real-time scan progress via Server-Sent Events (SSE).
@@ -619,39 +796,57 @@ async def stream_scan_progress(
     }
     ```
     """
+    redis = getattr(request.app.state, "async_redis_client", None)
+    db_pool = request.app.state.db_pool
+    
     async def event_generator():
-        """Generate SSE events for scan progress."""
-        last_progress = None
+        """Relay progress updates published by the scan worker."""
+        if redis is None:
+            yield "event: error\ndata: Progress streaming unavailable\n\n"
+            return
         
-        # Keep streaming until scan completes or fails
-        while True:
-            progress = await scan_service.get_scan_progress(scan_id)
-            
-            if not progress:
-                # Scan not found or completed
-                if last_progress and last_progress.status in [ScanStatus.SUCCESS, ScanStatus.FAILED, ScanStatus.CANCELLED]:
-                    # Send final event and close
-                    yield f"data: {json.dumps(last_progress.dict())}\n\n"
+        channel = scan_progress_channel(scan_id)
+        pubsub = redis.pubsub()
+        # Subscribe before reading the snapshot so no update falls in between
+        await pubsub.subscribe(channel)
+        
+        try:
+            snapshot = await redis.get(channel)
+            if snapshot is not None:
+                yield f"data: {snapshot}\n\n"
+                if orjson.loads(snapshot)['status'] in _FINAL_SCAN_STATUSES:
                     yield "event: close\ndata: Scan completed\n\n"
-                else:
-                    # Scan not found
-                    yield f"event: error\ndata: Scan not found\n\n"
-                break
-            
-            # Send progress update
-            progress_json = progress.dict()
-            progress_json['timestamp'] = progress_json['timestamp'].isoformat()
-            yield f"data: {json.dumps(progress_json)}\n\n"
-            
-            last_progress = progress
-            
-            # Check if scan is complete
-            if progress.status in [ScanStatus.SUCCESS, ScanStatus.FAILED, ScanStatus.CANCELLED]:
-                yield "event: close\ndata: Scan completed\n\n"
-                break
+                    return
+            else:
+                async with db_pool.acquire() as conn:
+                    scan_status = await conn.fetchval(_SELECT_SCAN_STATUS_SQL, scan_id)
+                if scan_status is None:
+                    yield "event: error\ndata: Scan not found\n\n"
+                    return
+                if scan_status in _FINAL_SCAN_STATUSES:
+                    yield "event: close\ndata: Scan completed\n\n"
+                    return
             
-            # Wait before next update (2 seconds as per requirements)
-            await asyncio.sleep(2)
+            # Updates arrive as the worker publishes them; comment lines
+            # keep proxies from closing the connection in quiet stretches
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=SSE_KEEPALIVE_INTERVAL
+                )
+                if message is None:
+                    yield ": keepalive\n\n"
+                    continue
+                
+                payload = message['data']
+                yield f"data: {payload}\n\n"
+                
+                if orjson.loads(payload)['status'] in _FINAL_SCAN_STATUSES:
+                    yield "event: close\ndata: Scan completed\n\n"
+                    break
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
     
     return StreamingResponse(
         event_generator(),
@@ -685,8 +880,8 @@ async def batch_scan_domains(
     **Required scope**: `scans:write`
     
     **Features**:
-    - Parallel execution with semaphore-based concurrency control
-    - Automatic error handling for individual scan failures
+    - Scans are queued on the scan workers as one Celery group
+    - The group ID is returned as `batch_id`
     - Support for custom scan parameters per domain
     - Optional scan profile application
     
@@ -708,18 +903,19 @@ async def batch_scan_domains(
         for d in request.domains
     ]
     
-    # Execute parallel scans
-    results = await parallel_manager.scan_multiple_domains(
+    # Create the scan records and queue them on the workers as one group
+    batch_id, results = await parallel_manager.enqueue_multiple_domains(
         domains=domains,
         scan_mode=request.scan_mode,
         profile=None  # TODO: Load profile if profile_id provided
     )
     
-    # Count successes and failures
-    successful = sum(1 for r in results if r.get("status") == "success")
+    # Count queued scans and failures
+    successful = sum(1 for r in results if r.get("status") == "queued")
     failed = len(results) - successful
     
     return BatchScanResponse(
+        batch_id=batch_id,
         total_domains=len(domains),
         successful=successful,
         failed=failed,
@@ -20,6 +20,9 @@ class DatabaseConfig(BaseSettings):
     url: str = Field(..., validation_alias='DATABASE_URL')
     pool_size: int = Field(default=10, ge=1, le=100)
     max_overflow: int = Field(default=20, ge=0, le=100)
+    pool_min_size: int = Field(default=5, ge=0, le=100)
+    sync_pool_min_size: int = Field(default=1, ge=0, le=100)
+    statement_cache_size: int = Field(default=1024, ge=0)
     pool_pre_ping: bool = Field(default=True)
     echo: bool = Field(default=False)
 
@@ -80,6 +83,7 @@ class ScanConfig(BaseSettings):
     max_depth_default: int = Field(default=5, ge=0, le=10)
     max_retry_default: int = Field(default=3, ge=0, le=5)
     default_button_selector: str = Field(default='button[data-role="accept"]')
+    domain_rate_limit: int = Field(default=0, ge=0)  # scans per domain per minute, 0 (default) disables
 
 
 class NotificationConfig(BaseSettings):
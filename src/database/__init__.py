@@ -16,7 +16,8 @@ from .batch_operations import (
 from .query_optimizer import (
     QueryOptimizer,
     get_query_optimizer,
-    init_query_optimizer
+    init_query_optimizer,
+    set_query_optimizer
 )
 
 __all__ = [
@@ -30,4 +31,5 @@ __all__ = [
     'QueryOptimizer',
     'get_query_optimizer',
     'init_query_optimizer',
+    'set_query_optimizer',
 ]
@@ -378,6 +378,13 @@ class BatchOperations:
                 self.db.execute_query(query, fetch=False)
                 logger.info(f"Refreshed materialized view: {view}")
             
+            # Don't keep serving pre-refresh summaries from this process
+            from .query_optimizer import get_query_optimizer
+            try:
+                get_query_optimizer().invalidate_mv_cache()
+            except RuntimeError:
+                pass
+            
             return True
         except Exception as e:
             logger.error(f"Failed to refresh materialized views: {e}")
@@ -4,7 +4,8 @@ Database connection management with connection pooling.
 
 import os
 import logging
-from typing import Optional
+from typing import Dict, Optional
+from weakref import WeakKeyDictionary
 import psycopg2
 from psycopg2 import pool
 from psycopg2.extras import RealDictCursor
@@ -38,6 +39,8 @@ class DatabaseConnection:
         self.min_connections = min_connections
         self.max_connections = max_connections
         self.pool = None
+        # Names of the statements prepared on each physical connection
+        self._prepared: "WeakKeyDictionary[object, set[str]]" = WeakKeyDictionary()
         self._initialize_pool()
     
     def _initialize_pool(self):
@@ -88,13 +91,39 @@ class DatabaseConnection:
         except Exception as e:
             logger.error(f"Failed to return connection to pool: {e}")
     
+    def get_pool_stats(self) -> Dict[str, int]:
+        """
+        Get connection pool statistics.
+        
+        Returns:
+            Dict with pool bounds and current used/idle connection counts
+        """
+        if self.pool is None:
+            return {}
+        
+        # psycopg2 has no public pool stats; ThreadedConnectionPool keeps
+        # checked-out connections in _used and idle ones in _pool. These are
+        # internals, so a missing attribute reports zero instead of failing
+        return {
+            'min_size': self.min_connections,
+            'max_size': self.max_connections,
+            'pool_used': len(getattr(self.pool, '_used', ())),
+            'pool_free': len(getattr(self.pool, '_pool', ()))
+        }
+    
     def close_all_connections(self):
         """Close all connections in the pool."""
         if self.pool is not None:
             self.pool.closeall()
             logger.info("All database connections closed")
     
-    def execute_query(self, query: str, params: tuple = None, fetch: bool = True):
+    def execute_query(
+        self,
+        query: str,
+        params: tuple = None,
+        fetch: bool = True,
+        fetch_one: bool = False
+    ):
         """
         Execute a query and return results.
         
@@ -102,15 +131,19 @@ class DatabaseConnection:
             query: SQL query
             params: Query parameters
             fetch: Whether to fetch results
+            fetch_one: Fetch only the first row (takes precedence over fetch)
             
         Returns:
-            Query results if fetch=True, None otherwise
+            First row (or None) if fetch_one=True, query results if
+            fetch=True, None otherwise
         """
         conn = None
         try:
             conn = self.get_connection()
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
                 cur.execute(query, params)
+                if fetch_one:
+                    return cur.fetchone()
                 if fetch:
                     return cur.fetchall()
                 conn.commit()
@@ -124,6 +157,111 @@ class DatabaseConnection:
             if conn:
                 self.return_connection(conn)
     
+    def execute_prepared(
+        self,
+        name: str,
+        query: str,
+        params: tuple = (),
+        fetch: bool = True,
+        fetch_one: bool = False
+    ):
+        """
+        Execute a query as a named server-side prepared statement.
+        
+        The statement is prepared the first time it runs on each pooled
+        connection; later calls only send EXECUTE, so PostgreSQL skips
+        parsing and planning.
+        
+        Args:
+            name: Statement name, unique per query text
+            query: SQL query with $1..$N placeholders
+            params: Query parameters, in placeholder order
+            fetch: Whether to fetch results
+            fetch_one: Fetch only the first row (takes precedence over fetch)
+            
+        Returns:
+            First row (or None) if fetch_one=True, query results if
+            fetch=True, None otherwise
+        """
+        conn = None
+        try:
+            conn = self.get_connection()
+            prepared = self._prepared.setdefault(conn, set())
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                if name not in prepared:
+                    cur.execute(f"PREPARE {name} AS {query}")
+                    prepared.add(name)
+                if params:
+                    placeholders = ", ".join(["%s"] * len(params))
+                    cur.execute(f"EXECUTE {name} ({placeholders})", params)
+                else:
+                    cur.execute(f"EXECUTE {name}")
+                if fetch_one:
+                    return cur.fetchone()
+                if fetch:
+                    return cur.fetchall()
+                conn.commit()
+                return None
+        except Exception as e:
+            if conn:
+                conn.rollback()
+                self._reset_prepared(conn)
+            logger.error(f"Prepared query {name} failed: {e}")
+            raise
+        finally:
+            if conn:
+                self.return_connection(conn)
+    
+    def prepare_statements(self, statements) -> int:
+        """
+        PREPARE named statements on the pool's idle connections ahead of use.
+        
+        Takes up to min_connections connections from the pool so the
+        statements are ready on each of them; execute_prepared() then skips
+        the PREPARE. A statement that fails to prepare (e.g. its table is
+        not migrated yet) is skipped and prepared lazily later.
+        
+        Args:
+            statements: Iterable of (name, query) pairs
+            
+        Returns:
+            Number of statements prepared
+        """
+        statements = list(statements)
+        conns = []
+        count = 0
+        try:
+            for _ in range(self.min_connections):
+                conns.append(self.get_connection())
+            for conn in conns:
+                prepared = self._prepared.setdefault(conn, set())
+                for name, query in statements:
+                    if name in prepared:
+                        continue
+                    try:
+                        with conn.cursor() as cur:
+                            cur.execute(f"PREPARE {name} AS {query}")
+                        conn.commit()
+                        prepared.add(name)
+                        count += 1
+                    except Exception as e:
+                        conn.rollback()
+                        logger.warning(f"Could not prepare {name}: {e}")
+        finally:
+            for conn in conns:
+                self.return_connection(conn)
+        return count
+    
+    def _reset_prepared(self, conn):
+        """Drop a connection's prepared statements so they are prepared again on next use."""
+        self._prepared.pop(conn, None)
+        try:
+            with conn.cursor() as cur:
+                cur.execute("DEALLOCATE ALL")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+    
     def execute_many(self, query: str, params_list: list):
         """
         Execute a query multiple times with different parameters.
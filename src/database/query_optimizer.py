@@ -5,17 +5,301 @@ This module provides pre-optimized queries for common operations,
 using best practices for PostgreSQL performance.
 """
 
+import functools
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterator
 from datetime import datetime, timedelta
 
+from psycopg2.extras import Json
+
 logger = logging.getLogger(__name__)
 
+_DASHBOARD_KEYS = ('active', 'pending', 'failed', 'upcoming')
+
+MV_CACHE_SIZE = 256
+MV_CACHE_TTL = 60  # seconds
+
+
+_RECENT_SCANS_KEYSET_SQL = """
+    SELECT
+        scan_id, domain_config_id, domain, scan_mode,
+        timestamp_utc, status, duration_seconds, total_cookies,
+        page_count, created_at
+    FROM scan_results
+    WHERE ($1::text IS NULL OR status = $1::text)
+        AND ($2::text IS NULL OR domain = $2::text)
+        AND (timestamp_utc, scan_id) < ($3::timestamp, $4::uuid)
+    -- index-only scan on idx_scan_results_listing (migration 012)
+    ORDER BY timestamp_utc DESC, scan_id DESC
+    LIMIT $5
+"""
+
+_RECENT_SCANS_SQL = """
+    SELECT
+        scan_id, domain_config_id, domain, scan_mode,
+        timestamp_utc, status, duration_seconds, total_cookies,
+        page_count, created_at
+    FROM scan_results
+    WHERE ($1::text IS NULL OR status = $1::text)
+        AND ($2::text IS NULL OR domain = $2::text)
+    -- index-only scan on idx_scan_results_listing (migration 012)
+    ORDER BY timestamp_utc DESC, scan_id DESC
+    LIMIT $3 OFFSET $4
+"""
+
+_SCAN_SQL = """
+    SELECT
+        scan_id, domain_config_id, domain, scan_mode,
+        timestamp_utc, status, duration_seconds, total_cookies,
+        page_count, error, params, created_at
+    FROM scan_results
+    WHERE scan_id = $1
+"""
+
+_SCAN_WITH_COOKIES_SQL = """
+    SELECT
+        sr.scan_id, sr.domain_config_id, sr.domain, sr.scan_mode,
+        sr.timestamp_utc, sr.status, sr.duration_seconds, sr.total_cookies,
+        sr.page_count, sr.error, sr.params, sr.created_at,
+        COALESCE(
+            (
+                SELECT json_agg(
+                    json_build_object(
+                        'cookie_id', c.cookie_id,
+                        'name', c.name,
+                        'domain', c.domain,
+                        'path', c.path,
+                        'category', c.category,
+                        'cookie_type', c.cookie_type,
+                        'vendor', c.vendor,
+                        'http_only', c.http_only,
+                        'secure', c.secure,
+                        'same_site', c.same_site,
+                        'size', c.size,
+                        'cookie_duration', c.cookie_duration
+                    ) ORDER BY c.name
+                )
+                FROM cookies c
+                WHERE c.scan_id = sr.scan_id
+            ),
+            '[]'::json
+        ) as cookies
+    FROM scan_results sr
+    WHERE sr.scan_id = $1
+"""
+
+_DOMAIN_HISTORY_SQL = """
+    SELECT
+        scan_id, domain, scan_mode, timestamp_utc,
+        status, duration_seconds, total_cookies, page_count
+    FROM scan_results
+    WHERE domain = $1
+        AND timestamp_utc >= NOW() - make_interval(days => $2::int)
+    ORDER BY timestamp_utc DESC
+    LIMIT $3
+"""
+
+_COOKIE_STATS_ROW_SQL = """
+    SELECT
+        total_cookies, unique_cookies, first_party, third_party,
+        necessary, functional, analytics, advertising,
+        http_only_count, secure_count, unique_vendors, avg_size
+    FROM scan_cookie_stats
+    WHERE scan_id = $1
+"""
+
+_COOKIE_STATS_SQL = """
+    SELECT
+        COUNT(*) as total_cookies,
+        COUNT(DISTINCT name) as unique_cookies,
+        COUNT(CASE WHEN cookie_type = 'First Party' THEN 1 END) as first_party,
+        COUNT(CASE WHEN cookie_type = 'Third Party' THEN 1 END) as third_party,
+        COUNT(CASE WHEN category = 'Necessary' THEN 1 END) as necessary,
+        COUNT(CASE WHEN category = 'Functional' THEN 1 END) as functional,
+        COUNT(CASE WHEN category = 'Analytics' THEN 1 END) as analytics,
+        COUNT(CASE WHEN category = 'Advertising' THEN 1 END) as advertising,
+        COUNT(CASE WHEN http_only = TRUE THEN 1 END) as http_only_count,
+        COUNT(CASE WHEN secure = TRUE THEN 1 END) as secure_count,
+        COUNT(DISTINCT vendor) FILTER (WHERE vendor IS NOT NULL) as unique_vendors,
+        AVG(size) FILTER (WHERE size IS NOT NULL) as avg_size
+    FROM cookies
+    WHERE scan_id = $1
+"""
+
+_DOMAIN_SUMMARY_SQL = """
+    SELECT *
+    FROM mv_domain_scan_summary
+    WHERE domain = $1
+"""
+
+_DOMAIN_SUMMARIES_SQL = """
+    SELECT *
+    FROM mv_domain_scan_summary
+    ORDER BY last_scan_time DESC
+    LIMIT $1
+"""
+
+_ACTIVE_SCANS_SQL = """
+    SELECT
+        scan_id, domain, scan_mode, timestamp_utc, status
+    FROM scan_results
+    WHERE status IN ('pending', 'running')
+    ORDER BY timestamp_utc DESC
+"""
+
+_FAILED_JOBS_SQL = """
+    SELECT
+        execution_id, schedule_id, job_id, domain,
+        started_at, completed_at, duration_seconds,
+        error_message
+    FROM job_executions
+    WHERE status = 'failed'
+        AND started_at >= NOW() - make_interval(hours => $1::int)
+    ORDER BY started_at DESC
+    LIMIT $2
+"""
+
+_PENDING_NOTIFICATIONS_CONTAINING_SQL = """
+    SELECT
+        notification_id, user_id, event, channel,
+        created_at, retry_count, data
+    FROM notifications
+    WHERE status = 'pending'
+        AND data @> $2::jsonb
+    ORDER BY created_at
+    LIMIT $1
+"""
+
+_PENDING_NOTIFICATIONS_SQL = """
+    SELECT
+        notification_id, user_id, event, channel,
+        created_at, retry_count, data
+    FROM notifications
+    WHERE status = 'pending'
+    ORDER BY created_at
+    LIMIT $1
+"""
+
+_UPCOMING_SCHEDULES_SQL = """
+    SELECT
+        schedule_id, domain_config_id, domain, frequency,
+        time_config, next_run, last_run, last_status
+    FROM schedules
+    WHERE enabled = TRUE
+        AND next_run IS NOT NULL
+        AND next_run <= NOW() + make_interval(hours => $1::int)
+    ORDER BY next_run
+    LIMIT $2
+"""
+
+_DASHBOARD_SNAPSHOT_SQL = """
+    SELECT
+        (
+            SELECT json_agg(a ORDER BY a.timestamp_utc DESC)
+            FROM (
+                SELECT scan_id, domain, scan_mode, timestamp_utc, status
+                FROM scan_results
+                WHERE status IN ('pending', 'running')
+            ) a
+        ) AS active,
+        (
+            SELECT json_agg(p ORDER BY p.created_at)
+            FROM (
+                SELECT
+                    notification_id, user_id, event, channel,
+                    created_at, retry_count, data
+                FROM notifications
+                WHERE status = 'pending'
+                ORDER BY created_at
+                LIMIT $2
+            ) p
+        ) AS pending,
+        (
+            SELECT json_agg(f ORDER BY f.started_at DESC)
+            FROM (
+                SELECT
+                    execution_id, schedule_id, job_id, domain,
+                    started_at, completed_at, duration_seconds,
+                    error_message
+                FROM job_executions
+                WHERE status = 'failed'
+                    AND started_at >= NOW() - make_interval(hours => $1::int)
+                ORDER BY started_at DESC
+                LIMIT $2
+            ) f
+        ) AS failed,
+        (
+            SELECT json_agg(u ORDER BY u.next_run)
+            FROM (
+                SELECT
+                    schedule_id, domain_config_id, domain, frequency,
+                    time_config, next_run, last_run, last_status
+                FROM schedules
+                WHERE enabled = TRUE
+                    AND next_run IS NOT NULL
+                    AND next_run <= NOW() + make_interval(hours => $1::int)
+                ORDER BY next_run
+                LIMIT $2
+            ) u
+        ) AS upcoming
+"""
+
+# Fixed statements, prepared per connection under these names
+PREPARED_STATEMENTS: Tuple[Tuple[str, str], ...] = (
+    ("qo_recent_scans_keyset", _RECENT_SCANS_KEYSET_SQL),
+    ("qo_recent_scans", _RECENT_SCANS_SQL),
+    ("qo_scan", _SCAN_SQL),
+    ("qo_scan_with_cookies", _SCAN_WITH_COOKIES_SQL),
+    ("qo_domain_history", _DOMAIN_HISTORY_SQL),
+    ("qo_cookie_stats_row", _COOKIE_STATS_ROW_SQL),
+    ("qo_cookie_stats", _COOKIE_STATS_SQL),
+    ("qo_domain_summary", _DOMAIN_SUMMARY_SQL),
+    ("qo_domain_summaries", _DOMAIN_SUMMARIES_SQL),
+    ("qo_active_scans", _ACTIVE_SCANS_SQL),
+    ("qo_failed_jobs", _FAILED_JOBS_SQL),
+    ("qo_pending_notifications_containing", _PENDING_NOTIFICATIONS_CONTAINING_SQL),
+    ("qo_pending_notifications", _PENDING_NOTIFICATIONS_SQL),
+    ("qo_upcoming_schedules", _UPCOMING_SCHEDULES_SQL),
+    ("qo_dashboard_snapshot", _DASHBOARD_SNAPSHOT_SQL),
+)
+
+
+def _db_call(default: Callable[[], Any], label: str):
+    """
+    Log and swallow database errors raised by a QueryOptimizer method.
+    
+    Args:
+        default: Factory for the value returned when the query fails
+        label: What the method does, for the error log
+    """
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(f"Failed to {label}: {e}")
+                return default()
+        return wrapper
+    return deco
+
 
 class QueryOptimizer:
     """
     Provides optimized query patterns for common database operations.
     
+    Fixed-text queries run as named prepared statements (see
+    DatabaseConnection.execute_prepared), so PostgreSQL parses and plans
+    each one once per pooled connection. Rows come back from a
+    RealDictCursor and are returned as-is; they are already dicts.
+    
     Uses techniques like:
     - Proper index usage
     - Query result limiting
@@ -32,63 +316,89 @@ class QueryOptimizer:
             db_connection: DatabaseConnection instance
         """
         self.db = db_connection
+        
+        # (domain, limit) -> (expires_at, rows) for get_domain_summary_from_mv
+        self._mv_cache: "OrderedDict[Tuple[Optional[str], int], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        # Guards _mv_cache and _mv_key_locks; held only for dict operations
+        self._mv_cache_lock = threading.Lock()
+        # Per-key locks so a miss only waits on a query for the same key
+        self._mv_key_locks: Dict[Tuple[Optional[str], int], threading.Lock] = {}
+    
+    def _prewarm(self):
+        """
+        Prepare every fixed statement and load the domain summary view.
+        
+        Moves the parse/plan cost and the first materialized view read
+        (which also fills the in-process MV cache) from the first
+        dashboard request to startup.
+        """
+        try:
+            count = self.db.prepare_statements(PREPARED_STATEMENTS)
+            self.get_domain_summary_from_mv()
+            logger.info(f"Query optimizer prewarmed ({count} statements prepared)")
+        except Exception as e:
+            logger.warning(f"Query optimizer prewarm failed: {e}")
     
+    @_db_call(lambda: ([], None), "get recent scans")
     def get_recent_scans_optimized(
         self,
         limit: int = 100,
         offset: int = 0,
         status: Optional[str] = None,
-        domain: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+        domain: Optional[str] = None,
+        cursor: Optional[Tuple[datetime, str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[datetime, str]]]:
         """
         Get recent scans with optimized query.
         
-        Uses covering index and efficient filtering.
+        Uses covering index and efficient filtering. Every selected column
+        is in idx_scan_results_listing, so the expected plan is an
+        ``Index Only Scan`` on it with the status/domain filters applied to
+        the included columns (``Heap Fetches`` stays near zero while
+        autovacuum keeps the visibility map current).
+        
+        Pass the returned cursor back to fetch the next page; the query
+        then seeks past the previous page's last (timestamp_utc, scan_id)
+        instead of scanning and discarding OFFSET rows.
         
         Args:
             limit: Maximum results
-            offset: Pagination offset
+            offset: Pagination offset (deprecated, use cursor)
             status: Filter by status (optional)
             domain: Filter by domain (optional)
+            cursor: (timestamp_utc, scan_id) of the last row of the
+                previous page (optional)
             
         Returns:
-            List of scan result dicts
-        """
-        # Build query with optional filters
-        where_clauses = []
-        params = []
-        
-        if status:
-            where_clauses.append("status = %s")
-            params.append(status)
-        
-        if domain:
-            where_clauses.append("domain = %s")
-            params.append(domain)
-        
-        where_clause = " AND ".join(where_clauses) if where_clauses else "TRUE"
-        
-        # Optimized query using appropriate indexes
-        query = f"""
-            SELECT 
-                scan_id, domain_config_id, domain, scan_mode,
-                timestamp_utc, status, duration_seconds, total_cookies,
-                page_count, created_at
-            FROM scan_results
-            WHERE {where_clause}
-            ORDER BY timestamp_utc DESC
-            LIMIT %s OFFSET %s
+            Tuple of (list of scan result dicts, cursor for the next page
+            or None when there are no more rows)
         """
-        
-        params.extend([limit, offset])
-        
-        try:
-            result = self.db.execute_query(query, tuple(params), fetch=True)
-            return [dict(row) for row in result] if result else []
-        except Exception as e:
-            logger.error(f"Failed to get recent scans: {e}")
-            return []
+        # One static statement per pagination mode for every filter
+        # combination: unused filters are passed as NULL, so the prepared
+        # plan is reused whichever filters are set
+        if cursor is not None:
+            query = _RECENT_SCANS_KEYSET_SQL
+            name = "qo_recent_scans_keyset"
+            params = (status or None, domain or None, cursor[0], cursor[1], limit)
+        else:
+            if offset:
+                logger.warning(
+                    "get_recent_scans_optimized offset pagination is deprecated; "
+                    "pass the returned cursor instead"
+                )
+            query = _RECENT_SCANS_SQL
+            name = "qo_recent_scans"
+            params = (status or None, domain or None, limit, offset)
+        
+        result = self.db.execute_prepared(name, query, params) or []
+        
+        next_cursor = None
+        if len(result) == limit:
+            last = result[-1]
+            next_cursor = (last['timestamp_utc'], str(last['scan_id']))
+        return result, next_cursor
     
+    @_db_call(lambda: None, "get scan with cookies")
     def get_scan_with_cookies_optimized(
         self,
         scan_id: str,
@@ -97,7 +407,7 @@ class QueryOptimizer:
         """
         Get scan result with cookies using optimized query.
         
-        Uses single query with LEFT JOIN for efficiency.
+        Uses a single query with a correlated json_agg subquery.
         
         Args:
             scan_id: Scan ID
@@ -108,66 +418,21 @@ class QueryOptimizer:
         """
         if not include_cookies:
             # Simple query without cookies
-            query = """
-                SELECT 
-                    scan_id, domain_config_id, domain, scan_mode,
-                    timestamp_utc, status, duration_seconds, total_cookies,
-                    page_count, error, params, created_at
-                FROM scan_results
-                WHERE scan_id = %s
-            """
-            
-            try:
-                result = self.db.execute_query(query, (scan_id,), fetch=True)
-                if result:
-                    scan = dict(result[0])
-                    scan['cookies'] = []
-                    return scan
-                return None
-            except Exception as e:
-                logger.error(f"Failed to get scan {scan_id}: {e}")
-                return None
-        
-        # Optimized query with cookies using JSON aggregation
-        query = """
-            SELECT 
-                sr.scan_id, sr.domain_config_id, sr.domain, sr.scan_mode,
-                sr.timestamp_utc, sr.status, sr.duration_seconds, sr.total_cookies,
-                sr.page_count, sr.error, sr.params, sr.created_at,
-                COALESCE(
-                    json_agg(
-                        json_build_object(
-                            'cookie_id', c.cookie_id,
-                            'name', c.name,
-                            'domain', c.domain,
-                            'path', c.path,
-                            'category', c.category,
-                            'cookie_type', c.cookie_type,
-                            'vendor', c.vendor,
-                            'http_only', c.http_only,
-                            'secure', c.secure,
-                            'same_site', c.same_site,
-                            'size', c.size,
-                            'cookie_duration', c.cookie_duration
-                        ) ORDER BY c.name
-                    ) FILTER (WHERE c.cookie_id IS NOT NULL),
-                    '[]'::json
-                ) as cookies
-            FROM scan_results sr
-            LEFT JOIN cookies c ON sr.scan_id = c.scan_id
-            WHERE sr.scan_id = %s
-            GROUP BY sr.scan_id
-        """
-        
-        try:
-            result = self.db.execute_query(query, (scan_id,), fetch=True)
-            if result:
-                return dict(result[0])
-            return None
-        except Exception as e:
-            logger.error(f"Failed to get scan with cookies {scan_id}: {e}")
+            scan = self.db.execute_prepared(
+                "qo_scan", _SCAN_SQL, (scan_id,), fetch_one=True
+            )
+            if scan:
+                scan['cookies'] = []
+                return scan
             return None
+        
+        # Cookies are aggregated in a correlated subquery so the scan row
+        # needs no GROUP BY; idx_cookies_scan_id_name serves the ORDER BY
+        return self.db.execute_prepared(
+            "qo_scan_with_cookies", _SCAN_WITH_COOKIES_SQL, (scan_id,), fetch_one=True
+        )
     
+    @_db_call(list, "get domain scan history")
     def get_domain_scan_history_optimized(
         self,
         domain: str,
@@ -187,24 +452,12 @@ class QueryOptimizer:
         Returns:
             List of scan result dicts
         """
-        query = """
-            SELECT 
-                scan_id, domain, scan_mode, timestamp_utc,
-                status, duration_seconds, total_cookies, page_count
-            FROM scan_results
-            WHERE domain = %s
-                AND timestamp_utc >= NOW() - INTERVAL '%s days'
-            ORDER BY timestamp_utc DESC
-            LIMIT %s
-        """
-        
-        try:
-            result = self.db.execute_query(query, (domain, days, limit), fetch=True)
-            return [dict(row) for row in result] if result else []
-        except Exception as e:
-            logger.error(f"Failed to get scan history for {domain}: {e}")
-            return []
+        result = self.db.execute_prepared(
+            "qo_domain_history", _DOMAIN_HISTORY_SQL, (domain, days, limit)
+        )
+        return result or []
     
+    @_db_call(dict, "get cookie statistics")
     def get_cookie_statistics_optimized(
         self,
         scan_id: str
@@ -212,7 +465,9 @@ class QueryOptimizer:
         """
         Get cookie statistics for a scan using optimized aggregation.
         
-        Single query with multiple aggregations for efficiency.
+        Reads the row ScanService writes to scan_cookie_stats when the
+        scan's cookies are stored. Falls back to aggregating the cookies
+        table for scans without a stats row (e.g. still running).
         
         Args:
             scan_id: Scan ID
@@ -220,33 +475,18 @@ class QueryOptimizer:
         Returns:
             Dict with cookie statistics
         """
-        query = """
-            SELECT 
-                COUNT(*) as total_cookies,
-                COUNT(DISTINCT name) as unique_cookies,
-                COUNT(CASE WHEN cookie_type = 'First Party' THEN 1 END) as first_party,
-                COUNT(CASE WHEN cookie_type = 'Third Party' THEN 1 END) as third_party,
-                COUNT(CASE WHEN category = 'Necessary' THEN 1 END) as necessary,
-                COUNT(CASE WHEN category = 'Functional' THEN 1 END) as functional,
-                COUNT(CASE WHEN category = 'Analytics' THEN 1 END) as analytics,
-                COUNT(CASE WHEN category = 'Advertising' THEN 1 END) as advertising,
-                COUNT(CASE WHEN http_only = TRUE THEN 1 END) as http_only_count,
-                COUNT(CASE WHEN secure = TRUE THEN 1 END) as secure_count,
-                COUNT(DISTINCT vendor) FILTER (WHERE vendor IS NOT NULL) as unique_vendors,
-                AVG(size) FILTER (WHERE size IS NOT NULL) as avg_size
-            FROM cookies
-            WHERE scan_id = %s
-        """
+        stats = self.db.execute_prepared(
+            "qo_cookie_stats_row", _COOKIE_STATS_ROW_SQL, (scan_id,), fetch_one=True
+        )
+        if stats:
+            return stats
         
-        try:
-            result = self.db.execute_query(query, (scan_id,), fetch=True)
-            if result:
-                return dict(result[0])
-            return {}
-        except Exception as e:
-            logger.error(f"Failed to get cookie statistics for {scan_id}: {e}")
-            return {}
+        # An aggregate without GROUP BY always returns exactly one row
+        return self.db.execute_prepared(
+            "qo_cookie_stats", _COOKIE_STATS_SQL, (scan_id,), fetch_one=True
+        ) or {}
     
+    @_db_call(list, "get domain summary from MV")
     def get_domain_summary_from_mv(
         self,
         domain: Optional[str] = None,
@@ -255,7 +495,10 @@ class QueryOptimizer:
         """
         Get domain summary from materialized view (fast).
         
-        Uses pre-computed statistics for instant results.
+        Uses pre-computed statistics for instant results. The view is
+        refreshed on a coarse schedule, so results are also cached in
+        process for MV_CACHE_TTL seconds; concurrent misses for the same
+        key run the query once, and misses for other keys don't wait on it.
         
         Args:
             domain: Filter by domain (optional)
@@ -264,53 +507,70 @@ class QueryOptimizer:
         Returns:
             List of domain summary dicts
         """
+        key = (domain, limit)
+        entry = self._mv_cache.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            with self._mv_cache_lock:
+                key_lock = self._mv_key_locks.setdefault(key, threading.Lock())
+            with key_lock:
+                entry = self._mv_cache.get(key)
+                if entry is None or entry[0] < time.monotonic():
+                    entry = (
+                        time.monotonic() + MV_CACHE_TTL,
+                        self._query_domain_summary(domain, limit)
+                    )
+                    with self._mv_cache_lock:
+                        self._mv_cache[key] = entry
+                        self._mv_cache.move_to_end(key)
+                        if len(self._mv_cache) > MV_CACHE_SIZE:
+                            evicted, _ = self._mv_cache.popitem(last=False)
+                            self._mv_key_locks.pop(evicted, None)
+        # Copies, so callers can't mutate the cached rows
+        return [dict(row) for row in entry[1]]
+    
+    def invalidate_mv_cache(self):
+        """Drop cached materialized view results, e.g. after a refresh."""
+        with self._mv_cache_lock:
+            self._mv_cache.clear()
+            self._mv_key_locks.clear()
+    
+    def _query_domain_summary(
+        self,
+        domain: Optional[str],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """Read domain summaries from mv_domain_scan_summary."""
         if domain:
-            query = """
-                SELECT *
-                FROM mv_domain_scan_summary
-                WHERE domain = %s
-            """
+            name = "qo_domain_summary"
+            query = _DOMAIN_SUMMARY_SQL
             params = (domain,)
         else:
-            query = """
-                SELECT *
-                FROM mv_domain_scan_summary
-                ORDER BY last_scan_time DESC
-                LIMIT %s
-            """
+            name = "qo_domain_summaries"
+            query = _DOMAIN_SUMMARIES_SQL
             params = (limit,)
         
-        try:
-            result = self.db.execute_query(query, params, fetch=True)
-            return [dict(row) for row in result] if result else []
-        except Exception as e:
-            logger.error(f"Failed to get domain summary from MV: {e}")
-            return []
+        if domain:
+            # domain is unique in the view
+            row = self.db.execute_prepared(name, query, params, fetch_one=True)
+            return [row] if row else []
+        result = self.db.execute_prepared(name, query, params)
+        return result or []
     
+    @_db_call(list, "get active scans")
     def get_active_scans_optimized(self) -> List[Dict[str, Any]]:
         """
         Get currently active scans using partial index.
         
-        Uses partial index on active scans for fast lookup.
+        Uses partial index idx_scan_results_active_recent, which also
+        covers the selected columns.
         
         Returns:
             List of active scan dicts
         """
-        query = """
-            SELECT 
-                scan_id, domain, scan_mode, timestamp_utc, status
-            FROM scan_results
-            WHERE status IN ('pending', 'running')
-            ORDER BY timestamp_utc DESC
-        """
-        
-        try:
-            result = self.db.execute_query(query, fetch=True)
-            return [dict(row) for row in result] if result else []
-        except Exception as e:
-            logger.error(f"Failed to get active scans: {e}")
-            return []
+        result = self.db.execute_prepared("qo_active_scans", _ACTIVE_SCANS_SQL)
+        return result or []
     
+    @_db_call(list, "get failed jobs")
     def get_failed_jobs_optimized(
         self,
         hours: int = 24,
@@ -319,7 +579,7 @@ class QueryOptimizer:
         """
         Get recent failed jobs using partial index.
         
-        Uses partial index on failed jobs for fast lookup.
+        Uses partial index idx_job_executions_failed_recent.
         
         Args:
             hours: Number of hours to look back
@@ -328,57 +588,44 @@ class QueryOptimizer:
         Returns:
             List of failed job execution dicts
         """
-        query = """
-            SELECT 
-                execution_id, schedule_id, job_id, domain,
-                started_at, completed_at, duration_seconds,
-                error_message
-            FROM job_executions
-            WHERE status = 'failed'
-                AND started_at >= NOW() - INTERVAL '%s hours'
-            ORDER BY started_at DESC
-            LIMIT %s
-        """
-        
-        try:
-            result = self.db.execute_query(query, (hours, limit), fetch=True)
-            return [dict(row) for row in result] if result else []
-        except Exception as e:
-            logger.error(f"Failed to get failed jobs: {e}")
-            return []
+        result = self.db.execute_prepared("qo_failed_jobs", _FAILED_JOBS_SQL, (hours, limit))
+        return result or []
     
+    @_db_call(list, "get pending notifications")
     def get_pending_notifications_optimized(
         self,
-        limit: int = 100
+        limit: int = 100,
+        contains: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
         """
         Get pending notifications using partial index.
         
-        Uses partial index on pending notifications for fast lookup.
+        Uses partial index idx_notifications_pending, or the partial GIN
+        index idx_notifications_pending_data when filtering on data.
         
         Args:
             limit: Maximum results
+            contains: Only notifications whose data contains this JSON
+                object, e.g. {"event_type": "scan.failed"} (optional)
             
         Returns:
             List of pending notification dicts
         """
-        query = """
-            SELECT 
-                notification_id, user_id, event, channel,
-                created_at, retry_count, data
-            FROM notifications
-            WHERE status = 'pending'
-            ORDER BY created_at
-            LIMIT %s
-        """
-        
-        try:
-            result = self.db.execute_query(query, (limit,), fetch=True)
-            return [dict(row) for row in result] if result else []
-        except Exception as e:
-            logger.error(f"Failed to get pending notifications: {e}")
-            return []
+        if contains is not None:
+            # Separate statement so the plan can use the GIN index
+            result = self.db.execute_prepared(
+                "qo_pending_notifications_containing",
+                _PENDING_NOTIFICATIONS_CONTAINING_SQL,
+                (limit, Json(contains))
+            )
+            return result or []
+        
+        result = self.db.execute_prepared(
+            "qo_pending_notifications", _PENDING_NOTIFICATIONS_SQL, (limit,)
+        )
+        return result or []
     
+    @_db_call(list, "get upcoming schedules")
     def get_upcoming_schedules_optimized(
         self,
         hours: int = 24,
@@ -387,7 +634,8 @@ class QueryOptimizer:
         """
         Get upcoming scheduled jobs using optimized index.
         
-        Uses composite index on (next_run, domain) with enabled filter.
+        Uses partial index idx_schedules_next_run_enabled on
+        (next_run, domain) WHERE enabled AND next_run IS NOT NULL.
         
         Args:
             hours: Number of hours to look ahead
@@ -396,25 +644,40 @@ class QueryOptimizer:
         Returns:
             List of schedule dicts
         """
-        query = """
-            SELECT 
-                schedule_id, domain_config_id, domain, frequency,
-                time_config, next_run, last_run, last_status
-            FROM schedules
-            WHERE enabled = TRUE
-                AND next_run IS NOT NULL
-                AND next_run <= NOW() + INTERVAL '%s hours'
-            ORDER BY next_run
-            LIMIT %s
+        result = self.db.execute_prepared(
+            "qo_upcoming_schedules", _UPCOMING_SCHEDULES_SQL, (hours, limit)
+        )
+        return result or []
+    
+    @_db_call(lambda: {key: [] for key in _DASHBOARD_KEYS}, "get dashboard snapshot")
+    def get_dashboard_snapshot(
+        self,
+        hours: int = 24,
+        limit: int = 100
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
+        Get active scans, pending notifications, failed jobs and upcoming
+        schedules in one round trip.
         
-        try:
-            result = self.db.execute_query(query, (hours, limit), fetch=True)
-            return [dict(row) for row in result] if result else []
-        except Exception as e:
-            logger.error(f"Failed to get upcoming schedules: {e}")
-            return []
+        The four dashboard listings run as scalar json_agg subqueries of a
+        single prepared statement instead of four separate queries.
+        Timestamps and UUIDs come back as JSON strings rather than
+        datetime/UUID objects.
+        
+        Args:
+            hours: Look-back window for failed jobs and look-ahead window
+                for schedules
+            limit: Maximum results per listing (active scans are not limited)
+            
+        Returns:
+            Dict with 'active', 'pending', 'failed' and 'upcoming' lists
+        """
+        row = self.db.execute_prepared(
+            "qo_dashboard_snapshot", _DASHBOARD_SNAPSHOT_SQL, (hours, limit), fetch_one=True
+        ) or {}
+        return {key: row.get(key) or [] for key in _DASHBOARD_KEYS}
     
+    @_db_call(lambda: None, "explain query")
     def explain_query(self, query: str, params: Tuple = None) -> Optional[str]:
         """
         Get EXPLAIN ANALYZE output for a query.
@@ -430,32 +693,58 @@ class QueryOptimizer:
         """
         explain_query = f"EXPLAIN ANALYZE {query}"
         
-        try:
-            result = self.db.execute_query(explain_query, params, fetch=True)
-            if result:
-                return "\n".join([row['QUERY PLAN'] for row in result])
-            return None
-        except Exception as e:
-            logger.error(f"Failed to explain query: {e}")
-            return None
+        result = self.db.execute_query(explain_query, params, fetch=True)
+        if result:
+            return "\n".join([row['QUERY PLAN'] for row in result])
+        return None
 
 
-# Singleton instance
+# Process-wide instance, overridable per context with set_query_optimizer()
 _query_optimizer: Optional[QueryOptimizer] = None
+_qo_var: ContextVar[Optional[QueryOptimizer]] = ContextVar("query_optimizer", default=None)
 
 
 def get_query_optimizer() -> QueryOptimizer:
-    """Get the global query optimizer instance."""
-    global _query_optimizer
-    if _query_optimizer is None:
+    """Get the query optimizer for the current context."""
+    query_optimizer = _qo_var.get() or _query_optimizer
+    if query_optimizer is None:
         raise RuntimeError(
             "Query optimizer not initialized. Call init_query_optimizer() first."
         )
-    return _query_optimizer
+    return query_optimizer
 
 
 def init_query_optimizer(db_connection) -> QueryOptimizer:
-    """Initialize the global query optimizer instance."""
+    """
+    Initialize the global query optimizer instance.
+    
+    Prepares its statements up front unless QO_PREWARM is set to 0.
+    """
     global _query_optimizer
     _query_optimizer = QueryOptimizer(db_connection)
+    if os.environ.get('QO_PREWARM', '1') == '1':
+        _query_optimizer._prewarm()
     return _query_optimizer
+
+
+@contextmanager
+def set_query_optimizer(query_optimizer: QueryOptimizer) -> Iterator[QueryOptimizer]:
+    """
+    Use a different query optimizer within the current context.
+    
+    Lets a request or task run against its own connection pool (e.g. per
+    tenant) without touching the global instance. The override follows
+    asyncio tasks created inside the block but not new threads, which
+    fall back to the global instance.
+    
+    Args:
+        query_optimizer: QueryOptimizer to return from get_query_optimizer()
+        
+    Yields:
+        The query optimizer
+    """
+    token = _qo_var.set(query_optimizer)
+    try:
+        yield query_optimizer
+    finally:
+        _qo_var.reset(token)
@@ -86,6 +86,12 @@ class MLCookieClassifier:
         self.scaler = joblib.load(SCALER_FILE)
         self.label_encoder = joblib.load(LABEL_ENCODER_FILE)
 
+        # The forest is trained with n_jobs=-1; at inference, fanning every
+        # predict_proba call out to a thread pool costs more than walking
+        # the trees for the few cookies a scan classifies at a time
+        if hasattr(self.model, "n_jobs"):
+            self.model.n_jobs = 1
+
         # Load metadata
         if METADATA_FILE.exists():
             import json
@@ -121,8 +127,8 @@ class MLCookieClassifier:
         features = self.feature_extractor.extract(cookie)
         features_df = pd.DataFrame([features])
 
-        # Scale features
-        features_scaled = self.scaler.transform(features_df)
+        # Scale features (trees compare in float32, so convert once here)
+        features_scaled = self.scaler.transform(features_df).astype(np.float32)
 
         # Predict with probabilities
         probabilities = self.model.predict_proba(features_scaled)[0]
@@ -167,23 +173,23 @@ class MLCookieClassifier:
         # Extract features for all cookies
         features_df = self.feature_extractor.extract_batch(cookies)
 
-        # Scale features
-        features_scaled = self.scaler.transform(features_df)
+        # Scale features (trees compare in float32, so convert once here)
+        features_scaled = self.scaler.transform(features_df).astype(np.float32)
 
-        # Batch prediction
+        # Batch prediction: one (N, n_classes) matrix, reduced in one pass
         probabilities_batch = self.model.predict_proba(features_scaled)
+        predicted_idx = probabilities_batch.argmax(axis=1)
+        confidences = probabilities_batch.max(axis=1).tolist()
+        predicted_classes = self.label_encoder.classes_[predicted_idx]
+        categories = self.label_encoder.classes_.tolist()
+        prob_rows = probabilities_batch.tolist()
 
-        # Build results
+        # Build results (dicts only at the edge, for JSON/API consumers)
         results = []
-        for i, (cookie, probabilities) in enumerate(zip(cookies, probabilities_batch)):
-            predicted_class_idx = np.argmax(probabilities)
-            predicted_class = self.label_encoder.classes_[predicted_class_idx]
-            confidence = probabilities[predicted_class_idx]
-
-            prob_dict = {
-                category: float(prob)
-                for category, prob in zip(self.label_encoder.classes_, probabilities)
-            }
+        for i, cookie in enumerate(cookies):
+            predicted_class = predicted_classes[i]
+            confidence = confidences[i]
+            prob_dict = dict(zip(categories, prob_rows[i]))
 
             # Get features for this cookie
             features = features_df.iloc[i].to_dict()
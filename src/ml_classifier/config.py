@@ -46,7 +46,7 @@ MEDIUM_CONFIDENCE_THRESHOLD = 0.50  # Blend with rules
 LOW_CONFIDENCE_THRESHOLD = 0.40     # Flag for manual review
 
 # Feature extraction settings
-KNOWN_ANALYTICS_DOMAINS = {
+KNOWN_ANALYTICS_DOMAINS = frozenset({
     "google-analytics.com",
     "googletagmanager.com",
     "doubleclick.net",
@@ -57,9 +57,9 @@ KNOWN_ANALYTICS_DOMAINS = {
     "heap.io",
     "amplitude.com",
     "matomo.org",
-}
+})
 
-KNOWN_ADVERTISING_DOMAINS = {
+KNOWN_ADVERTISING_DOMAINS = frozenset({
     "facebook.com",
     "facebook.net",
     "doubleclick.net",
@@ -70,45 +70,45 @@ KNOWN_ADVERTISING_DOMAINS = {
     "criteo.com",
     "taboola.com",
     "outbrain.com",
-}
+})
 
-KNOWN_CDN_DOMAINS = {
+KNOWN_CDN_DOMAINS = frozenset({
     "cloudflare.com",
     "cloudfront.net",
     "akamai.net",
     "fastly.net",
     "cdn77.com",
-}
+})
 
 # Known cookie name patterns
-ANALYTICS_PATTERNS = [
+ANALYTICS_PATTERNS = (
     "_ga", "_gid", "_gat", "ga_", "_utm",
     "_hjid", "_hjSessionUser", "_hjSession",
     "mp_", "mixpanel",
     "ajs_", "analytics",
     "heap", "_hp2_",
-]
+)
 
-ADVERTISING_PATTERNS = [
+ADVERTISING_PATTERNS = (
     "_fbp", "_fbc", "fr",  # Facebook
     "IDE", "test_cookie", "_gcl",  # Google Ads
     "criteo", "uid", "uuid",
     "anj", "sess",  # AppNexus
-]
+)
 
-NECESSARY_PATTERNS = [
+NECESSARY_PATTERNS = (
     "session", "csrf", "xsrf",
     "auth", "token", "login",
     "consent", "cookie_consent",
     "PHPSESSID", "JSESSIONID",
-]
+)
 
-FUNCTIONAL_PATTERNS = [
+FUNCTIONAL_PATTERNS = (
     "lang", "language", "locale",
     "theme", "currency",
     "timezone", "tz",
     "preference", "pref",
-]
+)
 
 # Duration categories (in days)
 DURATION_SHORT = 30      # < 30 days
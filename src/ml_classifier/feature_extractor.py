@@ -10,6 +10,7 @@ import re
 import math
 from typing import Dict, Any, Optional, List
 from urllib.parse import urlparse
+import numpy as np
 import pandas as pd
 
 from .config import (
@@ -25,6 +26,44 @@ from .config import (
 )
 
 
+def _compile_any(substrings) -> "re.Pattern[str]":
+    """Compile substrings into one case-insensitive alternation, matched in a single scan."""
+    return re.compile("|".join(re.escape(p) for p in substrings), re.IGNORECASE)
+
+
+# Compiled once at import and shared by every extractor
+_ANALYTICS_RE = _compile_any(ANALYTICS_PATTERNS)
+_ADVERTISING_RE = _compile_any(ADVERTISING_PATTERNS)
+_NECESSARY_RE = _compile_any(NECESSARY_PATTERNS)
+_FUNCTIONAL_RE = _compile_any(FUNCTIONAL_PATTERNS)
+
+_ANALYTICS_DOMAIN_RE = _compile_any(KNOWN_ANALYTICS_DOMAINS)
+_ADVERTISING_DOMAIN_RE = _compile_any(KNOWN_ADVERTISING_DOMAINS)
+_CDN_DOMAIN_RE = _compile_any(KNOWN_CDN_DOMAINS)
+
+_SAME_SITE_ENCODING = {"strict": 2, "lax": 1, "none": 0}
+
+
+def matches_analytics(name: str) -> bool:
+    """Check whether a cookie name contains a known analytics pattern."""
+    return _ANALYTICS_RE.search(name) is not None
+
+
+def matches_advertising(name: str) -> bool:
+    """Check whether a cookie name contains a known advertising pattern."""
+    return _ADVERTISING_RE.search(name) is not None
+
+
+def matches_necessary(name: str) -> bool:
+    """Check whether a cookie name contains a known necessary pattern."""
+    return _NECESSARY_RE.search(name) is not None
+
+
+def matches_functional(name: str) -> bool:
+    """Check whether a cookie name contains a known functional pattern."""
+    return _FUNCTIONAL_RE.search(name) is not None
+
+
 class FeatureExtractor:
     """
     Extract machine learning features from cookie objects.
@@ -39,22 +78,10 @@ class FeatureExtractor:
 
     def __init__(self):
         """Initialize feature extractor with pattern matchers."""
-        self.analytics_pattern = re.compile(
-            "|".join(re.escape(p) for p in ANALYTICS_PATTERNS),
-            re.IGNORECASE
-        )
-        self.advertising_pattern = re.compile(
-            "|".join(re.escape(p) for p in ADVERTISING_PATTERNS),
-            re.IGNORECASE
-        )
-        self.necessary_pattern = re.compile(
-            "|".join(re.escape(p) for p in NECESSARY_PATTERNS),
-            re.IGNORECASE
-        )
-        self.functional_pattern = re.compile(
-            "|".join(re.escape(p) for p in FUNCTIONAL_PATTERNS),
-            re.IGNORECASE
-        )
+        self.analytics_pattern = _ANALYTICS_RE
+        self.advertising_pattern = _ADVERTISING_RE
+        self.necessary_pattern = _NECESSARY_RE
+        self.functional_pattern = _FUNCTIONAL_RE
 
         # Common TLDs for encoding
         self.common_tlds = {
@@ -84,7 +111,8 @@ class FeatureExtractor:
         """
         features = {}
 
-        # Extract individual feature groups
+        # Extract individual feature groups (scalar path; per-cookie callers
+        # would pay far more for a one-row DataFrame than for the features)
         features.update(self._extract_name_features(cookie.get("name", "")))
         features.update(self._extract_domain_features(cookie.get("domain", "")))
         features.update(self._extract_duration_features(cookie.get("cookie_duration", "Session")))
@@ -98,14 +126,89 @@ class FeatureExtractor:
         """
         Extract features from multiple cookies at once.
 
+        Each feature is built as a whole column (pandas string methods and
+        the shared compiled patterns where they apply) instead of one dict
+        per cookie. The values match extract() feature for feature.
+
         Args:
             cookies: List of cookie dictionaries
 
         Returns:
             pandas DataFrame with features for all cookies
         """
-        features_list = [self.extract(cookie) for cookie in cookies]
-        return pd.DataFrame(features_list)
+        if not cookies:
+            return pd.DataFrame()
+
+        names = pd.Series([c.get("name", "") for c in cookies], dtype=object)
+        # Clean domain (remove leading dot)
+        domains = pd.Series([c.get("domain", "").lstrip(".") for c in cookies], dtype=object)
+        durations = pd.Series([c.get("cookie_duration", "Session") for c in cookies], dtype=object)
+
+        # Duration: session flag, days and category
+        # (0=session, 1=short, 2=medium, 3=long)
+        is_session = (durations.str.lower() == "session").astype(int)
+        duration_days = durations.map(self._parse_duration_to_days).astype(float)
+        duration_category = np.select(
+            [is_session == 1, duration_days <= DURATION_SHORT, duration_days <= DURATION_MEDIUM],
+            [0, 1, 2],
+            default=3,
+        )
+
+        # Security: sameSite Strict=2, Lax=1, None/other=0
+        http_only = np.array([1 if c.get("httpOnly", False) else 0 for c in cookies])
+        secure = np.array([1 if c.get("secure", False) else 0 for c in cookies])
+        same_site = np.array([
+            _SAME_SITE_ENCODING.get(v.lower(), 0) if isinstance(v, str) else 0
+            for v in (c.get("sameSite", "None") for c in cookies)
+        ])
+
+        return pd.DataFrame({
+            # Name-based
+            "name_length": names.str.len(),
+            "has_underscore": names.str.contains("_", regex=False).astype(int),
+            "has_numbers": [1 if any(ch.isdigit() for ch in n) else 0 for n in names],
+            "has_uppercase": [1 if any(ch.isupper() for ch in n) else 0 for n in names],
+            "name_entropy": names.map(self._calculate_entropy),
+            "name_prefix_encoded": names.map(self._encode_prefix),
+            "name_suffix_encoded": names.map(self._encode_suffix),
+            "vendor_fingerprint": names.map(self._extract_vendor_fingerprint),
+
+            # Domain-based (e.g., "www.example.com" has 3 levels)
+            "domain_levels": domains.str.count(r"\.") + 1,
+            "tld_encoded": [
+                self.common_tlds.get(d.rsplit(".", 1)[1].lower(), 99) if "." in d else 99
+                for d in domains
+            ],
+            "is_cdn": domains.str.contains(_CDN_DOMAIN_RE).astype(int),
+            "is_known_analytics": domains.str.contains(_ANALYTICS_DOMAIN_RE).astype(int),
+            "is_known_advertising": domains.str.contains(_ADVERTISING_DOMAIN_RE).astype(int),
+            "domain_entropy": domains.map(self._calculate_entropy),
+
+            # Duration-based
+            "is_session": is_session,
+            "duration_days": duration_days,
+            "duration_category_encoded": duration_category,
+
+            # Security (composite score 0-1)
+            "httpOnly": http_only,
+            "secure": secure,
+            "sameSite_encoded": same_site,
+            "security_score": (http_only + secure + (same_site / 2)) / 3,
+
+            # Behavioral
+            "is_third_party": [
+                1 if c.get("cookie_type", "Unknown") == "Third Party" else 0 for c in cookies
+            ],
+            "size": [c.get("size", 0) for c in cookies],
+            "set_after_accept": [1 if c.get("set_after_accept", False) else 0 for c in cookies],
+            "path_is_root": [1 if c.get("path", "/") == "/" else 0 for c in cookies],
+
+            # Pattern matching
+            "matches_analytics_pattern": names.str.contains(_ANALYTICS_RE).astype(int),
+            "matches_advertising_pattern": names.str.contains(_ADVERTISING_RE).astype(int),
+            "matches_necessary_pattern": names.str.contains(_NECESSARY_RE).astype(int),
+            "matches_functional_pattern": names.str.contains(_FUNCTIONAL_RE).astype(int),
+        })
 
     def _extract_name_features(self, name: str) -> Dict[str, Any]:
         """Extract features from cookie name."""
@@ -132,21 +235,10 @@ class FeatureExtractor:
         tld = clean_domain.split(".")[-1] if "." in clean_domain else "unknown"
         tld_encoded = self.common_tlds.get(tld.lower(), 99)  # 99 for "other"
 
-        # Check if domain is in known lists
-        is_known_analytics = 1 if any(
-            known in clean_domain.lower()
-            for known in KNOWN_ANALYTICS_DOMAINS
-        ) else 0
-
-        is_known_advertising = 1 if any(
-            known in clean_domain.lower()
-            for known in KNOWN_ADVERTISING_DOMAINS
-        ) else 0
-
-        is_cdn = 1 if any(
-            cdn in clean_domain.lower()
-            for cdn in KNOWN_CDN_DOMAINS
-        ) else 0
+        # Check if domain contains a known domain (one scan per list)
+        is_known_analytics = 1 if _ANALYTICS_DOMAIN_RE.search(clean_domain) else 0
+        is_known_advertising = 1 if _ADVERTISING_DOMAIN_RE.search(clean_domain) else 0
+        is_cdn = 1 if _CDN_DOMAIN_RE.search(clean_domain) else 0
 
         return {
             "domain_levels": domain_levels,
@@ -234,10 +326,10 @@ class FeatureExtractor:
         name = cookie.get("name", "")
 
         return {
-            "matches_analytics_pattern": 1 if self.analytics_pattern.search(name) else 0,
-            "matches_advertising_pattern": 1 if self.advertising_pattern.search(name) else 0,
-            "matches_necessary_pattern": 1 if self.necessary_pattern.search(name) else 0,
-            "matches_functional_pattern": 1 if self.functional_pattern.search(name) else 0,
+            "matches_analytics_pattern": 1 if matches_analytics(name) else 0,
+            "matches_advertising_pattern": 1 if matches_advertising(name) else 0,
+            "matches_necessary_pattern": 1 if matches_necessary(name) else 0,
+            "matches_functional_pattern": 1 if matches_functional(name) else 0,
         }
 
     def _calculate_entropy(self, text: str) -> float:
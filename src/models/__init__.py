@@ -2,7 +2,7 @@
 Data models for Cookie Scanner Platform.
 """
 
-from .scan import ScanResult, Cookie, ScanParams, ScanStatus
+from .scan import ScanResult, Cookie, ScanParams, ScanStatus, ScanDC, CookieDC
 from .schedule import Schedule, ScheduleFrequency
 from .report import Report, ReportType, ReportFormat
 from .notification import Notification, NotificationEvent, NotificationChannel, NotificationStatus
@@ -14,6 +14,8 @@ __all__ = [
     'Cookie',
     'ScanParams',
     'ScanStatus',
+    'ScanDC',
+    'CookieDC',
     'Schedule',
     'ScheduleFrequency',
     'Report',
@@ -2,10 +2,16 @@
 Notification-related data models.
 """
 
+import time
 from datetime import datetime
 from typing import Dict, Any, Optional
 from enum import Enum
-from pydantic import BaseModel, Field, UUID4, validator
+from pydantic import (
+    BaseModel, ConfigDict, Field, UUID4, ValidationInfo,
+    computed_field, field_validator, model_validator
+)
+
+from .timestamps import accept_datetime, ns_to_datetime
 
 
 class NotificationEvent(str, Enum):
@@ -42,20 +48,31 @@ class Notification(BaseModel):
     event: NotificationEvent = Field(..., description="Event that triggered notification")
     channel: NotificationChannel = Field(..., description="Notification channel")
     status: NotificationStatus = Field(default=NotificationStatus.PENDING, description="Notification status")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at_ns: int = Field(
+        default_factory=time.time_ns, exclude=True, description="Creation time (ns since epoch)"
+    )
     sent_at: Optional[datetime] = Field(None, description="Sent timestamp")
     retry_count: int = Field(default=0, ge=0, description="Number of retry attempts")
     data: Dict[str, Any] = Field(default_factory=dict, description="Notification data/payload")
     error: Optional[str] = Field(None, description="Error message if failed")
     
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    model_config = ConfigDict(use_enum_values=True)
+    
+    @model_validator(mode='before')
+    @classmethod
+    def accept_created_at(cls, data: Any) -> Any:
+        """Accept a created_at datetime in place of created_at_ns."""
+        return accept_datetime(data, 'created_at')
+    
+    @computed_field
+    @property
+    def created_at(self) -> datetime:
+        """Creation timestamp (naive UTC), built from created_at_ns on access."""
+        return ns_to_datetime(self.created_at_ns)
     
-    @validator('retry_count')
-    def validate_retry_count(cls, v):
+    @field_validator('retry_count')
+    @classmethod
+    def validate_retry_count(cls, v: int) -> int:
         """Validate retry count doesn't exceed maximum."""
         if v > 3:
             raise ValueError("Maximum 3 retry attempts allowed")
@@ -82,33 +99,32 @@ class NotificationPreferences(BaseModel):
     )
     updated_at: Optional[datetime] = None
     
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    model_config = ConfigDict(use_enum_values=True)
     
-    @validator('email_address')
-    def validate_email(cls, v, values):
+    @field_validator('email_address')
+    @classmethod
+    def validate_email(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
         """Validate email if email channel is enabled."""
-        if v is None and 'enabled_channels' in values:
-            if NotificationChannel.EMAIL in values['enabled_channels']:
+        if v is None and 'enabled_channels' in info.data:
+            if NotificationChannel.EMAIL in info.data['enabled_channels']:
                 raise ValueError("Email address required when email channel is enabled")
         return v
     
-    @validator('webhook_url')
-    def validate_webhook(cls, v, values):
+    @field_validator('webhook_url')
+    @classmethod
+    def validate_webhook(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
         """Validate webhook URL if webhook channel is enabled."""
-        if v is None and 'enabled_channels' in values:
-            if NotificationChannel.WEBHOOK in values['enabled_channels']:
+        if v is None and 'enabled_channels' in info.data:
+            if NotificationChannel.WEBHOOK in info.data['enabled_channels']:
                 raise ValueError("Webhook URL required when webhook channel is enabled")
         return v
     
-    @validator('slack_webhook_url')
-    def validate_slack(cls, v, values):
+    @field_validator('slack_webhook_url')
+    @classmethod
+    def validate_slack(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
         """Validate Slack webhook URL if Slack channel is enabled."""
-        if v is None and 'enabled_channels' in values:
-            if NotificationChannel.SLACK in values['enabled_channels']:
+        if v is None and 'enabled_channels' in info.data:
+            if NotificationChannel.SLACK in info.data['enabled_channels']:
                 raise ValueError("Slack webhook URL required when Slack channel is enabled")
         return v
 
@@ -124,8 +140,4 @@ class NotificationTemplate(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    model_config = ConfigDict(use_enum_values=True)
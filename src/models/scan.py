@@ -2,10 +2,20 @@
 Scan-related data models.
 """
 
+import sys
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Literal, Mapping, NamedTuple, Optional
 from enum import Enum
-from pydantic import BaseModel, Field, validator, UUID4
+from uuid import UUID
+
+from pydantic import (
+    BaseModel, ConfigDict, Field, UUID4,
+    computed_field, field_serializer, model_validator, validator
+)
+
+from .timestamps import accept_datetime, datetime_to_ns, ns_to_datetime
 
 
 class ScanStatus(str, Enum):
@@ -32,6 +42,28 @@ class CookieType(str, Enum):
     UNKNOWN = "unknown"
 
 
+_WAIT_STRATEGY_NAMES = ('timeout', 'networkidle', 'domcontentloaded', 'load', 'combined')
+_WAIT_STRATEGIES = frozenset(_WAIT_STRATEGY_NAMES)
+_WAIT_STRATEGY_ERROR = f"wait_strategy must be one of: {', '.join(_WAIT_STRATEGY_NAMES)}"
+
+
+# Field types for the enums above. Pydantic checks Literal values against a
+# string set and stores plain str, so enum members are still accepted as input.
+ScanStatusT = Literal["pending", "running", "success", "failed", "cancelled"]
+ScanModeT = Literal["quick", "deep", "scheduled", "realtime"]
+CookieTypeT = Literal["First Party", "Third Party", "unknown"]
+
+
+# Low-cardinality cookie strings: a scan repeats the same few values across
+# thousands of cookies, so these are interned to share one object per value
+_STRING_INTERN_FIELDS = ("domain", "category", "source", "same_site", "vendor", "cookie_duration")
+
+
+def _intern(value: Any) -> Any:
+    """Intern a str (returning the shared object), pass anything else through."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class Cookie(BaseModel):
     """Cookie data model with ML classification support."""
     cookie_id: Optional[UUID4] = None
@@ -47,9 +79,9 @@ class Cookie(BaseModel):
     same_site: Optional[str] = Field(None, description="SameSite attribute")
     category: Optional[str] = Field(None, description="Cookie category (Necessary, Functional, Analytics, Advertising)")
     vendor: Optional[str] = Field(None, description="Cookie vendor/provider")
-    cookie_type: Optional[CookieType] = Field(None, description="First Party or Third Party")
+    cookie_type: Optional[CookieTypeT] = Field(None, description="First Party or Third Party")
     set_after_accept: bool = Field(default=False, description="Whether cookie was set after accepting banner")
-    iab_purposes: List[int] = Field(default_factory=list, description="IAB purpose IDs")
+    iab_purposes: Optional[List[int]] = Field(None, description="IAB purpose IDs")
     description: Optional[str] = Field(None, description="Cookie description")
     source: Optional[str] = Field(
         None,
@@ -76,14 +108,61 @@ class Cookie(BaseModel):
         description="Whether this cookie requires manual review (low ML confidence)"
     )
 
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
     created_at: Optional[datetime] = None
 
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    model_config = ConfigDict(defer_build=True)
+    
+    @model_validator(mode='before')
+    @classmethod
+    def intern_strings(cls, data: Any) -> Any:
+        """Intern the repeated string fields so equal values share one object."""
+        if isinstance(data, dict):
+            data = dict(data)
+            for name in _STRING_INTERN_FIELDS:
+                if name in data:
+                    data[name] = _intern(data[name])
+        return data
+    
+    @field_serializer('created_at', when_used='json')
+    def serialize_datetime(self, v: Optional[datetime]) -> Optional[str]:
+        """Dump datetimes with isoformat(), as before."""
+        return v.isoformat() if v else None
+    
+    @field_serializer('iab_purposes')
+    def serialize_iab_purposes(self, v):
+        """Dump an unset purpose list as [] like before."""
+        return [] if v is None else v
+    
+    @field_serializer('metadata')
+    def serialize_metadata(self, v):
+        """Dump unset metadata as {} like before."""
+        return {} if v is None else v
+    
+    def add_metadata(self, key: str, value: Any):
+        """Set a metadata entry, allocating the dict on first write."""
+        if self.metadata is None:
+            self.metadata = {}
+        self.metadata[key] = value
+    
+    @classmethod
+    def from_trusted(cls, **values: Any) -> "Cookie":
+        """
+        Build from already-typed internal data without validation.
+        
+        For database rows and scanner output only; keyword names must match
+        the fields exactly. Keep Cookie(...) for HTTP/JSON input.
+        """
+        return cls.model_construct(**values)
+
+
+class Viewport(NamedTuple):
+    """Browser viewport dimensions (immutable, so the default is shared)."""
+    width: int = 1366
+    height: int = 768
+
+
+_DEFAULT_VIEWPORT = Viewport()
 
 
 class ScanParams(BaseModel):
@@ -109,11 +188,13 @@ class ScanParams(BaseModel):
     follow_external_links: bool = Field(default=False, description="Whether to follow external links")
     collect_screenshots: bool = Field(default=False, description="Whether to collect screenshots")
     user_agent: Optional[str] = Field(None, description="Custom user agent")
-    viewport: Dict[str, int] = Field(
-        default_factory=lambda: {"width": 1366, "height": 768},
+    viewport: Viewport = Field(
+        default=_DEFAULT_VIEWPORT,
         description="Browser viewport dimensions"
     )
     
+    model_config = ConfigDict(defer_build=True)
+    
     @validator('custom_pages')
     def validate_custom_pages(cls, v):
         """Validate custom pages list."""
@@ -124,10 +205,15 @@ class ScanParams(BaseModel):
     @validator('wait_strategy')
     def validate_wait_strategy(cls, v):
         """Validate wait strategy."""
-        valid_strategies = ['timeout', 'networkidle', 'domcontentloaded', 'load', 'combined']
-        if v.lower() not in valid_strategies:
-            raise ValueError(f"wait_strategy must be one of: {', '.join(valid_strategies)}")
-        return v.lower()
+        v_lower = v.lower()
+        if v_lower not in _WAIT_STRATEGIES:
+            raise ValueError(_WAIT_STRATEGY_ERROR)
+        return v_lower
+    
+    @field_serializer('viewport')
+    def serialize_viewport(self, v: Viewport) -> Dict[str, int]:
+        """Dump the viewport as a {"width", "height"} object like before."""
+        return v._asdict()
 
 
 class ScanResult(BaseModel):
@@ -135,28 +221,84 @@ class ScanResult(BaseModel):
     scan_id: Optional[UUID4] = None
     domain_config_id: UUID4 = Field(..., description="Domain configuration ID")
     domain: str = Field(..., description="Scanned domain")
-    scan_mode: ScanMode = Field(..., description="Scan mode used")
-    timestamp_utc: datetime = Field(default_factory=datetime.utcnow, description="Scan timestamp")
-    status: ScanStatus = Field(..., description="Scan status")
+    scan_mode: ScanModeT = Field(..., description="Scan mode used")
+    timestamp_utc_ns: int = Field(
+        default_factory=time.time_ns, exclude=True, description="Scan timestamp (ns since epoch)"
+    )
+    status: ScanStatusT = Field(..., description="Scan status")
     duration_seconds: Optional[float] = Field(None, ge=0, description="Scan duration in seconds")
-    total_cookies: int = Field(default=0, ge=0, description="Total cookies found")
+    cookie_count: int = Field(
+        default=0, ge=0, exclude=True, description="Stored cookie total, used when cookies are not loaded"
+    )
+    first_party_cookies: int = Field(default=0, ge=0, description="First-party cookies found")
+    third_party_cookies: int = Field(default=0, ge=0, description="Third-party cookies found")
     page_count: int = Field(default=0, ge=0, description="Number of pages visited")
     error: Optional[str] = Field(None, description="Error message if scan failed")
     params: ScanParams = Field(default_factory=ScanParams, description="Scan parameters")
     pages_visited: List[str] = Field(default_factory=list, description="List of visited URLs")
     cookies: List[Cookie] = Field(default_factory=list, description="Collected cookies")
-    storages: Dict[str, Dict[str, str]] = Field(
-        default_factory=lambda: {"localStorage": {}, "sessionStorage": {}},
+    storages: Optional[Dict[str, Dict[str, str]]] = Field(
+        None,
         description="Storage data (localStorage, sessionStorage)"
     )
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    model_config = ConfigDict(defer_build=True)
+    
+    @model_validator(mode='before')
+    @classmethod
+    def accept_legacy_fields(cls, data: Any) -> Any:
+        """Accept timestamp_utc and total_cookies in place of their stored fields."""
+        data = accept_datetime(data, 'timestamp_utc')
+        if isinstance(data, dict) and 'total_cookies' in data:
+            data = dict(data)
+            total = data.pop('total_cookies')
+            if total is not None:
+                data.setdefault('cookie_count', total)
+        return data
+    
+    @classmethod
+    def model_construct(cls, _fields_set=None, **values: Any) -> "ScanResult":
+        """Like BaseModel.model_construct, also accepting the legacy field names."""
+        return super().model_construct(_fields_set, **cls.accept_legacy_fields(values))
+    
+    @classmethod
+    def from_trusted(cls, **values: Any) -> "ScanResult":
+        """
+        Build from already-typed internal data without validation.
+        
+        For database rows and scanner output only; cookies must already be
+        Cookie instances. Keep ScanResult(...) for HTTP/JSON input.
+        """
+        return cls.model_construct(**values)
+    
+    @field_serializer('storages')
+    def serialize_storages(self, v):
+        """Dump unset storages as the empty localStorage/sessionStorage shape."""
+        return {"localStorage": {}, "sessionStorage": {}} if v is None else v
+    
+    @property
+    def storages_ensured(self) -> Dict[str, Dict[str, str]]:
+        """Storages dict, allocating the empty shape on first access."""
+        if self.storages is None:
+            self.storages = {"localStorage": {}, "sessionStorage": {}}
+        return self.storages
+    
+    @field_serializer('timestamp_utc', 'created_at', 'updated_at', when_used='json')
+    def serialize_datetime(self, v: Optional[datetime]) -> Optional[str]:
+        """Dump datetimes with isoformat(), as before."""
+        return v.isoformat() if v else None
+    
+    @computed_field
+    @property
+    def timestamp_utc(self) -> datetime:
+        """Scan timestamp (naive UTC), built from timestamp_utc_ns on access."""
+        return ns_to_datetime(self.timestamp_utc_ns)
+    
+    @timestamp_utc.setter
+    def timestamp_utc(self, value: datetime):
+        self.timestamp_utc_ns = datetime_to_ns(value)
     
     @validator('cookies', pre=True)
     def validate_cookies(cls, v):
@@ -165,27 +307,156 @@ class ScanResult(BaseModel):
             return []
         return v
     
-    @validator('total_cookies', always=True)
-    def sync_total_cookies(cls, v, values):
-        """Sync total_cookies with cookies list length."""
-        if 'cookies' in values:
-            return len(values['cookies'])
-        return v
+    @computed_field
+    @property
+    def total_cookies(self) -> int:
+        """Cookies in the loaded list, or the stored count for summary rows."""
+        return len(self.cookies) if self.cookies else self.cookie_count
+
+
+@dataclass(slots=True)
+class CookieDC:
+    """
+    Slotted cookie container for trusted internal data.
+    
+    Mirrors Cookie's fields for rows read back from the database and scanner
+    output, skipping per-field validation.
+    """
+    name: str
+    domain: str
+    cookie_id: Optional[UUID] = None
+    scan_id: Optional[UUID] = None
+    path: str = "/"
+    hashed_value: Optional[str] = None
+    cookie_duration: Optional[str] = None
+    size: Optional[int] = None
+    http_only: bool = False
+    secure: bool = False
+    same_site: Optional[str] = None
+    category: Optional[str] = None
+    vendor: Optional[str] = None
+    cookie_type: Optional[CookieTypeT] = None
+    set_after_accept: bool = False
+    iab_purposes: Optional[List[int]] = None
+    description: Optional[str] = None
+    source: Optional[str] = None
+    ml_confidence: Optional[float] = None
+    ml_probabilities: Optional[Dict[str, float]] = None
+    classification_evidence: Optional[List[str]] = None
+    requires_review: bool = False
+    metadata: Optional[Dict[str, Any]] = None
+    created_at: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class ScanDC:
+    """
+    Slotted scan result container for trusted internal data.
+    
+    Mirrors ScanResult for the analytics and report pipeline, which only
+    reads attributes. total_cookies follows the cookies list when one is
+    loaded.
+    """
+    domain_config_id: Optional[UUID]
+    domain: str
+    scan_mode: ScanModeT
+    status: ScanStatusT
+    scan_id: Optional[UUID] = None
+    timestamp_utc: datetime = field(default_factory=datetime.utcnow)
+    duration_seconds: Optional[float] = None
+    total_cookies: int = 0
+    first_party_cookies: int = 0
+    third_party_cookies: int = 0
+    page_count: int = 0
+    error: Optional[str] = None
+    params: Dict[str, Any] = field(default_factory=dict)
+    pages_visited: List[str] = field(default_factory=list)
+    cookies: List[CookieDC] = field(default_factory=list)
+    storages: Optional[Dict[str, Dict[str, str]]] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    
+    def __post_init__(self):
+        if self.cookies:
+            self.total_cookies = len(self.cookies)
+
+
+def build_cookies(rows: List[Mapping[str, Any]]) -> List[CookieDC]:
+    """
+    Build CookieDC objects in bulk from cookies table rows.
+    
+    Columns not stored on the table (duration, size, flags, IAB purposes,
+    description, source) are read from the row's metadata JSON. Repeated
+    strings are interned and the output list is allocated once and filled
+    in place.
+    
+    Args:
+        rows: Rows with name, domain, path, hashed_value, category, vendor,
+            cookie_type, set_after_accept, metadata and optionally cookie_id
+        
+    Returns:
+        List of CookieDC in row order
+    """
+    n = len(rows)
+    cookies: List[Optional[CookieDC]] = [None] * n
+    make = CookieDC
+    for i in range(n):
+        row = rows[i]
+        meta = row['metadata'] or {}
+        get = meta.get
+        cookies[i] = make(
+            row['name'],
+            _intern(row['domain']),
+            cookie_id=row.get('cookie_id'),
+            path=row['path'],
+            hashed_value=row['hashed_value'],
+            cookie_duration=_intern(get('cookie_duration')),
+            size=get('size'),
+            http_only=get('http_only', False),
+            secure=get('secure', False),
+            same_site=_intern(get('same_site')),
+            category=_intern(row['category']),
+            vendor=_intern(row['vendor']),
+            cookie_type=_intern(row['cookie_type']),
+            set_after_accept=row['set_after_accept'],
+            iab_purposes=get('iab_purposes'),
+            description=get('description'),
+            source=_intern(get('source')),
+        )
+    return cookies
 
 
 class ScanProgress(BaseModel):
     """Real-time scan progress model."""
     scan_id: UUID4
-    status: ScanStatus
+    status: ScanStatusT
     current_page: Optional[str] = None
     pages_visited: int = 0
     cookies_found: int = 0
     progress_percentage: float = Field(ge=0, le=100)
     message: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp_ns: int = Field(default_factory=time.time_ns, exclude=True)
+    
+    model_config = ConfigDict(defer_build=True)
+    
+    @model_validator(mode='before')
+    @classmethod
+    def accept_timestamp(cls, data: Any) -> Any:
+        """Accept a timestamp datetime in place of timestamp_ns."""
+        return accept_datetime(data, 'timestamp')
+    
+    @classmethod
+    def model_construct(cls, _fields_set=None, **values: Any) -> "ScanProgress":
+        """Like BaseModel.model_construct, also accepting timestamp."""
+        return super().model_construct(_fields_set, **accept_datetime(values, 'timestamp'))
+    
+    @field_serializer('timestamp', when_used='json')
+    def serialize_datetime(self, v: Optional[datetime]) -> Optional[str]:
+        """Dump datetimes with isoformat(), as before."""
+        return v.isoformat() if v else None
     
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    @computed_field
+    @property
+    def timestamp(self) -> datetime:
+        """Progress timestamp (naive UTC), built from timestamp_ns on access."""
+        return ns_to_datetime(self.timestamp_ns)
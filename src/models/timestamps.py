@@ -0,0 +1,37 @@
+"""
+Integer-nanosecond timestamp helpers shared by the data models.
+
+Models store times as ns since the epoch and expose datetimes as computed
+fields. Datetimes are naive UTC, matching utcnow() and the database columns.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def datetime_to_ns(value: datetime) -> int:
+    """Convert a datetime (naive means UTC) to integer ns since the epoch."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = value - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 10**9 + delta.microseconds * 1000
+
+
+def ns_to_datetime(ns: int) -> datetime:
+    """Convert integer ns since the epoch to a naive UTC datetime."""
+    return EPOCH + timedelta(microseconds=ns // 1000)
+
+
+def accept_datetime(data: Any, name: str) -> Any:
+    """Move a datetime/ISO string passed as `name` into its `name`_ns field."""
+    ns_name = f"{name}_ns"
+    if isinstance(data, dict) and name in data and ns_name not in data:
+        data = dict(data)
+        value = data.pop(name)
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if isinstance(value, datetime):
+            data[ns_name] = datetime_to_ns(value)
+    return data
@@ -26,7 +26,7 @@ from urllib.parse import urljoin, urlparse
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
-from playwright.async_api import async_playwright, BrowserContext, Page, Browser
+from playwright.async_api import async_playwright, BrowserContext, Page, Browser, Playwright
 from playwright_stealth import Stealth
 
 stealth = Stealth()
@@ -73,6 +73,7 @@ class ParallelCookieScanner:
         self.accept_button_selector = accept_button_selector
         self.user_agent = user_agent
 
+        self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.cookie_map: Dict[str, Any] = {}
@@ -94,8 +95,8 @@ class ParallelCookieScanner:
         """Start browser and create context."""
         logger.info("[PARALLEL_SCANNER] Starting browser...")
 
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(
             headless=True,
             args=[
                 "--disable-blink-features=AutomationControlled",
@@ -104,28 +105,70 @@ class ParallelCookieScanner:
             ]
         )
 
-        self.context = await self.browser.new_context(
+        self.context = await self._new_context()
+
+        logger.info("[PARALLEL_SCANNER] Browser started successfully")
+
+    async def _new_context(self) -> BrowserContext:
+        """Create a stealth-configured browser context."""
+        context = await self.browser.new_context(
             user_agent=self.user_agent,
             viewport={"width": 1366, "height": 768}
         )
 
         # Apply stealth
-        await stealth.apply_stealth_async(self.context)
-        await self.context.add_init_script("""
+        await stealth.apply_stealth_async(context)
+        await context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
             window.chrome = { runtime: {} };
             Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
             Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
         """)
 
-        logger.info("[PARALLEL_SCANNER] Browser started successfully")
+        return context
+
+    def configure(self, max_concurrent: int, timeout: int):
+        """
+        Reconfigure concurrency and timeout for the next scan.
+
+        Args:
+            max_concurrent: Maximum concurrent page scans
+            timeout: Page navigation timeout in ms
+        """
+        self.max_concurrent = max_concurrent
+        self.batch_size = max_concurrent
+        self.timeout = timeout
+
+    async def reset(self):
+        """
+        Reset scan state so the running browser can be reused.
+
+        Replaces the browser context, dropping cookies and storage left over
+        from the previous scan.
+        """
+        if self.context:
+            await self.context.close()
+        self.context = await self._new_context()
+
+        self.cookie_map = {}
+        self.visited = set()
+        self.storages_agg = {"localStorage": {}, "sessionStorage": {}}
+
+    def is_running(self) -> bool:
+        """Check whether the browser is started and still connected."""
+        return self.browser is not None and self.browser.is_connected()
 
     async def stop(self):
         """Stop browser and cleanup."""
         if self.browser:
             await self.browser.close()
+            self.browser = None
             logger.info("[PARALLEL_SCANNER] Browser stopped")
 
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
     async def scan_single_page(
         self,
         url: str,
@@ -9,7 +9,7 @@ from datetime import datetime, timedelta
 
 import asyncpg
 
-from src.models.scan import ScanResult, Cookie, CookieType, ScanMode
+from src.models.scan import ScanDC, build_cookies
 from src.models.report import Report, ReportFormat, ReportType, TrendData
 from src.analytics.report_generator import ReportGenerator
 from src.analytics.metrics_calculator import MetricsCalculator
@@ -34,7 +34,7 @@ class AnalyticsService:
         self.trend_analyzer = TrendAnalyzer(self.metrics_calculator)
         logger.info("AnalyticsService initialized")
     
-    async def get_scan_result(self, scan_id: UUID) -> Optional[ScanResult]:
+    async def get_scan_result(self, scan_id: UUID) -> Optional[ScanDC]:
         """
         Get scan result by ID.
         
@@ -42,7 +42,7 @@ class AnalyticsService:
             scan_id: Scan ID
             
         Returns:
-            ScanResult or None if not found
+            ScanDC or None if not found
         """
         async with self.db_pool.acquire() as conn:
             # Get scan result
@@ -72,43 +72,21 @@ class AnalyticsService:
                 scan_id
             )
             
-            # Build cookie objects
-            cookies = []
-            for cookie_row in cookie_rows:
-                metadata = cookie_row['metadata'] or {}
-                cookies.append(Cookie(
-                    cookie_id=cookie_row['cookie_id'],
-                    name=cookie_row['name'],
-                    domain=cookie_row['domain'],
-                    path=cookie_row['path'],
-                    hashed_value=cookie_row['hashed_value'],
-                    category=cookie_row['category'],
-                    vendor=cookie_row['vendor'],
-                    cookie_type=CookieType(cookie_row['cookie_type']) if cookie_row['cookie_type'] else None,
-                    set_after_accept=cookie_row['set_after_accept'],
-                    cookie_duration=metadata.get('cookie_duration'),
-                    size=metadata.get('size'),
-                    http_only=metadata.get('http_only', False),
-                    secure=metadata.get('secure', False),
-                    same_site=metadata.get('same_site'),
-                    description=metadata.get('description'),
-                    iab_purposes=metadata.get('iab_purposes', []),
-                    source=metadata.get('source')
-                ))
+            cookies = build_cookies(cookie_rows)
             
             # Build scan result
-            scan_result = ScanResult(
+            scan_result = ScanDC(
                 scan_id=row['scan_id'],
                 domain_config_id=row['domain_config_id'],
                 domain=row['domain'],
-                scan_mode=ScanMode(row['scan_mode']),
+                scan_mode=row['scan_mode'],
                 timestamp_utc=row['timestamp_utc'],
                 status=row['status'],
                 duration_seconds=row['duration_seconds'],
                 page_count=row['page_count'],
                 cookies=cookies,
                 storages={},  # Not stored in DB currently
-                params=row['params'],
+                params=row['params'] or {},
                 error=row['error']
             )
             
@@ -121,7 +99,7 @@ class AnalyticsService:
         end_date: Optional[datetime] = None,
         limit: int = 100,
         offset: int = 0
-    ) -> List[ScanResult]:
+    ) -> List[ScanDC]:
         """
         List scan results with optional filtering.
         
@@ -133,7 +111,7 @@ class AnalyticsService:
             offset: Offset for pagination
             
         Returns:
-            List of ScanResult objects
+            List of ScanDC objects
         """
         query = """
             SELECT scan_id, domain_config_id, domain, scan_mode,
@@ -180,41 +158,20 @@ class AnalyticsService:
                     row['scan_id']
                 )
                 
-                cookies = []
-                for cookie_row in cookie_rows:
-                    metadata = cookie_row['metadata'] or {}
-                    cookies.append(Cookie(
-                        cookie_id=cookie_row['cookie_id'],
-                        name=cookie_row['name'],
-                        domain=cookie_row['domain'],
-                        path=cookie_row['path'],
-                        hashed_value=cookie_row['hashed_value'],
-                        category=cookie_row['category'],
-                        vendor=cookie_row['vendor'],
-                        cookie_type=CookieType(cookie_row['cookie_type']) if cookie_row['cookie_type'] else None,
-                        set_after_accept=cookie_row['set_after_accept'],
-                        cookie_duration=metadata.get('cookie_duration'),
-                        size=metadata.get('size'),
-                        http_only=metadata.get('http_only', False),
-                        secure=metadata.get('secure', False),
-                        same_site=metadata.get('same_site'),
-                        description=metadata.get('description'),
-                        iab_purposes=metadata.get('iab_purposes', []),
-                        source=metadata.get('source')
-                    ))
+                cookies = build_cookies(cookie_rows)
                 
-                scan_results.append(ScanResult(
+                scan_results.append(ScanDC(
                     scan_id=row['scan_id'],
                     domain_config_id=row['domain_config_id'],
                     domain=row['domain'],
-                    scan_mode=ScanMode(row['scan_mode']),
+                    scan_mode=row['scan_mode'],
                     timestamp_utc=row['timestamp_utc'],
                     status=row['status'],
                     duration_seconds=row['duration_seconds'],
                     page_count=row['page_count'],
                     cookies=cookies,
                     storages={},
-                    params=row['params'],
+                    params=row['params'] or {},
                     error=row['error']
                 ))
             
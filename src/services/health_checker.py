@@ -268,6 +268,13 @@ class HealthChecker:
             except Exception as e:
                 logger.error(f"Failed to get database metrics: {e}")
         
+        # Sync (psycopg2) pool used by QueryOptimizer and batch operations
+        try:
+            from src.database.connection import get_db_connection
+            metrics['database']['sync_pool'] = get_db_connection().get_pool_stats()
+        except RuntimeError:
+            pass
+        
         # Redis metrics
         if self.redis_client:
             try:
@@ -299,8 +299,7 @@ class NotificationService:
                     event=event,
                     channel=channel,
                     status=NotificationStatus.PENDING,
-                    data=notification_data,
-                    created_at=datetime.utcnow()
+                    data=notification_data
                 )
                 notifications.append(notification)
         
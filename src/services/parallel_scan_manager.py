@@ -4,7 +4,7 @@ Parallel scan manager for concurrent domain scanning.
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 from uuid import UUID
 from datetime import datetime
 
@@ -42,6 +42,8 @@ class ParallelScanManager:
         self.max_concurrency = max_concurrency
         self.semaphore = asyncio.Semaphore(max_concurrency)
         self.active_scans: Dict[UUID, Dict[str, Any]] = {}
+        # Strong references to fire-and-forget bookkeeping tasks
+        self._background_tasks: Set[asyncio.Task] = set()
         
         logger.info(f"ParallelScanManager initialized with max_concurrency={max_concurrency}")
     
@@ -115,6 +117,112 @@ class ParallelScanManager:
         logger.info(f"Completed parallel scan of {len(domains)} domains")
         return processed_results
     
+    async def enqueue_multiple_domains(
+        self,
+        domains: List[Dict[str, Any]],
+        scan_mode: ScanMode = ScanMode.QUICK,
+        profile: Optional[ScanProfile] = None
+    ) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+        """
+        Create scan records for multiple domains and queue them as one Celery group.
+        
+        The scans run on the Celery workers; all tasks are published in one
+        group.apply_async() call over a single broker connection instead of
+        one .delay() round-trip per domain.
+        
+        Args:
+            domains: List of domain configurations (see scan_multiple_domains)
+            scan_mode: Scan mode to use for all domains
+            profile: Optional scan profile to apply
+            
+        Returns:
+            Tuple of (group ID or None if queueing failed, per-domain result dicts)
+        """
+        from celery import group
+        from src.services.scan_tasks import execute_scan_async
+        
+        if not domains:
+            return None, []
+        
+        scans = [
+            {
+                "domain": domain_config["domain"],
+                "domain_config_id": domain_config["domain_config_id"],
+                "params": domain_config.get("params") or ScanParams()
+            }
+            for domain_config in domains
+        ]
+        scan_ids = await self.scan_service.create_scans(scans, scan_mode, profile)
+        queued = [
+            (scan_id, domain_config, scan["params"])
+            for scan_id, domain_config, scan in zip(scan_ids, domains, scans)
+        ]
+        
+        job = group(
+            execute_scan_async.s(
+                scan_id=str(scan_id),
+                domain=domain_config["domain"],
+                domain_config_id=str(domain_config["domain_config_id"]),
+                scan_mode=scan_mode.value,
+                params=params.model_dump(),
+                profile_id=str(profile.profile_id) if profile else None
+            )
+            for scan_id, domain_config, params in queued
+        )
+        
+        timestamp = datetime.utcnow().isoformat()
+        try:
+            group_result = job.apply_async()
+        except Exception as e:
+            logger.error(f"Failed to queue batch of {len(queued)} scans: {e}")
+            # Nobody waits on the status writes, so answer right away
+            self._run_in_background(self._mark_failed(
+                [scan_id for scan_id, _, _ in queued],
+                str(e)
+            ))
+            return None, [
+                {
+                    "scan_id": str(scan_id),
+                    "domain": domain_config["domain"],
+                    "domain_config_id": str(domain_config["domain_config_id"]),
+                    "status": "failed",
+                    "error": str(e),
+                    "timestamp": timestamp
+                }
+                for scan_id, domain_config, _ in queued
+            ]
+        
+        logger.info(f"Queued batch {group_result.id} of {len(queued)} scans")
+        return group_result.id, [
+            {
+                "scan_id": str(scan_id),
+                "domain": domain_config["domain"],
+                "domain_config_id": str(domain_config["domain_config_id"]),
+                "status": "queued",
+                "timestamp": timestamp
+            }
+            for scan_id, domain_config, _ in queued
+        ]
+    
+    def _run_in_background(self, coro):
+        """Run a coroutine without awaiting it, keeping the task referenced until done."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _mark_failed(self, scan_ids: List[UUID], error: str):
+        """Mark scans that could not be queued as failed."""
+        results = await asyncio.gather(
+            *(
+                self.scan_service._update_scan_status(scan_id, ScanStatus.FAILED, error=error)
+                for scan_id in scan_ids
+            ),
+            return_exceptions=True
+        )
+        for scan_id, result in zip(scan_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to mark scan {scan_id} as failed: {result}")
+    
     async def _scan_with_semaphore(
         self,
         domain_config: Dict[str, Any],
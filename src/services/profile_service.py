@@ -3,7 +3,9 @@ Scan profile service for CRUD operations.
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple, Union
 from uuid import UUID, uuid4
 from datetime import datetime
 
@@ -16,6 +18,53 @@ from src.core.config import get_config
 logger = logging.getLogger(__name__)
 settings = get_config()
 
+# Fixed statement texts, so asyncpg's per-connection statement cache
+# (keyed on the SQL string) reuses the server-side prepared statement
+# instead of re-parsing and re-planning on every call
+_INSERT_PROFILE_SQL = """
+    INSERT INTO scan_profiles (
+        profile_id, name, scan_mode, config, created_by, created_at, updated_at
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7)
+    RETURNING *
+"""
+_SELECT_PROFILE_SQL = "SELECT * FROM scan_profiles WHERE profile_id = $1"
+_UPDATE_PROFILE_SQL = """
+    UPDATE scan_profiles
+    SET name = COALESCE($1, name),
+        scan_mode = COALESCE($2, scan_mode),
+        config = $3,
+        updated_at = $4
+    WHERE profile_id = $5
+    RETURNING *
+"""
+_DELETE_PROFILE_SQL = "DELETE FROM scan_profiles WHERE profile_id = $1"
+
+
+class _ConnectionScope:
+    """Pool connection shared by every service call made within one scope."""
+    
+    def __init__(self, db_pool: asyncpg.Pool):
+        self.db_pool = db_pool
+        self.conn: Optional[asyncpg.Connection] = None
+    
+    async def get(self) -> asyncpg.Connection:
+        """Acquire the connection on first use so cache hits never touch the pool."""
+        if self.conn is None:
+            self.conn = await self.db_pool.acquire()
+        return self.conn
+    
+    async def release(self):
+        """Return the connection to the pool if one was acquired."""
+        if self.conn is not None:
+            conn, self.conn = self.conn, None
+            await self.db_pool.release(conn)
+
+
+_connection_scope: ContextVar[Optional[_ConnectionScope]] = ContextVar(
+    "profile_connection_scope", default=None
+)
+
 
 class ProfileService:
     """Service for managing scan profiles."""
@@ -24,6 +73,35 @@ class ProfileService:
         """Initialize profile service with database pool."""
         self.db_pool = db_pool
     
+    @asynccontextmanager
+    async def request_scope(self) -> AsyncIterator["ProfileService"]:
+        """
+        Share one pooled connection across all calls made inside the block.
+        
+        Used per API request, so chained calls (update_profile reads the
+        existing row first) don't each check out their own connection.
+        
+        Yields:
+            This service
+        """
+        scope = _ConnectionScope(self.db_pool)
+        token = _connection_scope.set(scope)
+        try:
+            yield self
+        finally:
+            _connection_scope.reset(token)
+            await scope.release()
+    
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[asyncpg.Connection]:
+        """Use the current request-scoped connection, or a fresh one from the pool."""
+        scope = _connection_scope.get()
+        if scope is None:
+            async with self.db_pool.acquire() as conn:
+                yield conn
+        else:
+            yield await scope.get()
+    
     async def create_profile(
         self,
         profile_data: ScanProfileCreate,
@@ -56,15 +134,9 @@ class ProfileService:
             'viewport': profile_data.viewport
         }
         
-        async with self.db_pool.acquire() as conn:
+        async with self._connection() as conn:
             row = await conn.fetchrow(
-                """
-                INSERT INTO scan_profiles (
-                    profile_id, name, scan_mode, config, created_by, created_at, updated_at
-                )
-                VALUES ($1, $2, $3, $4, $5, $6, $7)
-                RETURNING *
-                """,
+                _INSERT_PROFILE_SQL,
                 profile_id,
                 profile_data.name,
                 profile_data.scan_mode,
@@ -76,7 +148,7 @@ class ProfileService:
             
             return self._row_to_profile(row)
     
-    async def get_profile(self, profile_id: UUID) -> Optional[ScanProfile]:
+    async def get_profile(self, profile_id: Union[UUID, str]) -> Optional[ScanProfile]:
         """
         Get a scan profile by ID.
         
@@ -86,14 +158,11 @@ class ProfileService:
         Returns:
             ScanProfile if found, None otherwise
         """
-        async with self.db_pool.acquire() as conn:
-            row = await conn.fetchrow(
-                "SELECT * FROM scan_profiles WHERE profile_id = $1",
-                profile_id
-            )
+        async with self._connection() as conn:
+            row = await conn.fetchrow(_SELECT_PROFILE_SQL, profile_id)
             
             if row:
-                return self._row_to_profile(row)
+                return self._row_to_profile(row, trusted=True)
             return None
     
     async def list_profiles(
@@ -101,7 +170,8 @@ class ProfileService:
         scan_mode: Optional[str] = None,
         created_by: Optional[UUID] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[UUID] = None
     ) -> List[ScanProfile]:
         """
         List scan profiles with optional filtering.
@@ -110,11 +180,56 @@ class ProfileService:
             scan_mode: Filter by scan mode
             created_by: Filter by creator
             limit: Maximum number of results
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored when cursor is given)
+            cursor: ID of the last profile from the previous page; enables
+                keyset pagination, which stays cheap on deep pages
             
         Returns:
             List of ScanProfile objects
         """
+        query, params = self._build_list_query(scan_mode, created_by, limit, offset, cursor)
+        
+        async with self._connection() as conn:
+            rows = await conn.fetch(query, *params)
+            return [self._row_to_profile(row, trusted=True) for row in rows]
+    
+    async def iter_profiles(
+        self,
+        scan_mode: Optional[str] = None,
+        created_by: Optional[UUID] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[UUID] = None
+    ) -> AsyncIterator[ScanProfile]:
+        """
+        Stream scan profiles through a server-side cursor.
+        
+        Same filtering as list_profiles, but rows are fetched in small
+        batches so a large page never sits in memory all at once. The pool
+        connection is held until the iterator is exhausted or closed.
+        
+        Yields:
+            ScanProfile objects
+        """
+        query, params = self._build_list_query(scan_mode, created_by, limit, offset, cursor)
+        
+        # Always a dedicated connection: the stream is consumed after the
+        # request scope has already released its connection
+        async with self.db_pool.acquire() as conn:
+            # asyncpg cursors only exist inside a transaction
+            async with conn.transaction():
+                async for row in conn.cursor(query, *params):
+                    yield self._row_to_profile(row, trusted=True)
+    
+    def _build_list_query(
+        self,
+        scan_mode: Optional[str],
+        created_by: Optional[UUID],
+        limit: int,
+        offset: int,
+        cursor: Optional[UUID]
+    ) -> Tuple[str, List[Any]]:
+        """Build the filtered, paginated profile listing query."""
         query = "SELECT * FROM scan_profiles WHERE 1=1"
         params = []
         param_count = 0
@@ -129,23 +244,30 @@ class ProfileService:
             query += f" AND created_by = ${param_count}"
             params.append(created_by)
         
-        query += " ORDER BY created_at DESC"
+        if cursor:
+            param_count += 1
+            query += (
+                " AND (created_at, profile_id) < "
+                f"(SELECT created_at, profile_id FROM scan_profiles WHERE profile_id = ${param_count})"
+            )
+            params.append(cursor)
+        
+        query += " ORDER BY created_at DESC, profile_id DESC"
         
         param_count += 1
         query += f" LIMIT ${param_count}"
         params.append(limit)
         
-        param_count += 1
-        query += f" OFFSET ${param_count}"
-        params.append(offset)
+        if not cursor:
+            param_count += 1
+            query += f" OFFSET ${param_count}"
+            params.append(offset)
         
-        async with self.db_pool.acquire() as conn:
-            rows = await conn.fetch(query, *params)
-            return [self._row_to_profile(row) for row in rows]
+        return query, params
     
     async def update_profile(
         self,
-        profile_id: UUID,
+        profile_id: Union[UUID, str],
         profile_data: ScanProfileUpdate
     ) -> Optional[ScanProfile]:
         """
@@ -163,13 +285,6 @@ class ProfileService:
         if not existing:
             return None
         
-        # Build update dict with only provided fields
-        update_fields = {}
-        if profile_data.name is not None:
-            update_fields['name'] = profile_data.name
-        if profile_data.scan_mode is not None:
-            update_fields['scan_mode'] = profile_data.scan_mode
-        
         # Update config fields
         config = existing.config.copy()
         if profile_data.max_depth is not None:
@@ -193,36 +308,22 @@ class ProfileService:
         if profile_data.viewport is not None:
             config['viewport'] = profile_data.viewport
         
-        update_fields['config'] = config
-        update_fields['updated_at'] = datetime.utcnow()
-        
-        # Build dynamic update query
-        set_clauses = []
-        params = []
-        param_count = 0
-        
-        for field, value in update_fields.items():
-            param_count += 1
-            set_clauses.append(f"{field} = ${param_count}")
-            params.append(value)
-        
-        param_count += 1
-        params.append(profile_id)
-        
-        query = f"""
-            UPDATE scan_profiles
-            SET {', '.join(set_clauses)}
-            WHERE profile_id = ${param_count}
-            RETURNING *
-        """
-        
-        async with self.db_pool.acquire() as conn:
-            row = await conn.fetchrow(query, *params)
+        # name and scan_mode are COALESCEd in SQL so the statement text
+        # stays the same whichever fields the client sent
+        async with self._connection() as conn:
+            row = await conn.fetchrow(
+                _UPDATE_PROFILE_SQL,
+                profile_data.name,
+                profile_data.scan_mode,
+                config,
+                datetime.utcnow(),
+                profile_id
+            )
             if row:
                 return self._row_to_profile(row)
             return None
     
-    async def delete_profile(self, profile_id: UUID) -> bool:
+    async def delete_profile(self, profile_id: Union[UUID, str]) -> bool:
         """
         Delete a scan profile.
         
@@ -232,15 +333,12 @@ class ProfileService:
         Returns:
             True if deleted, False if not found
         """
-        async with self.db_pool.acquire() as conn:
-            result = await conn.execute(
-                "DELETE FROM scan_profiles WHERE profile_id = $1",
-                profile_id
-            )
+        async with self._connection() as conn:
+            result = await conn.execute(_DELETE_PROFILE_SQL, profile_id)
             # Result format is "DELETE N" where N is number of rows
             return result.split()[-1] != '0'
     
-    async def validate_profile(self, profile_id: UUID) -> bool:
+    async def validate_profile(self, profile_id: Union[UUID, str]) -> bool:
         """
         Validate that a profile exists and is valid.
         
@@ -253,19 +351,20 @@ class ProfileService:
         profile = await self.get_profile(profile_id)
         return profile is not None
     
-    def _row_to_profile(self, row: asyncpg.Record) -> ScanProfile:
+    def _row_to_profile(self, row: asyncpg.Record, trusted: bool = False) -> ScanProfile:
         """
         Convert database row to ScanProfile model.
         
         Args:
             row: Database row
+            trusted: Skip model validation (read paths only)
             
         Returns:
             ScanProfile object
         """
         config = row['config'] or {}
         
-        return ScanProfile(
+        fields = dict(
             profile_id=row['profile_id'],
             name=row['name'],
             scan_mode=row['scan_mode'],
@@ -285,3 +384,11 @@ class ProfileService:
             user_agent=config.get('user_agent'),
             viewport=config.get('viewport', {"width": 1366, "height": 768})
         )
+        
+        if trusted:
+            # Rows were validated on the way in by create/update, and the
+            # table constraints keep them in shape, so re-running the
+            # validators on every read is pure overhead
+            return ScanProfile.model_construct(**fields)
+        
+        return ScanProfile(**fields)
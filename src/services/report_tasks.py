@@ -8,7 +8,7 @@ from typing import Dict, Any, Optional
 from uuid import UUID
 from celery import Task
 from src.services.celery_app import celery_app
-from src.models.scan import ScanResult
+from src.models.scan import ScanDC, CookieDC, ScanMode, ScanStatus
 from src.models.report import Report, ReportFormat
 from src.analytics.report_generator import ReportGenerator
 from src.database.connection import get_db_connection
@@ -260,7 +260,7 @@ def cleanup_old_reports(days: int = 30) -> Dict[str, Any]:
 
 # Helper functions
 
-def _fetch_scan_result(scan_id: str) -> Optional[ScanResult]:
+def _fetch_scan_result(scan_id: str) -> Optional[ScanDC]:
     """
     Fetch scan result from src.database.
     
@@ -268,7 +268,7 @@ def _fetch_scan_result(scan_id: str) -> Optional[ScanResult]:
         scan_id: Scan ID to fetch
         
     Returns:
-        ScanResult object or None if not found
+        ScanDC object or None if not found
     """
     try:
         # Get database connection
@@ -307,14 +307,13 @@ def _fetch_scan_result(scan_id: str) -> Optional[ScanResult]:
         
         cookie_rows = cursor.fetchall()
         
-        # Construct ScanResult object
-        from src.models.scan import Cookie, ScanMode, ScanStatus
+        # Construct ScanDC object (trusted DB rows, no per-field validation)
         import json
         
         cookies = []
         for cookie_row in cookie_rows:
             metadata = cookie_row[8] if cookie_row[8] else {}
-            cookie = Cookie(
+            cookie = CookieDC(
                 name=cookie_row[0],
                 domain=cookie_row[1],
                 path=cookie_row[2],
@@ -334,13 +333,13 @@ def _fetch_scan_result(scan_id: str) -> Optional[ScanResult]:
             )
             cookies.append(cookie)
         
-        scan_result = ScanResult(
+        scan_result = ScanDC(
             scan_id=UUID(row[0]),
             domain_config_id=UUID(row[1]) if row[1] else None,
             domain=row[2],
-            scan_mode=ScanMode(row[3]) if row[3] else ScanMode.QUICK,
+            scan_mode=row[3] or ScanMode.QUICK.value,
             timestamp_utc=row[4],
-            status=ScanStatus(row[5]) if row[5] else ScanStatus.COMPLETED,
+            status=row[5] or ScanStatus.SUCCESS.value,
             duration_seconds=row[6],
             total_cookies=row[7],
             page_count=row[8],
@@ -0,0 +1,155 @@
+"""
+Outbox dispatcher that publishes queued scans to Celery.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import asyncpg
+import orjson
+
+logger = logging.getLogger(__name__)
+
+_CLAIM_OUTBOX_SQL = """
+    SELECT outbox_id, payload
+    FROM scan_outbox
+    ORDER BY outbox_id
+    LIMIT $1
+    FOR UPDATE SKIP LOCKED
+"""
+_DELETE_OUTBOX_SQL = "DELETE FROM scan_outbox WHERE outbox_id = ANY($1::bigint[])"
+
+
+class ScanOutboxDispatcher:
+    """
+    Background task draining the scan_outbox table into Celery.
+
+    ScanService.create_scan(enqueue=True) writes the scan row and its task
+    payload in one transaction; this dispatcher claims pending rows with
+    FOR UPDATE SKIP LOCKED (so several API workers can run it side by
+    side), publishes them as one Celery group and deletes them in the same
+    transaction. If the broker is down the transaction rolls back and the
+    rows are retried on the next poll. Delivery is at-least-once.
+    """
+
+    def __init__(
+        self,
+        db_pool: asyncpg.Pool,
+        poll_interval: float = 1.0,
+        batch_size: int = 100
+    ):
+        """
+        Initialize outbox dispatcher.
+
+        Args:
+            db_pool: Database pool
+            poll_interval: Seconds between polls when not woken (default 1.0)
+            batch_size: Maximum outbox rows published per round (default 100)
+        """
+        self.db_pool = db_pool
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the dispatch loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("Scan outbox dispatcher started")
+
+    def wake(self):
+        """Drain right away instead of waiting for the next poll."""
+        self._wakeup.set()
+
+    async def stop(self):
+        """Stop the dispatch loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Scan outbox dispatcher stopped")
+
+    async def _run(self):
+        """Drain the outbox, then wait for a wakeup or the poll interval."""
+        while True:
+            try:
+                # Keep going while full batches come back
+                while await self.dispatch_once() == self.batch_size:
+                    pass
+            except Exception as e:
+                logger.error(f"Scan outbox dispatch failed: {e}")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def dispatch_once(self) -> int:
+        """
+        Publish one batch of pending outbox rows.
+
+        Returns:
+            Number of scans published
+        """
+        from celery import group
+        from src.services.scan_tasks import execute_scan_async
+
+        async with self.db_pool.acquire() as conn:
+            async with conn.transaction():
+                rows = await conn.fetch(_CLAIM_OUTBOX_SQL, self.batch_size)
+                if not rows:
+                    return 0
+
+                job = group(
+                    execute_scan_async.s(**orjson.loads(row['payload']))
+                    for row in rows
+                )
+                # Broker publishing is blocking I/O. It runs while the claim
+                # transaction is still open, so the rows stay locked until the
+                # publish returns; a crash after publishing but before commit
+                # republishes the batch (at-least-once)
+                await asyncio.to_thread(job.apply_async)
+
+                await conn.execute(_DELETE_OUTBOX_SQL, [row['outbox_id'] for row in rows])
+
+        logger.info(f"Published {len(rows)} scans from the outbox")
+        return len(rows)
+
+
+_global_dispatcher: Optional[ScanOutboxDispatcher] = None
+
+
+def get_scan_outbox_dispatcher(db_pool: asyncpg.Pool, **kwargs) -> ScanOutboxDispatcher:
+    """
+    Get or create the global outbox dispatcher.
+
+    Args:
+        db_pool: Database pool
+        **kwargs: Arguments for ScanOutboxDispatcher
+
+    Returns:
+        ScanOutboxDispatcher instance
+    """
+    global _global_dispatcher
+
+    if _global_dispatcher is None:
+        _global_dispatcher = ScanOutboxDispatcher(db_pool, **kwargs)
+
+    return _global_dispatcher
+
+
+async def close_scan_outbox_dispatcher():
+    """Stop the global outbox dispatcher."""
+    global _global_dispatcher
+
+    if _global_dispatcher:
+        await _global_dispatcher.stop()
+        _global_dispatcher = None
@@ -12,6 +12,7 @@ from datetime import datetime
 from urllib.parse import urljoin, urlparse
 
 import asyncpg
+import orjson
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 from playwright_stealth import Stealth
 
@@ -30,6 +31,64 @@ from src.services.cookie_categorization import (
 logger = logging.getLogger(__name__)
 stealth = Stealth()
 
+# Latest progress is kept under the channel name as well, for subscribers
+# that connect between updates
+SCAN_PROGRESS_SNAPSHOT_TTL = 60  # seconds
+
+
+_INSERT_SCAN_SQL = """
+    INSERT INTO scan_results (
+        scan_id, domain_config_id, domain, scan_mode,
+        timestamp_utc, status, params, created_at, updated_at
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+"""
+
+# Cookie statistics are computed once when a scan's cookies are written,
+# so reads are a primary-key lookup on scan_cookie_stats
+_UPSERT_COOKIE_STATS_SQL = """
+    INSERT INTO scan_cookie_stats (
+        scan_id, total_cookies, unique_cookies, first_party, third_party,
+        necessary, functional, analytics, advertising,
+        http_only_count, secure_count, unique_vendors, avg_size
+    )
+    SELECT
+        $1,
+        COUNT(*),
+        COUNT(DISTINCT name),
+        COUNT(*) FILTER (WHERE cookie_type = 'First Party'),
+        COUNT(*) FILTER (WHERE cookie_type = 'Third Party'),
+        COUNT(*) FILTER (WHERE category = 'Necessary'),
+        COUNT(*) FILTER (WHERE category = 'Functional'),
+        COUNT(*) FILTER (WHERE category = 'Analytics'),
+        COUNT(*) FILTER (WHERE category = 'Advertising'),
+        COUNT(*) FILTER (WHERE http_only = TRUE),
+        COUNT(*) FILTER (WHERE secure = TRUE),
+        COUNT(DISTINCT vendor),
+        AVG(size)
+    FROM cookies
+    WHERE scan_id = $1
+    ON CONFLICT (scan_id) DO UPDATE SET
+        total_cookies = EXCLUDED.total_cookies,
+        unique_cookies = EXCLUDED.unique_cookies,
+        first_party = EXCLUDED.first_party,
+        third_party = EXCLUDED.third_party,
+        necessary = EXCLUDED.necessary,
+        functional = EXCLUDED.functional,
+        analytics = EXCLUDED.analytics,
+        advertising = EXCLUDED.advertising,
+        http_only_count = EXCLUDED.http_only_count,
+        secure_count = EXCLUDED.secure_count,
+        unique_vendors = EXCLUDED.unique_vendors,
+        avg_size = EXCLUDED.avg_size,
+        updated_at = NOW()
+"""
+
+
+def scan_progress_channel(scan_id: UUID) -> str:
+    """Redis pub/sub channel (and snapshot key) for a scan's progress updates."""
+    return f"scan:progress:{scan_id}"
+
 
 class ScanService:
     """Service for managing scans with real-time progress streaming."""
@@ -38,11 +97,18 @@ class ScanService:
         self,
         db_pool: asyncpg.Pool,
         redis_client=None,
-        browser_pool: Optional[BrowserPool] = None
+        browser_pool: Optional[BrowserPool] = None,
+        async_redis_client=None
     ):
-        """Initialize scan service."""
+        """
+        Initialize scan service.
+        
+        redis_client (sync) publishes progress from workers;
+        async_redis_client (redis.asyncio) serves progress reads in the API.
+        """
         self.db_pool = db_pool
         self.redis_client = redis_client
+        self.async_redis_client = async_redis_client
         self.browser_pool = browser_pool
         self.active_scans: Dict[UUID, Dict[str, Any]] = {}
     
@@ -52,7 +118,8 @@ class ScanService:
         domain_config_id: UUID,
         scan_mode: ScanMode,
         params: ScanParams,
-        profile: Optional[ScanProfile] = None
+        profile: Optional[ScanProfile] = None,
+        enqueue: bool = False
     ) -> UUID:
         """
         Create a new scan record in database.
@@ -63,6 +130,9 @@ class ScanService:
             scan_mode: Scan mode
             params: Scan parameters
             profile: Optional scan profile
+            enqueue: Also write the execute_scan_async payload to the scan
+                outbox in the same transaction, for the outbox dispatcher
+                to publish
             
         Returns:
             Scan ID
@@ -75,26 +145,80 @@ class ScanService:
             params = self._merge_profile_params(params, profile)
         
         async with self.db_pool.acquire() as conn:
-            await conn.execute(
-                """
-                INSERT INTO scan_results (
-                    scan_id, domain_config_id, domain, scan_mode,
-                    timestamp_utc, status, params, created_at, updated_at
+            async with conn.transaction():
+                await conn.execute(
+                    _INSERT_SCAN_SQL,
+                    scan_id,
+                    domain_config_id,
+                    domain,
+                    scan_mode,
+                    now,
+                    ScanStatus.PENDING,
+                    params.model_dump_json(),
+                    now,
+                    now
                 )
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                """,
+                
+                if enqueue:
+                    payload = {
+                        "scan_id": str(scan_id),
+                        "domain": domain,
+                        "domain_config_id": str(domain_config_id),
+                        "scan_mode": ScanMode(scan_mode).value,
+                        "params": params.model_dump(),
+                        "profile_id": str(profile.profile_id) if profile else None
+                    }
+                    await conn.execute(
+                        "INSERT INTO scan_outbox (scan_id, payload) VALUES ($1, $2)",
+                        scan_id,
+                        orjson.dumps(payload).decode()
+                    )
+        
+        return scan_id
+    
+    async def create_scans(
+        self,
+        scans: List[Dict[str, Any]],
+        scan_mode: ScanMode,
+        profile: Optional[ScanProfile] = None
+    ) -> List[UUID]:
+        """
+        Create scan records for several domains in one round-trip.
+        
+        Args:
+            scans: List of dicts with domain, domain_config_id and params
+                (ScanParams)
+            scan_mode: Scan mode for all scans
+            profile: Optional scan profile
+            
+        Returns:
+            Scan IDs, in the order of scans
+        """
+        now = datetime.utcnow()
+        scan_ids = [uuid4() for _ in scans]
+        
+        records = []
+        for scan_id, scan in zip(scan_ids, scans):
+            params = scan["params"]
+            if profile:
+                params = self._merge_profile_params(params, profile)
+            records.append((
                 scan_id,
-                domain_config_id,
-                domain,
+                scan["domain_config_id"],
+                scan["domain"],
                 scan_mode,
                 now,
                 ScanStatus.PENDING,
-                json.dumps(params.dict()),
+                params.model_dump_json(),
                 now,
                 now
-            )
+            ))
         
-        return scan_id
+        # executemany pipelines all rows through one prepared statement
+        async with self.db_pool.acquire() as conn:
+            await conn.executemany(_INSERT_SCAN_SQL, records)
+        
+        return scan_ids
     
     async def execute_scan_with_progress(
         self,
@@ -266,7 +390,7 @@ class ScanService:
             try:
                 context = await browser_instance.create_context(
                     user_agent=params.user_agent,
-                    viewport=params.viewport
+                    viewport=params.viewport._asdict()
                 )
                 
                 page = await context.new_page()
@@ -298,7 +422,7 @@ class ScanService:
                 
                 context = await browser.new_context(
                     user_agent=params.user_agent or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    viewport=params.viewport
+                    viewport=params.viewport._asdict()
                 )
                 await stealth.apply_stealth_async(context)
                 
@@ -356,7 +480,7 @@ class ScanService:
             try:
                 context = await browser_instance.create_context(
                     user_agent=params.user_agent,
-                    viewport=params.viewport
+                    viewport=params.viewport._asdict()
                 )
                 
                 page = await context.new_page()
@@ -380,7 +504,7 @@ class ScanService:
                 
                 context = await browser.new_context(
                     user_agent=params.user_agent or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    viewport=params.viewport
+                    viewport=params.viewport._asdict()
                 )
                 await stealth.apply_stealth_async(context)
                 
@@ -589,31 +713,46 @@ class ScanService:
         cookies = result.get("cookies", [])
         pages_visited = result.get("pages_visited", [])
         
+        # Stored with the scan so reads never aggregate the cookies table
+        first_party = sum(1 for c in cookies if c.get('cookie_type') == 'First Party')
+        third_party = sum(1 for c in cookies if c.get('cookie_type') == 'Third Party')
+        
         async with self.db_pool.acquire() as conn:
-            # Update scan result
-            await conn.execute(
-                """
-                UPDATE scan_results
-                SET status = $1, duration_seconds = $2, total_cookies = $3,
-                    page_count = $4, updated_at = $5
-                WHERE scan_id = $6
-                """,
-                status,
-                duration,
-                len(cookies),
-                len(pages_visited),
-                datetime.utcnow(),
-                scan_id
-            )
+            async with conn.transaction():
+                # Update scan result
+                await conn.execute(
+                    """
+                    UPDATE scan_results
+                    SET status = $1, duration_seconds = $2, total_cookies = $3,
+                        page_count = $4, updated_at = $5,
+                        first_party_cookies = $6, third_party_cookies = $7
+                    WHERE scan_id = $8
+                    """,
+                    status,
+                    duration,
+                    len(cookies),
+                    len(pages_visited),
+                    datetime.utcnow(),
+                    first_party,
+                    third_party,
+                    scan_id
+                )
+                
+                # Store cookies using batch operations
+                if cookies:
+                    try:
+                        await self._store_cookies_batch(conn, scan_id, cookies)
+                        logger.info(f"Stored {len(cookies)} cookies for scan {scan_id}")
+                    except Exception as e:
+                        logger.error(f"Failed to store cookies for scan {scan_id}: {e}")
+                        raise
             
-            # Store cookies using batch operations
-            if cookies:
-                try:
-                    await self._store_cookies_batch(conn, scan_id, cookies)
-                    logger.info(f"Stored {len(cookies)} cookies for scan {scan_id}")
-                except Exception as e:
-                    logger.error(f"Failed to store cookies for scan {scan_id}: {e}")
-                    raise
+            # Outside the transaction: a stats failure must not roll back the
+            # scan, and readers fall back to aggregating the cookies table
+            try:
+                await conn.execute(_UPSERT_COOKIE_STATS_SQL, scan_id)
+            except Exception as e:
+                logger.warning(f"Failed to store cookie stats for scan {scan_id}: {e}")
     
     async def _store_cookies_batch(
         self,
@@ -764,9 +903,60 @@ class ScanService:
             viewport=params.viewport or profile.viewport
         )
     
+    async def publish_progress(self, progress: ScanProgress):
+        """
+        Publish a progress update to Redis for SSE subscribers.
+        
+        Scans run in Celery workers, so this is how API processes see their
+        progress. Failures are logged and never interrupt the scan.
+        
+        Args:
+            progress: Progress update to publish
+        """
+        if self.redis_client is None:
+            return
+        
+        channel = scan_progress_channel(progress.scan_id)
+        # Naive UTC timestamps go out with a Z suffix
+        payload = orjson.dumps(
+            progress.model_dump(),
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+        ).decode()
+        
+        try:
+            # The client is synchronous; keep its round trip off the scan's loop
+            await asyncio.to_thread(self._publish_progress_sync, channel, payload)
+        except Exception as e:
+            logger.warning(f"Failed to publish progress for scan {progress.scan_id}: {e}")
+    
+    def _publish_progress_sync(self, channel: str, payload: str):
+        """Store the progress snapshot and publish it in one round trip."""
+        pipe = self.redis_client.pipeline()
+        pipe.setex(channel, SCAN_PROGRESS_SNAPSHOT_TTL, payload)
+        pipe.publish(channel, payload)
+        pipe.execute()
+    
     async def get_scan_progress(self, scan_id: UUID) -> Optional[ScanProgress]:
-        """Get current progress of an active scan."""
+        """
+        Get current progress of an active scan.
+        
+        Scans running in this process are answered from memory; otherwise
+        the latest snapshot published by the worker is read from Redis.
+        Never touches Postgres.
+        """
         progress_data = self.active_scans.get(scan_id)
         if progress_data:
             return self._create_progress(progress_data)
-        return None
+        
+        if self.async_redis_client is None:
+            return None
+        
+        try:
+            snapshot = await self.async_redis_client.get(scan_progress_channel(scan_id))
+        except Exception as e:
+            logger.warning(f"Failed to read progress for scan {scan_id}: {e}")
+            return None
+        
+        if snapshot is None:
+            return None
+        return ScanProgress.model_validate_json(snapshot)
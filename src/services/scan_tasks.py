@@ -7,12 +7,38 @@ import asyncio
 from uuid import UUID
 from typing import Optional
 
+from redis import Redis
+
+from src.core.config import get_config
 from src.services.celery_app import celery_app
 from src.models.scan import ScanMode, ScanParams
 from src.models.profile import ScanProfile
 
 logger = logging.getLogger(__name__)
 
+# Worker-process Redis client for progress publishing, created on first use
+_worker_redis: Optional[Redis] = None
+
+
+def get_worker_redis_client() -> Optional[Redis]:
+    """
+    Get the worker's Redis client, built from config.redis.url.
+    
+    Returns:
+        Redis client, or None if Redis is not configured
+    """
+    global _worker_redis
+    if _worker_redis is None:
+        config = get_config()
+        if getattr(config, 'redis', None) and config.redis.url:
+            _worker_redis = Redis.from_url(
+                config.redis.url,
+                decode_responses=True,
+                socket_connect_timeout=5,
+                socket_timeout=5
+            )
+    return _worker_redis
+
 
 @celery_app.task(name='execute_scan_async', bind=True, max_retries=3)
 def execute_scan_async(
@@ -42,13 +68,12 @@ def execute_scan_async(
     try:
         # Import here to avoid circular dependencies
         from src.database.connection import get_db_pool
-        from src.cache.redis_client import get_redis_client
         from src.services.scan_service import ScanService
         from src.services.profile_service import ProfileService
         
         # Get database pool and Redis client
         db_pool = get_db_pool()
-        redis_client = get_redis_client()
+        redis_client = get_worker_redis_client()
         
         # Create scan service
         scan_service = ScanService(db_pool, redis_client)
@@ -70,7 +95,7 @@ def execute_scan_async(
                 domain_config_id=UUID(domain_config_id),
                 params=scan_params,
                 scan_mode=ScanMode(scan_mode),
-                progress_callback=None  # No callback for async execution
+                progress_callback=scan_service.publish_progress  # Feeds the SSE stream
             )
         )
         
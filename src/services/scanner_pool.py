@@ -0,0 +1,215 @@
+"""
+Scanner pool for reusing started ParallelCookieScanner instances across requests.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any, List, Optional
+
+from src.scanners.parallel_scanner import ParallelCookieScanner
+
+logger = logging.getLogger(__name__)
+
+
+class ScannerPool:
+    """
+    Pool of started parallel scanners.
+
+    Launching Playwright takes seconds and hundreds of MB per browser, so
+    scanners are checked out exclusively for one scan and returned to an
+    idle list afterwards. Concurrency and timeout are applied per checkout,
+    so any idle scanner can serve any request. On release the scanner's
+    browser context is replaced, so no cookies or storage leak between scans.
+
+    Features:
+    - Lazy scanner creation on demand
+    - Bounded idle list (surplus scanners are stopped)
+    - Disconnected browsers are discarded on checkout
+    - Graceful shutdown
+    """
+
+    def __init__(self, max_idle: int = 4):
+        """
+        Initialize scanner pool.
+
+        Args:
+            max_idle: Maximum number of idle scanners kept warm (default 4)
+        """
+        if max_idle < 0:
+            raise ValueError("max_idle must be non-negative")
+
+        self.max_idle = max_idle
+
+        self.idle: List[ParallelCookieScanner] = []
+        self.in_use = 0
+        self.created = 0
+        self.reused = 0
+        self.is_closed = False
+
+        self._lock = asyncio.Lock()
+
+        logger.info(f"ScannerPool initialized: max_idle={max_idle}")
+
+    async def acquire(self, max_concurrent: int = 5, timeout: int = 30000) -> ParallelCookieScanner:
+        """
+        Check out a started scanner configured for one scan.
+
+        Args:
+            max_concurrent: Maximum concurrent page scans
+            timeout: Page navigation timeout in ms
+
+        Returns:
+            ParallelCookieScanner ready to scan
+        """
+        if self.is_closed:
+            raise RuntimeError("Scanner pool is closed")
+
+        scanner: Optional[ParallelCookieScanner] = None
+        stale: List[ParallelCookieScanner] = []
+
+        async with self._lock:
+            while self.idle:
+                candidate = self.idle.pop()
+                if candidate.is_running():
+                    scanner = candidate
+                    break
+                stale.append(candidate)
+            self.in_use += 1
+
+        for candidate in stale:
+            await self._stop(candidate)
+
+        try:
+            if scanner is None:
+                scanner = ParallelCookieScanner(max_concurrent=max_concurrent, timeout=timeout)
+                await scanner.start()
+                self.created += 1
+            else:
+                self.reused += 1
+        except BaseException:
+            # Also reached when the caller is cancelled mid-launch; a
+            # half-started scanner may already own a Playwright process
+            async with self._lock:
+                self.in_use -= 1
+            if scanner is not None:
+                await self._stop(scanner)
+            raise
+
+        scanner.configure(max_concurrent=max_concurrent, timeout=timeout)
+        return scanner
+
+    async def release(self, scanner: ParallelCookieScanner):
+        """
+        Return a scanner to the pool, or stop it if it cannot be reused.
+
+        Args:
+            scanner: Scanner previously returned by acquire()
+        """
+        async with self._lock:
+            self.in_use -= 1
+
+        if self.is_closed or not scanner.is_running():
+            await self._stop(scanner)
+            return
+
+        try:
+            await scanner.reset()
+        except Exception as e:
+            logger.warning(f"Failed to reset scanner, discarding: {e}")
+            await self._stop(scanner)
+            return
+
+        async with self._lock:
+            if len(self.idle) < self.max_idle and not self.is_closed:
+                self.idle.append(scanner)
+                return
+
+        await self._stop(scanner)
+
+    @asynccontextmanager
+    async def scanner(self, max_concurrent: int = 5, timeout: int = 30000) -> AsyncIterator[ParallelCookieScanner]:
+        """
+        Context manager that checks out a scanner and returns it afterwards.
+
+        Args:
+            max_concurrent: Maximum concurrent page scans
+            timeout: Page navigation timeout in ms
+
+        Yields:
+            ParallelCookieScanner ready to scan
+        """
+        scanner = await self.acquire(max_concurrent=max_concurrent, timeout=timeout)
+        try:
+            yield scanner
+        finally:
+            await self.release(scanner)
+
+    async def _stop(self, scanner: ParallelCookieScanner):
+        """Stop a scanner, logging rather than raising on failure."""
+        try:
+            await scanner.stop()
+        except Exception as e:
+            logger.warning(f"Failed to stop scanner: {e}")
+
+    async def close(self):
+        """Close the pool and stop all idle scanners."""
+        if self.is_closed:
+            return
+
+        logger.info("Closing scanner pool...")
+        self.is_closed = True
+
+        async with self._lock:
+            idle, self.idle = self.idle, []
+
+        for scanner in idle:
+            await self._stop(scanner)
+
+        logger.info("Scanner pool closed")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dict with pool statistics
+        """
+        return {
+            "max_idle": self.max_idle,
+            "idle_scanners": len(self.idle),
+            "in_use_scanners": self.in_use,
+            "created": self.created,
+            "reused": self.reused
+        }
+
+
+# Global scanner pool instance (singleton)
+_global_pool: Optional[ScannerPool] = None
+
+
+def get_scanner_pool(**kwargs) -> ScannerPool:
+    """
+    Get or create the global scanner pool.
+
+    Args:
+        **kwargs: ScannerPool arguments (only used on first call)
+
+    Returns:
+        ScannerPool instance
+    """
+    global _global_pool
+
+    if _global_pool is None:
+        _global_pool = ScannerPool(**kwargs)
+
+    return _global_pool
+
+
+async def close_scanner_pool():
+    """Close the global scanner pool."""
+    global _global_pool
+
+    if _global_pool:
+        await _global_pool.close()
+        _global_pool = None
@@ -147,7 +147,7 @@ async def test_create_scan_invalid_domain(client: AsyncClient, auth_token: str):
     )
     
     assert response.status_code == 400
-    assert "protocol" in response.json()["detail"].lower()
+    assert "protocol" in response.text.lower()
 
 
 @pytest.mark.asyncio
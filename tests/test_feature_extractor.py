@@ -346,6 +346,26 @@ class TestBatchExtraction:
         assert "name_length" in features_df.columns
         assert "is_third_party" in features_df.columns
 
+    def test_batch_matches_single(self, extractor):
+        cookies = [
+            {"name": "_ga", "domain": ".google-analytics.com", "cookie_duration": "2 years",
+             "secure": True, "sameSite": "Lax", "cookie_type": "Third Party"},
+            {"name": "sessionid", "domain": ".www.example.co.uk", "httpOnly": True,
+             "sameSite": "Strict", "size": 32, "path": "/app"},
+            {"name": "IDE", "domain": "doubleclick.net", "cookie_duration": "13 months",
+             "set_after_accept": True, "sameSite": None},
+            {"name": "lang", "domain": "localhost", "cookie_duration": "30 days"},
+            {"name": "csrf_token123", "domain": ".cdn.cloudflare.com", "cookie_duration": "12 hours"},
+        ]
+
+        records = extractor.extract_batch(cookies).to_dict("records")
+
+        for cookie, batch_features in zip(cookies, records):
+            single_features = extractor.extract(cookie)
+            assert set(single_features) == set(batch_features)
+            for name, value in single_features.items():
+                assert batch_features[name] == pytest.approx(value), name
+
 
 class TestCompleteExtraction:
     """Test complete feature extraction for real-world cookies."""
@@ -0,0 +1,166 @@
+"""
+Tests for server-side prepared statements in DatabaseConnection.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.database.connection import DatabaseConnection
+
+
+class FakeCursor:
+    """Cursor that records statements on its connection."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.conn.executed.append((query, params))
+        if self.conn.fail_on and query.startswith(self.conn.fail_on):
+            raise RuntimeError("statement failed")
+
+    def fetchone(self):
+        return {"id": 1}
+
+    def fetchall(self):
+        return [{"id": 1}]
+
+
+class FakeConnection:
+    """Connection that records executed statements, commits and rollbacks."""
+
+    def __init__(self):
+        self.executed = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.fail_on = None
+
+    def cursor(self, cursor_factory=None):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def statements(self):
+        return [query for query, _ in self.executed]
+
+
+class FakePool:
+    """Pool handing out a fixed list of connections in order."""
+
+    def __init__(self, conns):
+        self._pool = list(conns)
+        self._used = {}
+
+    def getconn(self):
+        conn = self._pool.pop(0)
+        self._used[id(conn)] = conn
+        return conn
+
+    def putconn(self, conn):
+        del self._used[id(conn)]
+        self._pool.append(conn)
+
+
+def make_db(*conns, min_connections=1):
+    """Build a DatabaseConnection backed by the given fake connections."""
+    with patch.object(DatabaseConnection, "_initialize_pool"):
+        db = DatabaseConnection("postgresql://test", min_connections=min_connections)
+    db.pool = FakePool(conns)
+    return db
+
+
+def test_prepare_runs_once_per_connection():
+    """PREPARE is sent on the first call only; later calls just EXECUTE."""
+    conn = FakeConnection()
+    db = make_db(conn)
+
+    db.execute_prepared("q_one", "SELECT $1", (1,))
+    db.execute_prepared("q_one", "SELECT $1", (2,))
+
+    assert conn.statements() == [
+        "PREPARE q_one AS SELECT $1",
+        "EXECUTE q_one (%s)",
+        "EXECUTE q_one (%s)",
+    ]
+
+
+def test_each_connection_prepares_separately():
+    """A statement prepared on one connection is prepared again on another."""
+    first, second = FakeConnection(), FakeConnection()
+    db = make_db(first, second)
+
+    # The pool hands out the idle connections in turn
+    db.execute_prepared("q_one", "SELECT 1")
+    db.execute_prepared("q_one", "SELECT 1")
+
+    assert first.statements() == ["PREPARE q_one AS SELECT 1", "EXECUTE q_one"]
+    assert second.statements() == ["PREPARE q_one AS SELECT 1", "EXECUTE q_one"]
+
+
+def test_execute_renders_one_placeholder_per_param():
+    """Parameters are passed to EXECUTE as driver placeholders, not inlined."""
+    conn = FakeConnection()
+    db = make_db(conn)
+
+    result = db.execute_prepared("q_two", "SELECT $1, $2, $3", ("a", 2, None), fetch_one=True)
+
+    assert result == {"id": 1}
+    assert conn.executed[-1] == ("EXECUTE q_two (%s, %s, %s)", ("a", 2, None))
+
+
+def test_error_deallocates_and_prepares_again():
+    """After a failed EXECUTE the connection's statements are dropped and re-prepared."""
+    conn = FakeConnection()
+    db = make_db(conn)
+    db.execute_prepared("q_one", "SELECT 1")
+
+    conn.fail_on = "EXECUTE"
+    with pytest.raises(RuntimeError):
+        db.execute_prepared("q_one", "SELECT 1")
+
+    assert conn.rollbacks == 1
+    assert conn.statements()[-1] == "DEALLOCATE ALL"
+
+    conn.fail_on = None
+    db.execute_prepared("q_one", "SELECT 1")
+
+    assert conn.statements()[-2:] == ["PREPARE q_one AS SELECT 1", "EXECUTE q_one"]
+
+
+def test_prepare_statements_warms_connections():
+    """prepare_statements() prepares on min_connections connections and skips them later."""
+    first, second = FakeConnection(), FakeConnection()
+    db = make_db(first, second, min_connections=2)
+
+    count = db.prepare_statements([("q_one", "SELECT 1"), ("q_two", "SELECT 2")])
+
+    assert count == 4
+    assert first.statements() == ["PREPARE q_one AS SELECT 1", "PREPARE q_two AS SELECT 2"]
+    assert db.prepare_statements([("q_one", "SELECT 1")]) == 0
+
+    db.execute_prepared("q_two", "SELECT 2")
+    assert first.statements()[-1] == "EXECUTE q_two"
+
+
+def test_prepare_statements_skips_failures():
+    """A statement that fails to prepare is rolled back and left for lazy preparation."""
+    conn = FakeConnection()
+    conn.fail_on = "PREPARE q_bad"
+    db = make_db(conn)
+
+    count = db.prepare_statements([("q_bad", "SELECT x"), ("q_ok", "SELECT 1")])
+
+    assert count == 1
+    assert conn.rollbacks == 1
+    assert db._prepared[conn] == {"q_ok"}
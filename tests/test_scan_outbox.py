@@ -0,0 +1,150 @@
+"""
+Tests for the scan outbox dispatcher.
+"""
+
+import asyncio
+import sys
+import types
+from unittest.mock import AsyncMock, patch
+
+import orjson
+import pytest
+
+from src.services.scan_outbox import ScanOutboxDispatcher
+
+
+class FakeTransaction:
+    """Transaction that records commit or rollback on its connection."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        self.conn.events.append("begin")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.conn.events.append("rollback" if exc_type else "commit")
+        return False
+
+
+class FakeConnection:
+    """Connection returning queued outbox rows and recording statements."""
+
+    def __init__(self, rows, events):
+        self.rows = rows
+        self.events = events
+
+    def transaction(self):
+        return FakeTransaction(self)
+
+    async def fetch(self, query, limit):
+        self.events.append("claim")
+        return self.rows[:limit]
+
+    async def execute(self, query, ids):
+        self.events.append(("delete", ids))
+
+
+class FakePool:
+    """Pool handing out a single fake connection."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def acquire(self):
+        pool = self
+
+        class _Acquire:
+            async def __aenter__(self):
+                return pool.conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Acquire()
+
+
+class FakeGroup:
+    """Celery group stand-in whose apply_async records the publish."""
+
+    def __init__(self, signatures, events, error=None):
+        self.signatures = list(signatures)
+        self.events = events
+        self.error = error
+
+    def apply_async(self):
+        self.events.append(("publish", len(self.signatures)))
+        if self.error:
+            raise self.error
+
+
+def make_dispatcher(rows, error=None, batch_size=100):
+    """Build a dispatcher over fake rows, with Celery publishing patched out."""
+    events = []
+    conn = FakeConnection(rows, events)
+    dispatcher = ScanOutboxDispatcher(FakePool(conn), batch_size=batch_size)
+
+    # scan_tasks pulls in the worker app; only the task signature is needed here
+    scan_tasks = types.ModuleType("src.services.scan_tasks")
+    scan_tasks.execute_scan_async = types.SimpleNamespace(s=lambda **kwargs: kwargs)
+    patches = [
+        patch.dict(sys.modules, {"src.services.scan_tasks": scan_tasks}),
+        patch("celery.group", lambda sigs: FakeGroup(sigs, events, error)),
+    ]
+    return dispatcher, events, patches
+
+
+def outbox_rows(count):
+    """Outbox rows with ids 1..count and JSON payloads."""
+    return [
+        {"outbox_id": i, "payload": orjson.dumps({"scan_id": f"scan-{i}"})}
+        for i in range(1, count + 1)
+    ]
+
+
+def run_dispatch(dispatcher, patches):
+    """Run one dispatch round with the Celery patches applied."""
+    with patches[0], patches[1]:
+        return asyncio.run(dispatcher.dispatch_once())
+
+
+def test_claim_publish_delete_in_one_transaction():
+    """Claimed rows are published and deleted before the transaction commits."""
+    dispatcher, events, patches = make_dispatcher(outbox_rows(3))
+
+    assert run_dispatch(dispatcher, patches) == 3
+    assert events == ["begin", "claim", ("publish", 3), ("delete", [1, 2, 3]), "commit"]
+
+
+def test_publish_failure_rolls_back():
+    """If the broker publish fails, nothing is deleted and the claim rolls back."""
+    dispatcher, events, patches = make_dispatcher(outbox_rows(2), error=ConnectionError("broker down"))
+
+    with pytest.raises(ConnectionError):
+        run_dispatch(dispatcher, patches)
+
+    assert events == ["begin", "claim", ("publish", 2), "rollback"]
+
+
+def test_empty_outbox_publishes_nothing():
+    """An empty claim returns 0 without publishing."""
+    dispatcher, events, patches = make_dispatcher([])
+
+    assert run_dispatch(dispatcher, patches) == 0
+    assert events == ["begin", "claim", "commit"]
+
+
+def test_drain_loop_stops_on_short_batch():
+    """The loop keeps dispatching while batches are full and stops at a short one."""
+    dispatcher = ScanOutboxDispatcher(FakePool(None), poll_interval=60, batch_size=2)
+    dispatcher.dispatch_once = AsyncMock(side_effect=[2, 2, 1])
+
+    async def scenario():
+        dispatcher.start()
+        await asyncio.sleep(0.05)
+        await dispatcher.stop()
+
+    asyncio.run(scenario())
+
+    assert dispatcher.dispatch_once.await_count == 3
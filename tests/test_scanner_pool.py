@@ -0,0 +1,47 @@
+"""
+Tests for the scanner pool.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.services import scanner_pool
+from src.services.scanner_pool import ScannerPool
+
+
+class FailingScanner:
+    """Scanner whose browser launch fails after Playwright has started."""
+
+    instances = []
+
+    def __init__(self, max_concurrent=5, timeout=30000):
+        self.started = False
+        self.stopped = False
+        FailingScanner.instances.append(self)
+
+    async def start(self):
+        self.started = True
+        raise RuntimeError("browser launch failed")
+
+    async def stop(self):
+        self.stopped = True
+
+    def is_running(self):
+        return False
+
+
+def test_acquire_stops_scanner_when_start_fails():
+    """A scanner whose start() raises is stopped and not counted as in use."""
+    FailingScanner.instances = []
+    pool = ScannerPool(max_idle=2)
+
+    with patch.object(scanner_pool, "ParallelCookieScanner", FailingScanner):
+        with pytest.raises(RuntimeError):
+            asyncio.run(pool.acquire())
+
+    assert len(FailingScanner.instances) == 1
+    assert FailingScanner.instances[0].stopped
+    assert pool.in_use == 0
+    assert pool.created == 0